@@ -16,7 +16,7 @@ Email: timurkady@yandex.com
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import Any, Hashable, Iterable, Mapping
 
 from tortoise import Tortoise, connections
 from tortoise import fields
@@ -350,6 +350,62 @@ class Adapter:
         """
         return await qs.count()
 
+    async def batch_count(
+        self, querysets: Mapping[Hashable, QuerySet]
+    ) -> dict[Hashable, int]:
+        """Count several querysets using one round trip per connection.
+
+        Plain count queries sharing a connection are combined into a single
+        ``SELECT (subquery) AS c0, (subquery) AS c1, ...`` statement.
+        Queries with limits, offsets or grouping keep their regular
+        :meth:`count` path because their totals need post-processing.
+
+        Args:
+            querysets: Mapping of caller-chosen keys to querysets.
+
+        Returns:
+            dict[Hashable, int]: Record counts keyed like ``querysets``.
+
+        This coroutine must be awaited.
+        """
+        counts: dict[Hashable, int] = {}
+        batches: dict[int, tuple[Any, list[tuple[Hashable, Any]]]] = {}
+        for key, qs in querysets.items():
+            count_query = qs.count()
+            count_query._make_query()
+            if count_query.limit or count_query.offset or count_query.query._groupbys:
+                counts[key] = await count_query
+                continue
+            db = count_query._choose_db()
+            batches.setdefault(id(db), (db, []))[1].append((key, count_query))
+        for db, entries in batches.values():
+            if len(entries) == 1:
+                key, count_query = entries[0]
+                counts[key] = await count_query
+                continue
+            sql = self._combined_count_sql(
+                db.query_class, [count_query.query for _key, count_query in entries]
+            )
+            rows = await db.execute_query_dict(sql)
+            row = rows[0] if rows else {}
+            for index, (key, _count_query) in enumerate(entries):
+                counts[key] = int(row.get(f"c{index}") or 0)
+        return counts
+
+    @staticmethod
+    def _combined_count_sql(query_class: Any, subqueries: list[Any]) -> str:
+        """Return one ``SELECT`` wrapping ``subqueries`` as ``c0``, ``c1``, ...
+
+        The outer statement is built with the connection's ``query_class``
+        because pypika pushes the outer builder's quote character into every
+        subquery when rendering; the generic builder would turn MySQL
+        identifiers into string literals.
+        """
+        query = query_class.select(
+            *(subquery.as_(f"c{index}") for index, subquery in enumerate(subqueries))
+        )
+        return str(query)
+
     async def save(
         self, obj: Model, update_fields: Iterable[str] | None = None
     ) -> Model:
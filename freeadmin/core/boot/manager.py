@@ -139,6 +139,9 @@ class BootManager:
         session_cookie = system_config.get_cached(
             SettingsKey.SESSION_COOKIE, "session"
         )
+        # Starlette's stock middleware is kept on purpose: admin sessions hold
+        # only the user id and CSRF token, so the stdlib ``json`` codec is not
+        # a measurable cost and swapping it would mean forking the middleware.
         app.add_middleware(
             SessionMiddleware,
             secret_key=self._settings.session_secret,
@@ -13,9 +13,11 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from inspect import ismethod
 from pathlib import Path
 from threading import RLock
 from typing import Callable, Mapping
+from weakref import WeakMethod
 
 
 @dataclass
@@ -41,6 +43,7 @@ class FreeAdminSettings:
     static_route_name: str = "admin-static"
     export_cache_path: str | None = None
     export_cache_ttl: int = 300
+    template_bytecode_cache_dir: str | None = None
 
     def __post_init__(self) -> None:
         """Finalize defaults by falling back to the secret key where required."""
@@ -59,6 +62,8 @@ class FreeAdminSettings:
             self.event_cache_path = str(self.event_cache_path)
         if isinstance(self.export_cache_path, Path):
             self.export_cache_path = str(self.export_cache_path)
+        if isinstance(self.template_bytecode_cache_dir, Path):
+            self.template_bytecode_cache_dir = str(self.template_bytecode_cache_dir)
         explicit_path = (
             self.event_cache_path not in (None, "", ":memory:")
             and self.event_cache_path.strip() != ""
@@ -117,6 +122,7 @@ class FreeAdminSettings:
         export_cache_ttl = cls._to_int(
             data.get("EXPORT_CACHE_TTL"), default=300
         )
+        bytecode_cache_dir = data.get("TEMPLATE_BYTECODE_CACHE_DIR") or None
         return cls(
             secret_key=secret_key,
             session_secret=session_secret,
@@ -137,6 +143,7 @@ class FreeAdminSettings:
             static_route_name=static_route,
             export_cache_path=export_cache_path,
             export_cache_ttl=export_cache_ttl,
+            template_bytecode_cache_dir=bytecode_cache_dir,
         )
 
     @staticmethod
@@ -190,21 +197,30 @@ class FreeAdminSettings:
         return normalized
 
 
+_SettingsObserver = Callable[[FreeAdminSettings], None]
+_ObserverRef = Callable[[], _SettingsObserver | None]
+
+
 class SettingsManager:
-    """Central storage for the active ``FreeAdminSettings`` instance."""
+    """Central storage for the active ``FreeAdminSettings`` instance.
+
+    Bound-method observers are held through :class:`weakref.WeakMethod`, so
+    registering one does not keep its owner alive; dead entries are pruned
+    whenever the observer list is walked.
+    """
 
     def __init__(self, initial: FreeAdminSettings | None = None) -> None:
         """Prepare storage with an optional preconfigured ``initial`` settings."""
 
         self._lock = RLock()
         self._settings = initial
-        self._callbacks: list[Callable[[FreeAdminSettings], None]] = []
+        self._callbacks: list[_ObserverRef] = []
 
     def configure(self, settings: FreeAdminSettings) -> None:
         """Install a new settings instance and notify observers."""
         with self._lock:
             self._settings = settings
-            for callback in list(self._callbacks):
+            for callback in self._live_callbacks():
                 callback(settings)
 
     def current(self) -> FreeAdminSettings:
@@ -217,13 +233,32 @@ class SettingsManager:
     def register(self, callback: Callable[[FreeAdminSettings], None]) -> None:
         """Register a callback invoked whenever settings change."""
         with self._lock:
-            self._callbacks.append(callback)
+            self._live_callbacks()
+            if ismethod(callback):
+                self._callbacks.append(WeakMethod(callback))
+            else:
+                self._callbacks.append(lambda: callback)
 
     def unregister(self, callback: Callable[[FreeAdminSettings], None]) -> None:
         """Remove a previously registered settings change callback if present."""
         with self._lock:
-            if callback in self._callbacks:
-                self._callbacks.remove(callback)
+            for ref in self._callbacks:
+                if ref() == callback:
+                    self._callbacks.remove(ref)
+                    break
+
+    def _live_callbacks(self) -> list[_SettingsObserver]:
+        """Return callbacks whose owners are alive, dropping the dead ones."""
+
+        live: list[_SettingsObserver] = []
+        kept: list[_ObserverRef] = []
+        for ref in self._callbacks:
+            callback = ref()
+            if callback is not None:
+                live.append(callback)
+                kept.append(ref)
+        self._callbacks = kept
+        return live
 
 
 _settings_manager = SettingsManager()
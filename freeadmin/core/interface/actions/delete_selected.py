@@ -15,7 +15,6 @@ from typing import Any, Dict, List
 
 from . import ActionResult, ActionSpec, BaseAction
 from ..services.permissions import PermAction
-from freeadmin.core.boot import admin as boot_admin
 
 
 class DeleteSelectedAction(BaseAction):
@@ -34,6 +33,7 @@ class DeleteSelectedAction(BaseAction):
     async def run(self, qs: List[Any], params: Dict[str, Any], user: Any) -> ActionResult:
         if params.get("confirm") is not True:
             return ActionResult(ok=False, errors=["Operation not confirmed."])
+        from freeadmin.core.boot import admin as boot_admin
 
         affected = 0
         skipped = 0
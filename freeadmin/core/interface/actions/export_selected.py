@@ -33,8 +33,9 @@ class ExportSelectedAction(BaseAction):
     )
 
     async def run(self, qs: List[Any], params: Dict[str, Any], user: Any) -> ActionResult:
-        allowed = list(self.admin.get_export_fields()) if self.admin else []
-        fields = [f for f in params.get("fields", allowed) if f in allowed]
+        allowed = self.admin.get_export_fields() if self.admin else ()
+        allowed_set = frozenset(allowed)
+        fields = [f for f in params.get("fields", allowed) if f in allowed_set]
         fmt = params.get("fmt", "json")
         if not fields:
             return ActionResult(ok=False, errors=["No fields specified."])
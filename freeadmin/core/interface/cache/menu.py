@@ -30,17 +30,29 @@ class MainMenuCache(SQLiteKeyValueCache):
         *,
         table_name: str = "main_menu_cache",
         ttl: timedelta | None = None,
+        maxsize: int = 64,
     ) -> None:
-        """Initialize the cache with an optional persistence ``path``."""
+        """Initialize the cache with an optional persistence ``path``.
+
+        At most ``maxsize`` payloads are retained; storing beyond that evicts
+        the entries written longest ago.
+        """
 
         super().__init__(path=path, table_name=table_name)
         self._ttl = ttl or timedelta(minutes=30)
+        self._maxsize = maxsize
+
+    @property
+    def ttl(self) -> timedelta:
+        """Return how long stored payloads remain valid."""
+
+        return self._ttl
 
     def store(
         self,
         version: int,
         locale: str | None,
-        items: List["MenuItem"],
+        items: Iterable["MenuItem"],
         *,
         config_token: str | None = None,
     ) -> None:
@@ -57,7 +69,9 @@ class MainMenuCache(SQLiteKeyValueCache):
         if config_token:
             payload["settings_fingerprint"] = config_token
         expires_at = created_at + self._ttl
-        super().set(key, json.dumps(payload).encode("utf-8"), expires_at)
+        with self._lock:
+            super().set(key, json.dumps(payload).encode("utf-8"), expires_at)
+            self._evict_overflow()
 
     def load(
         self,
@@ -89,6 +103,19 @@ class MainMenuCache(SQLiteKeyValueCache):
             self._connection.execute(f"DELETE FROM {self._table}")
             self._connection.commit()
 
+    def _evict_overflow(self) -> None:
+        assert self._connection is not None
+        self._connection.execute(
+            f"""
+            DELETE FROM {self._table} WHERE key NOT IN (
+                SELECT key FROM {self._table}
+                ORDER BY expires_at DESC, rowid DESC LIMIT ?
+            )
+            """.strip(),
+            (self._maxsize,),
+        )
+        self._connection.commit()
+
     def _compose_key(
         self,
         version: int,
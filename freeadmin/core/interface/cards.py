@@ -14,7 +14,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any, Dict, Iterator, List, Set
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Set, Tuple
 
 from freeadmin.core.configuration.conf import FreeAdminSettings, current_settings
 
@@ -48,12 +48,14 @@ class CardManager:
             getattr(self._event_cache, "path", cache_path) if event_cache else cache_path
         )
         self._last_state: Dict[str, Any] = {}
+        self._last_encoded: Dict[str, Tuple[str, str]] = {}
         self._publishers: List[PublisherService] = []
         self._publisher_tasks: Dict[PublisherService, asyncio.Task[None]] = {}
         self._pending_events: Set[asyncio.Task[Any]] = set()
         self._publishers_started = False
         self.logger = logging.getLogger(__name__)
         self._card_cache = card_cache
+        self._cards_snapshot: Tuple[int, Tuple[CardEntry, ...]] | None = None
         self._load_persisted_states()
 
     def register_card(
@@ -98,6 +100,24 @@ class CardManager:
         self._restore_state_from_cache(entry)
         self._invalidate_card_cache()
 
+    def register_cards(self, cards: Iterable[Mapping[str, Any]]) -> None:
+        """Register several cards and invalidate the card cache once.
+
+        Each mapping in ``cards`` holds the keyword arguments accepted by
+        :meth:`register_card`. Registration stops at the first invalid card;
+        cards registered before it are kept.
+        """
+
+        registered = False
+        try:
+            for spec in cards:
+                self.registry.register_card(**spec)
+                registered = True
+                self._restore_state_from_cache(self.registry.get_card(spec["key"]))
+        finally:
+            if registered:
+                self._invalidate_card_cache()
+
     def get_card(self, key: str) -> CardEntry:
         """Return the registered card entry associated with ``key``."""
 
@@ -112,9 +132,18 @@ class CardManager:
         return entry
 
     def iter_cards(self) -> Iterator[CardEntry]:
-        """Yield card entries preserved in the registry."""
+        """Iterate over a tuple snapshot of the cards preserved in the registry.
 
-        yield from self.registry.iter_cards()
+        The snapshot is rebuilt whenever the registry card version changes,
+        including registrations made on the registry directly.
+        """
+
+        version = self.registry.card_version
+        snapshot = self._cards_snapshot
+        if snapshot is None or snapshot[0] != version:
+            snapshot = (version, tuple(self.registry.iter_cards()))
+            self._cards_snapshot = snapshot
+        return iter(snapshot[1])
 
     async def publish_event(self, key: str, payload: Any) -> None:
         """Persist the latest state and publish the payload to the card channel."""
@@ -138,6 +167,7 @@ class CardManager:
             return None
         payload = self._decode_payload(*cached)
         self._last_state[key] = payload
+        self._last_encoded[key] = (cached[0], cached[1])
         return payload
 
     def configure_card_cache(self, cache: SQLiteCardCache | None) -> None:
@@ -190,36 +220,39 @@ class CardManager:
         """Cancel publisher tasks and invoke their shutdown hooks."""
 
         publishers = list(self._publisher_tasks.keys())
-        tasks = [self._publisher_tasks[publisher] for publisher in publishers]
-        for task in tasks:
-            task.cancel()
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        await self._cancel_tasks(self._publisher_tasks.values())
         for publisher in publishers:
             await self._call_publisher_shutdown(publisher)
         self._publisher_tasks.clear()
-        if self._pending_events:
-            pending = list(self._pending_events)
-            for task in pending:
-                task.cancel()
-            await asyncio.gather(*pending, return_exceptions=True)
-            self._pending_events.clear()
+        await self._cancel_tasks(self._pending_events)
+        self._pending_events.clear()
         self._publishers_started = False
 
     def receive_from_publisher(
         self, publisher: PublisherService, payload: Dict[str, Any]
-    ) -> asyncio.Task[Any]:
-        """Accept payload from publisher, update cache and propagate events."""
+    ) -> asyncio.Task[Any] | None:
+        """Accept payload from publisher, update cache and propagate events.
+
+        The state is persisted exactly once; a delivery task is only scheduled
+        when the card streams over a channel.
+        """
 
-        self._accept_publisher_state(publisher.card_key, payload)
-        task = asyncio.create_task(self.publish_event(publisher.card_key, payload))
+        entry = self.get_card(publisher.card_key)
+        message = self._persist_last_state(entry, payload)
+        if not entry.channel or message is None:
+            return None
+        task = asyncio.create_task(self._event_cache.publish(entry.channel, message))
         self._pending_events.add(task)
         task.add_done_callback(self._pending_events.discard)
         return task
 
-    def _accept_publisher_state(self, key: str, payload: Dict[str, Any]) -> None:
-        entry = self.get_card(key)
-        self._persist_last_state(entry, payload)
+    @staticmethod
+    async def _cancel_tasks(tasks: Iterable[asyncio.Task[Any]]) -> None:
+        pending = list(tasks)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
     async def _call_publisher_shutdown(self, publisher: PublisherService) -> None:
         try:
@@ -274,16 +307,22 @@ class CardManager:
             return
         payload = self._decode_payload(*cached)
         self._last_state[entry.key] = payload
+        self._last_encoded[entry.key] = (cached[0], cached[1])
 
     def _persist_last_state(self, entry: CardEntry, payload: Any) -> str | None:
-        self._last_state[entry.key] = payload
+        key = entry.key
+        self._last_state[key] = payload
         if entry.channel is None:
             return None
-        message, serializer = self._serialize_payload(payload)
-        self._event_cache.store_last_payload(entry.channel, message, serializer)
-        return message
+        encoded = self._serialize_payload(payload)
+        # Repeated identical states (e.g. heartbeats) skip the SQLite write.
+        if self._last_encoded.get(key) != encoded:
+            self._event_cache.store_last_payload(entry.channel, *encoded)
+            self._last_encoded[key] = encoded
+        return encoded[0]
 
     def _invalidate_card_cache(self) -> None:
+        self._cards_snapshot = None
         if self._card_cache is None:
             return
         try:
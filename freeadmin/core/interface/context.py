@@ -11,7 +11,7 @@ Email: timurkady@yandex.com
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from fastapi import Request
 
@@ -23,12 +23,45 @@ if TYPE_CHECKING:  # pragma: no cover
     from .site import AdminSite
 
 
+class _ContextPrefixes(NamedTuple):
+    """Settings-derived values shared by every rendered admin page."""
+
+    orm_prefix: str
+    settings_prefix: str
+    views_prefix: str
+    admin_prefix: str
+    static_segment: str
+
+
 class TemplateContextBuilder:
     """Assemble context dictionaries for admin template rendering."""
 
     def __init__(self, admin_site: "AdminSite") -> None:
         """Store a reference to the admin site used for context building."""
         self._admin_site = admin_site
+        self._cached_prefixes: Tuple[int, Any, _ContextPrefixes] | None = None
+
+    def _resolve_prefixes(self, settings_obj: Any) -> _ContextPrefixes:
+        """Return prefixes for ``settings_obj`` cached per settings version."""
+        version = system_config.version
+        cached = self._cached_prefixes
+        if cached is not None and cached[0] == version and cached[1] is settings_obj:
+            return cached[2]
+        prefixes = _ContextPrefixes(
+            orm_prefix=system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm"),
+            settings_prefix=system_config.get_cached(
+                SettingsKey.SETTINGS_PREFIX, "/settings"
+            ),
+            views_prefix=system_config.get_cached(SettingsKey.VIEWS_PREFIX, "/views"),
+            admin_prefix=system_config.get_cached(
+                SettingsKey.ADMIN_PREFIX, settings_obj.admin_path
+            ).rstrip("/"),
+            static_segment=system_config.get_cached(
+                SettingsKey.STATIC_URL_SEGMENT, settings_obj.static_url_segment
+            ),
+        )
+        self._cached_prefixes = (version, settings_obj, prefixes)
+        return prefixes
 
     def build(
         self,
@@ -39,9 +72,14 @@ class TemplateContextBuilder:
         app_label: Optional[str] = None,
         model_name: Optional[str] = None,
         is_settings: Optional[bool] = None,
-        extra: Optional[Dict[str, Any]] = None,
+        extra: Optional[Mapping[str, Any]] = None,
+        menu: Optional[Sequence[Any]] = None,
     ) -> Dict[str, Any]:
-        """Return a populated context dictionary for admin templates."""
+        """Return a populated context dictionary for admin templates.
+
+        ``menu`` is stored after ``extra`` so pages receive the main menu in
+        the same dictionary instead of patching it in afterwards.
+        """
         admin_site = self._admin_site
         settings_obj = getattr(admin_site, "_settings", current_settings())
         resolution = admin_site.pages.resolve_request(request)
@@ -52,24 +90,8 @@ class TemplateContextBuilder:
         if model_name is None:
             model_name = resolution.model_slug
 
-        orm_prefix = system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm")
-        settings_prefix = system_config.get_cached(SettingsKey.SETTINGS_PREFIX, "/settings")
-        views_prefix = system_config.get_cached(SettingsKey.VIEWS_PREFIX, "/views")
-        admin_prefix = system_config.get_cached(
-            SettingsKey.ADMIN_PREFIX, settings_obj.admin_path
-        ).rstrip("/")
-
-        trimmed_path = request.url.path
-        if admin_prefix and trimmed_path.startswith(admin_prefix):
-            trimmed_path = trimmed_path[len(admin_prefix) :]
-            if not trimmed_path.startswith("/"):
-                trimmed_path = f"/{trimmed_path}"
-
-        normalized_path = resolution.normalized_path
-        normalized_views = views_prefix.rstrip("/") or "/"
-        normalized_orm = orm_prefix.rstrip("/") or "/"
-        normalized_settings = settings_prefix.rstrip("/") or "/"
-        is_views_section = resolution.section_mode == "views"
+        prefixes = self._resolve_prefixes(settings_obj)
+        admin_prefix = prefixes.admin_prefix
 
         apps = SidebarBuilder.build(
             admin_site=admin_site,
@@ -88,34 +110,32 @@ class TemplateContextBuilder:
             "site_title": admin_site.title,
             "brand_icon": admin_site.brand_icon,
             "prefix": admin_prefix,
-            "ORM_PREFIX": orm_prefix,
-            "SETTINGS_PREFIX": settings_prefix,
-            "VIEWS_PREFIX": views_prefix,
+            "ORM_PREFIX": prefixes.orm_prefix,
+            "SETTINGS_PREFIX": prefixes.settings_prefix,
+            "VIEWS_PREFIX": prefixes.views_prefix,
             "apps": apps,
             "current_app": app_label,
             "current_model": model_name,
             "section_mode": section_mode,
-            "assets": {"css": [], "js": []},
         }
         if page_title is not None:
             ctx["page_title"] = page_title
         if extra:
             ctx.update(extra)
+        if menu is not None:
+            ctx["menu"] = menu
 
-        static_segment = system_config.get_cached(
-            SettingsKey.STATIC_URL_SEGMENT, settings_obj.static_url_segment
-        )
         scripts, styles = admin_site._collect_card_assets(
             ctx,
             prefix=admin_prefix,
-            static_segment=static_segment,
+            static_segment=prefixes.static_segment,
         )
         assets_map = ctx.get("assets")
         if isinstance(assets_map, dict):
-            assets_map["js"] = list(scripts)
-            assets_map["css"] = list(styles)
+            assets_map["js"] = scripts
+            assets_map["css"] = styles
         else:
-            ctx["assets"] = {"js": list(scripts), "css": list(styles)}
+            ctx["assets"] = {"js": scripts, "css": styles}
         return ctx
 
 
@@ -14,11 +14,15 @@ from __future__ import annotations
 import importlib
 import logging
 import pkgutil
+import re
+import sys
 from types import ModuleType
-from typing import Iterable, List, Set
+from typing import Dict, Iterable, List, Set
 
 from .app import AppConfig
 
+_ADMIN_MODULE_RE = re.compile(r"\.admin(?:\.|$)")
+
 
 class DiscoveryService:
     """Manage discovery of admin modules, views, and publisher services."""
@@ -26,25 +30,28 @@ class DiscoveryService:
     logger = logging.getLogger(__name__)
 
     def __init__(self) -> None:
-        """Initialize the discovery service without persistent state."""
+        """Initialize the discovery service with an empty import memo."""
 
-        pass
+        self._import_cache: Dict[str, ModuleType | None] = {}
 
     def discover_admin_modules(self, packages: Iterable[str]) -> None:
         """Import ``*.admin`` modules within the provided ``packages``."""
 
+        self._import_cache.clear()
         roots = self._collect_package_roots(packages)
         self._import_admin_modules(roots)
 
     def discover_views(self, packages: Iterable[str]) -> None:
         """Import view modules or packages within the provided ``packages``."""
 
+        self._import_cache.clear()
         roots = self._collect_package_roots(packages)
         self._import_named_modules(roots, "views")
 
     def discover_services(self, packages: Iterable[str]) -> None:
         """Import publisher services within ``packages``."""
 
+        self._import_cache.clear()
         roots = self._collect_package_roots(packages)
         for suffix in ("service", "services"):
             self._import_named_modules(roots, suffix)
@@ -52,6 +59,7 @@ class DiscoveryService:
     def discover_all(self, packages: Iterable[str]) -> List[AppConfig]:
         """Import resources within ``packages`` and return discovered configs."""
 
+        self._import_cache.clear()
         roots = self._collect_package_roots(packages)
         app_configs: List[AppConfig] = []
         discovered_packages: List[str] = []
@@ -100,20 +108,44 @@ class DiscoveryService:
         if module_path is None:
             return names
         prefix = module_name + "."
-        for _, submodule, ispkg in pkgutil.iter_modules(module_path, prefix):
-            if not ispkg:
-                continue
-            package = self._safe_import(submodule)
-            if package is None:
+        nested: List[str] = []
+        for _, submodule, ispkg in pkgutil.walk_packages(
+            module_path, prefix, onerror=self._log_walk_error
+        ):
+            if ispkg and submodule not in seen:
+                nested.append(submodule)
+        for package in nested:
+            imported = sys.modules.get(package)
+            self._import_cache[package] = imported
+            if imported is None:
                 continue
-            names.extend(self._collect_package_names(package, seen))
+            seen.add(package)
+            names.append(package)
         return names
 
+    def _log_walk_error(self, module_name: str) -> None:
+        """Report a failed subpackage import the same way as ``_safe_import``.
+
+        Only import errors are swallowed; anything else raised by a package
+        ``__init__`` propagates just like a direct ``importlib`` call.
+        """
+
+        exc = sys.exc_info()[1]
+        if not isinstance(exc, ImportError):
+            raise
+        if (
+            isinstance(exc, ModuleNotFoundError)
+            and getattr(exc, "name", None) == module_name
+        ):
+            self.logger.debug("Module %s not found during discovery", module_name)
+            return
+        self.logger.exception("Failed to import module %s", module_name)
+
     def _import_admin_modules(self, roots: Iterable[ModuleType]) -> None:
         for root in roots:
             prefix = root.__name__ + "."
             for _, modname, _ in pkgutil.walk_packages(root.__path__, prefix):
-                if modname.endswith(".admin") or ".admin." in modname:
+                if _ADMIN_MODULE_RE.search(modname):
                     self._safe_import(modname)
 
     def _import_named_modules(self, roots: Iterable[ModuleType], name: str) -> None:
@@ -130,6 +162,17 @@ class DiscoveryService:
                 self._safe_import(submodule)
 
     def _safe_import(self, module_name: str) -> ModuleType | None:
+        """Import ``module_name`` once per discovery run and memoize the result."""
+
+        if module_name in self._import_cache:
+            return self._import_cache[module_name]
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = self._import_module(module_name)
+        self._import_cache[module_name] = module
+        return module
+
+    def _import_module(self, module_name: str) -> ModuleType | None:
         try:
             return importlib.import_module(module_name)
         except ModuleNotFoundError as exc:
@@ -11,11 +11,21 @@ Email: timurkady@yandex.com
 """
 
 from __future__ import annotations
-from typing import Any, Type, Literal
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple, Type
 
 from .base import BaseModelAdmin
 
 
+class InlineAttrs(NamedTuple):
+    """Static inline attributes resolved against a model descriptor."""
+
+    app_label: str
+    model_slug: str
+    parent_fk_name: str
+    collapsed: bool
+
+
 class InlineModelAdmin(BaseModelAdmin):
     """Base class for building an inline model."""
 
@@ -25,6 +35,22 @@ class InlineModelAdmin(BaseModelAdmin):
     display: Literal["tabular", "stacked"] = "tabular"
     collapsed: bool = True
 
+    @classmethod
+    def _resolved_attrs(cls, md: Any) -> InlineAttrs:
+        """Return class attributes for ``md`` with descriptor fallbacks."""
+        return cls._resolve_attrs(md.app_label, md.model_name)
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _resolve_attrs(cls, app_label: str, model_name: str) -> InlineAttrs:
+        """Memoize resolution per inline class, app label and model name."""
+        return InlineAttrs(
+            app_label=getattr(cls, "app_label", app_label),
+            model_slug=getattr(cls, "model_slug", model_name.lower()),
+            parent_fk_name=getattr(cls, "parent_fk_name", ""),
+            collapsed=getattr(cls, "collapsed", True),
+        )
+
 
 # The End
 
@@ -11,14 +11,32 @@ Email: timurkady@yandex.com
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple, TYPE_CHECKING
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Tuple, TYPE_CHECKING
 
 from .registry import MenuItem, UserMenuItem
 from .settings import SettingsKey, system_config
 from .cache.menu import MainMenuCache
 
 if TYPE_CHECKING:  # pragma: no cover
-    from .registry import PageRegistry
+    from .registry import PageRegistry, ViewEntry
+
+_MENU_SETTINGS: Tuple[Tuple[str, SettingsKey, str], ...] = (
+    ("default_page_type", SettingsKey.PAGE_TYPE_VIEW, "view"),
+    ("orm_prefix", SettingsKey.ORM_PREFIX, "/orm"),
+    ("settings_prefix", SettingsKey.SETTINGS_PREFIX, "/settings"),
+    ("orm_page_type", SettingsKey.PAGE_TYPE_ORM, "orm"),
+    ("settings_page_type", SettingsKey.PAGE_TYPE_SETTINGS, "settings"),
+)
+_MENU_SETTING_KEYS: Tuple[Tuple[SettingsKey, str], ...] = tuple(
+    (key, default) for _name, key, default in _MENU_SETTINGS
+)
 
 
 class MenuBuilder:
@@ -34,8 +52,14 @@ class MenuBuilder:
 
         self._registry = registry
         self._items: List[MenuItem] = []
-        self._user_items: List[UserMenuItem] = []
+        self._expanded_items: Dict[str, Tuple[MenuItem, ...]] = {}
+        self._user_items: Dict[str, UserMenuItem] = {}
         self._cache = cache or MainMenuCache()
+        self._settings_cache: Tuple[int, dict[str, str], str] | None = None
+        self._memo: OrderedDict[
+            Tuple[int, str, str], Tuple[float, Tuple[MenuItem, ...]]
+        ] = OrderedDict()
+        self._memo_size = 16
 
     def register_item(
         self,
@@ -47,6 +71,7 @@ class MenuBuilder:
         """Register a main navigation menu item."""
 
         self._items.append(MenuItem(title=title, path=path, icon=icon, page_type=page_type))
+        self._expanded_items.clear()
         self._registry.bump_version()
 
     def register_user_item(
@@ -57,82 +82,163 @@ class MenuBuilder:
     ) -> None:
         """Register a user menu entry avoiding duplicates by path."""
 
-        for item in self._user_items:
-            if item.path == path:
-                return
-        self._user_items.append(UserMenuItem(title=title, path=path, icon=icon))
-        self._registry.bump_version()
+        if path in self._user_items:
+            return
+        self._user_items[path] = UserMenuItem(title=title, path=path, icon=icon)
+        self._registry.bump_user_version()
 
     def build_main_menu(
         self,
         registry: "PageRegistry" | None = None,
         *,
         locale: str | None = None,
-    ) -> List[MenuItem]:
-        """Return the assembled main menu using cached payloads when available."""
+    ) -> Tuple[MenuItem, ...]:
+        """Return the assembled main menu using cached payloads when available.
+
+        Menus are memoized in-process per registry version, locale and
+        settings token in front of the shared SQLite cache. The result is a
+        shared immutable snapshot.
+        """
 
         target_registry = registry or self._registry
-        locale_token = self._resolve_locale(locale)
-        settings_bundle = self._resolve_menu_settings()
-        config_token = self._compose_settings_token(settings_bundle)
-        cached = self._cache.load(
-            target_registry.registry_version,
-            locale_token,
-            config_token=config_token,
+        memo_key, settings_bundle = self._resolve_menu_key(target_registry, locale)
+        memo = self._lookup_memo(memo_key)
+        if memo is not None:
+            return memo
+        version, locale_token, config_token = memo_key
+        cached = self._cache.load(version, locale_token, config_token=config_token)
+        if cached is not None:
+            return self._remember(memo_key, tuple(cached[0]))
+        menu = self._compose_main_menu(target_registry, settings_bundle)
+        self._cache.store(version, locale_token, menu, config_token=config_token)
+        return self._remember(memo_key, menu)
+
+    async def build_main_menu_async(
+        self,
+        registry: "PageRegistry" | None = None,
+        *,
+        locale: str | None = None,
+    ) -> Tuple[MenuItem, ...]:
+        """Return the main menu without blocking the event loop on SQLite.
+
+        Memo hits are answered inline; SQLite reads and writes of the shared
+        cache run in a worker thread.
+        """
+
+        target_registry = registry or self._registry
+        memo_key, settings_bundle = self._resolve_menu_key(target_registry, locale)
+        memo = self._lookup_memo(memo_key)
+        if memo is not None:
+            return memo
+        version, locale_token, config_token = memo_key
+        cached = await asyncio.to_thread(
+            self._cache.load, version, locale_token, config_token=config_token
         )
         if cached is not None:
-            items, _created_at = cached
-            return list(items)
-
-        default_page_type = settings_bundle["default_page_type"]
-        menu: List[MenuItem] = [
-            MenuItem(
-                title=item.title,
-                path=item.path,
-                icon=item.icon,
-                page_type=item.page_type or default_page_type,
+            return self._remember(memo_key, tuple(cached[0]))
+        menu = self._compose_main_menu(target_registry, settings_bundle)
+        await asyncio.to_thread(
+            self._cache.store, version, locale_token, menu, config_token=config_token
+        )
+        return self._remember(memo_key, menu)
+
+    def _resolve_menu_key(
+        self, registry: "PageRegistry", locale: str | None
+    ) -> Tuple[Tuple[int, str, str], dict[str, str]]:
+        """Return the memo key and settings bundle for a main menu build."""
+
+        settings_bundle, config_token = self._resolve_settings_snapshot()
+        key = (registry.registry_version, self._resolve_locale(locale), config_token)
+        return key, settings_bundle
+
+    def _lookup_memo(self, key: Tuple[int, str, str]) -> Tuple[MenuItem, ...] | None:
+        """Return the memoized menu for ``key`` unless it has expired."""
+
+        memo = self._memo.get(key)
+        if memo is None or memo[0] <= time.monotonic():
+            return None
+        self._memo.move_to_end(key)
+        return memo[1]
+
+    def _compose_main_menu(
+        self, registry: "PageRegistry", settings_bundle: dict[str, str]
+    ) -> Tuple[MenuItem, ...]:
+        """Assemble main menu items from registrations and ``registry`` entries."""
+
+        return tuple(
+            chain(
+                self._expand_registered_items(settings_bundle["default_page_type"]),
+                self._iter_entry_items(
+                    registry.iter_orm(),
+                    settings_bundle["orm_prefix"],
+                    settings_bundle["orm_page_type"],
+                ),
+                self._iter_entry_items(
+                    registry.iter_settings(),
+                    settings_bundle["settings_prefix"],
+                    settings_bundle["settings_page_type"],
+                ),
             )
-            for item in self._items
-        ]
-        orm_prefix = settings_bundle["orm_prefix"]
-        settings_prefix = settings_bundle["settings_prefix"]
-        orm_page_type = settings_bundle["orm_page_type"]
-        settings_page_type = settings_bundle["settings_page_type"]
-        for entry in target_registry.iter_orm():
-            menu.append(
-                MenuItem(
-                    title=entry.name or entry.model,
-                    path=f"{orm_prefix}/{entry.app}/{entry.model}",
-                    icon=entry.icon,
-                    page_type=orm_page_type,
-                )
+        )
+
+    def _remember(
+        self, key: Tuple[int, str, str], menu: Tuple[MenuItem, ...]
+    ) -> Tuple[MenuItem, ...]:
+        """Memoize ``menu`` under ``key`` until the cache TTL elapses."""
+
+        deadline = time.monotonic() + self._cache.ttl.total_seconds()
+        self._memo[key] = (deadline, menu)
+        self._memo.move_to_end(key)
+        while len(self._memo) > self._memo_size:
+            self._memo.popitem(last=False)
+        return menu
+
+    def _expand_registered_items(
+        self, default_page_type: str
+    ) -> Tuple[MenuItem, ...]:
+        """Return registered items with ``default_page_type`` filled in.
+
+        The expansion is kept per default page type until the next
+        registration, so cache misses reuse the same item instances.
+        """
+
+        expanded = self._expanded_items.get(default_page_type)
+        if expanded is None:
+            expanded = tuple(
+                item if item.page_type else replace(item, page_type=default_page_type)
+                for item in self._items
             )
-        for entry in target_registry.iter_settings():
-            menu.append(
-                MenuItem(
-                    title=entry.name or entry.model,
-                    path=f"{settings_prefix}/{entry.app}/{entry.model}",
-                    icon=entry.icon,
-                    page_type=settings_page_type,
-                )
+            self._expanded_items[default_page_type] = expanded
+        return expanded
+
+    @staticmethod
+    def _iter_entry_items(
+        entries: Iterable["ViewEntry"], prefix: str, page_type: str
+    ) -> Iterator[MenuItem]:
+        """Yield menu items for registry ``entries`` mounted under ``prefix``."""
+
+        item_cls = MenuItem
+        join = "/".join
+        return (
+            item_cls(
+                title=entry.name or entry.model,
+                path=join((prefix, entry.app, entry.model)),
+                icon=entry.icon,
+                page_type=page_type,
             )
-        self._cache.store(
-            target_registry.registry_version,
-            locale_token,
-            menu,
-            config_token=config_token,
+            for entry in entries
         )
-        return menu
 
     def build_user_menu(self, registry: "PageRegistry") -> List[UserMenuItem]:
         """Return registered user menu entries."""
 
         _ = registry
-        return list(self._user_items)
+        return list(self._user_items.values())
 
     def invalidate_main_menu(self) -> None:
         """Remove all cached main menu payloads."""
 
+        self._memo.clear()
         self._cache.clear()
 
     def _resolve_locale(self, locale: str | None) -> str:
@@ -143,54 +249,97 @@ class MenuBuilder:
             return candidate
         return str(system_config.get_cached(SettingsKey.DEFAULT_LOCALE, "en"))
 
+    def _resolve_settings_snapshot(self) -> Tuple[dict[str, str], str]:
+        """Return the menu settings bundle and token for the current config."""
+
+        version = system_config.version
+        cached = self._settings_cache
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        settings_bundle = self._resolve_menu_settings()
+        config_token = self._compose_settings_token(settings_bundle)
+        self._settings_cache = (version, settings_bundle, config_token)
+        return settings_bundle, config_token
+
     def _resolve_menu_settings(self) -> dict[str, str]:
         """Return the configuration values that influence the main menu."""
 
+        values = system_config.get_cached_many(_MENU_SETTING_KEYS)
         return {
-            "default_page_type": str(
-                system_config.get_cached(SettingsKey.PAGE_TYPE_VIEW, "view")
-            ),
-            "orm_prefix": str(system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm")),
-            "settings_prefix": str(
-                system_config.get_cached(SettingsKey.SETTINGS_PREFIX, "/settings")
-            ),
-            "orm_page_type": str(
-                system_config.get_cached(SettingsKey.PAGE_TYPE_ORM, "orm")
-            ),
-            "settings_page_type": str(
-                system_config.get_cached(SettingsKey.PAGE_TYPE_SETTINGS, "settings")
-            ),
+            name: str(value)
+            for (name, _key, _default), value in zip(_MENU_SETTINGS, values)
         }
 
     @staticmethod
     def _compose_settings_token(settings_bundle: dict[str, str]) -> str:
-        """Return a stable fingerprint for ``settings_bundle`` contents."""
+        """Return a stable fingerprint for ``settings_bundle`` contents.
 
-        return "|".join(
-            f"{key}={settings_bundle[key]}" for key in sorted(settings_bundle)
-        )
+        Values are joined in the fixed :data:`_MENU_SETTINGS` order, so no
+        sorting or per-key formatting is needed. A string (rather than
+        ``hash()``) keeps the key stable across processes sharing the cache.
+        """
 
+        return "|".join(settings_bundle[name] for name, _key, _default in _MENU_SETTINGS)
 
-class PublicMenuCache:
-    """Maintain cached snapshots of the public menu."""
 
-    def __init__(self) -> None:
-        """Initialise the in-memory storage for cached payloads."""
+@lru_cache(maxsize=1024)
+def _normalize_menu_path(path: str) -> str:
+    """Return an interned, normalised absolute path for ``path``."""
 
-        self._payloads: Dict[Tuple[int, str], List[MenuItem]] = {}
+    core = (path or "/").strip().rstrip("/")
+    if not core:
+        return "/"
+    if core[0] != "/":
+        core = f"/{core}"
+    return sys.intern(core)
 
-    def load(self, version: int, prefix: str) -> List[MenuItem] | None:
-        """Return cached menu items for the ``version`` and ``prefix`` pair."""
 
-        cached = self._payloads.get((version, prefix))
-        if cached is None:
-            return None
-        return list(cached)
+@lru_cache(maxsize=1024)
+def _normalize_menu_prefix(prefix: str | None) -> str:
+    """Return an interned canonical representation for ``prefix``."""
+
+    if prefix is None:
+        return ""
+    core = prefix.strip().rstrip("/")
+    if not core:
+        return ""
+    if core[0] != "/":
+        core = f"/{core}"
+    return sys.intern(core)
 
-    def store(self, version: int, prefix: str, items: List[MenuItem]) -> None:
-        """Persist ``items`` for the cache key identified by ``version``."""
 
-        self._payloads[(version, prefix)] = list(items)
+class PublicMenuCache:
+    """Maintain cached snapshots of the public menu."""
+
+    def __init__(self, *, maxsize: int = 64) -> None:
+        """Initialise bounded in-memory storage for cached payloads."""
+
+        self._payloads: OrderedDict[Tuple[int, str], Tuple[MenuItem, ...]] = (
+            OrderedDict()
+        )
+        self._maxsize = maxsize
+
+    def load(self, version: int, prefix: str) -> Tuple[MenuItem, ...] | None:
+        """Return the cached immutable snapshot for ``version`` and ``prefix``."""
+
+        key = (version, prefix)
+        cached = self._payloads.get(key)
+        if cached is not None:
+            self._payloads.move_to_end(key)
+        return cached
+
+    def store(
+        self, version: int, prefix: str, items: Iterable[MenuItem]
+    ) -> Tuple[MenuItem, ...]:
+        """Freeze ``items`` for the cache key and return the stored snapshot."""
+
+        key = (version, prefix)
+        snapshot = tuple(items)
+        self._payloads[key] = snapshot
+        self._payloads.move_to_end(key)
+        while len(self._payloads) > self._maxsize:
+            self._payloads.popitem(last=False)
+        return snapshot
 
     def clear(self) -> None:
         """Remove all cached menu payloads."""
@@ -209,9 +358,9 @@ class PublicMenuBuilder:
         """Initialise storage for registered items and optional cache."""
 
         self._items: Dict[str, MenuItem] = {}
-        self._order: List[str] = []
         self._version: int = 0
         self._cache = cache or PublicMenuCache()
+        self._resolved: Dict[str, Dict[str, MenuItem]] = {}
 
     def register_item(
         self,
@@ -227,43 +376,48 @@ class PublicMenuBuilder:
         existing = self._items.get(normalized_path)
         if existing == item:
             return
-        if normalized_path not in self._items:
-            self._order.append(normalized_path)
+        # Updating an existing path keeps its original menu position.
         self._items[normalized_path] = item
+        for bucket in self._resolved.values():
+            bucket.pop(normalized_path, None)
+        # Older snapshots become unreachable and age out of the bounded cache.
         self._version += 1
-        self._cache.clear()
 
-    def build_menu(self, *, prefix: str | None = None) -> List[MenuItem]:
-        """Return public menu items adjusted for the configured ``prefix``."""
+    def build_menu(self, *, prefix: str | None = None) -> Tuple[MenuItem, ...]:
+        """Return public menu items adjusted for the configured ``prefix``.
+
+        The result is a shared immutable snapshot; callers must not mutate it.
+        """
 
         normalized_prefix = self._normalize_prefix(prefix)
         cached = self._cache.load(self._version, normalized_prefix)
         if cached is not None:
-            return list(cached)
+            return cached
+        if not normalized_prefix:
+            # Registered paths are already normalised; reuse the items as-is.
+            return self._cache.store(self._version, "", self._items.values())
 
+        resolved = self._resolved.setdefault(normalized_prefix, {})
         items: List[MenuItem] = []
-        for key in self._order:
-            item = self._items.get(key)
-            if item is None:
-                continue
-            resolved_path = self._compose_path(normalized_prefix, item.path)
-            items.append(
-                MenuItem(
+        for key, item in self._items.items():
+            prefixed = resolved.get(key)
+            if prefixed is None:
+                prefixed = MenuItem(
                     title=item.title,
-                    path=resolved_path,
+                    path=self._compose_path(normalized_prefix, item.path),
                     icon=item.icon,
                     page_type=item.page_type,
                 )
-            )
+                resolved[key] = prefixed
+            items.append(prefixed)
 
-        self._cache.store(self._version, normalized_prefix, items)
-        return list(items)
+        return self._cache.store(self._version, normalized_prefix, items)
 
     def clear(self) -> None:
         """Remove registered items and cached payloads."""
 
         self._items.clear()
-        self._order.clear()
+        self._resolved.clear()
         self._version += 1
         self._cache.clear()
 
@@ -271,27 +425,13 @@ class PublicMenuBuilder:
     def _normalize_path(path: str) -> str:
         """Return a normalised absolute path for ``path``."""
 
-        candidate = (path or "/").strip()
-        if not candidate:
-            candidate = "/"
-        if not candidate.startswith("/"):
-            candidate = f"/{candidate}"
-        if len(candidate) > 1 and candidate.endswith("/"):
-            candidate = candidate.rstrip("/")
-        return candidate or "/"
+        return _normalize_menu_path(path)
 
     @staticmethod
     def _normalize_prefix(prefix: str | None) -> str:
         """Return a canonical representation for ``prefix``."""
 
-        if prefix is None:
-            return ""
-        candidate = prefix.strip()
-        if not candidate or candidate == "/":
-            return ""
-        if not candidate.startswith("/"):
-            candidate = f"/{candidate}"
-        return candidate.rstrip("/")
+        return _normalize_menu_prefix(prefix)
 
     @classmethod
     def _compose_path(cls, prefix: str, path: str) -> str:
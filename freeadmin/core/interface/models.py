@@ -11,10 +11,11 @@ Email: timurkady@yandex.com
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Sequence
 
 from .base import BaseModelAdmin
-from .inline import InlineModelAdmin
+from .inline import InlineAttrs, InlineModelAdmin
 
 
 class ModelAdmin(BaseModelAdmin):
@@ -29,14 +30,24 @@ class ModelAdmin(BaseModelAdmin):
     export_filename_template: str = "{app}_{model}_{timestamp}.{fmt}"
     import_strict: bool = True
 
+    _import_lookup_fields: tuple[str, ...] | None = None
+
     def get_inlines(self) -> tuple[type["InlineModelAdmin"], ...]:
         """Return inline admin classes configured for this model."""
         return self.inlines
 
-    def get_import_lookup_fields(self) -> list[str]:
-        """Return unique fields used to lookup objects during import."""
-        md = self.adapter.get_model_descriptor(self.model)
-        return [f.name for f in md.fields if f.unique]
+    def get_import_lookup_fields(self) -> Sequence[str]:
+        """Return unique fields used to lookup objects during import.
+
+        The result is computed once per admin instance and reused for every
+        imported row.
+        """
+        cached = self._import_lookup_fields
+        if cached is None:
+            md = self.adapter.get_model_descriptor(self.model)
+            cached = tuple(f.name for f in md.fields if f.unique)
+            self._import_lookup_fields = cached
+        return cached
 
     async def get_or_create_for_import(
         self, data: dict[str, Any]
@@ -70,34 +81,43 @@ class ModelAdmin(BaseModelAdmin):
     async def get_inlines_spec(
         self, request: Any, user: Any, obj: Any | None = None
     ) -> list[dict[str, Any]]:
-        """Return specification dictionaries for configured inlines."""
-        specs: list[dict[str, Any]] = []
+        """Return specification dictionaries for configured inlines.
+
+        Related-object counts for all inlines are fetched together.
+        """
+        prepared: list[
+            tuple[InlineModelAdmin, InlineAttrs, Any, list[str], Any | None]
+        ] = []
         for inline_cls in self.get_inlines():
             inline = inline_cls(inline_cls.model, self.adapter)
             md = self.adapter.get_model_descriptor(inline.model)
-            setattr(inline, "app_label", getattr(inline, "app_label", md.app_label))
+            attrs = inline_cls._resolved_attrs(md)
+            inline.app_label = attrs.app_label
             columns = list(inline.get_list_columns(md))
-            count = 0
-            if obj is not None and getattr(inline, "parent_fk_name", None):
+            qs = None
+            if obj is not None and attrs.parent_fk_name:
                 pk_attr = self.adapter.get_pk_attr(self.model)
                 pk_val = getattr(obj, pk_attr)
                 qs = self.adapter.filter(
-                    inline.model, **{inline.parent_fk_name: pk_val}
+                    inline.model, **{attrs.parent_fk_name: pk_val}
                 )
-                count = await self.adapter.count(qs)
+            prepared.append((inline, attrs, md, columns, qs))
+
+        counts = await self._count_inlines(
+            [qs for _inline, _attrs, _md, _columns, qs in prepared]
+        )
+
+        specs: list[dict[str, Any]] = []
+        for (inline, attrs, md, columns, _qs), count in zip(prepared, counts):
             specs.append(
                 {
                     "label": inline.get_model_label() or inline.get_verbose_name_plural(),
-                    "app": getattr(inline, "app_label", md.app_label),
-                    "model": getattr(
-                        inline,
-                        "model_slug",
-                        md.model_name.lower(),
-                    ),
-                    "parent_fk": getattr(inline, "parent_fk_name", ""),
+                    "app": attrs.app_label,
+                    "model": attrs.model_slug,
+                    "parent_fk": attrs.parent_fk_name,
                     "can_add": inline.allow(user, "add", obj),
                     "can_delete": inline.can_delete and inline.allow(user, "delete", obj),
-                    "collapsed": getattr(inline, "collapsed", True),
+                    "collapsed": attrs.collapsed,
                     "columns": columns,
                     "columns_meta": inline.columns_meta(md, columns),
                     "count": count,
@@ -105,6 +125,29 @@ class ModelAdmin(BaseModelAdmin):
             )
         return specs
 
+    async def _count_inlines(self, querysets: list[Any | None]) -> list[int]:
+        """Return related-row counts for ``querysets`` in input order.
+
+        Adapters exposing ``batch_count`` answer every inline in a single
+        round trip; others fall back to concurrent per-inline counts.
+        """
+        batch_count = getattr(self.adapter, "batch_count", None)
+        if batch_count is None:
+            return list(
+                await asyncio.gather(*(self._count_inline(qs) for qs in querysets))
+            )
+        pending = {
+            index: qs for index, qs in enumerate(querysets) if qs is not None
+        }
+        counts = await batch_count(pending) if pending else {}
+        return [counts.get(index, 0) for index in range(len(querysets))]
+
+    async def _count_inline(self, qs: Any | None) -> int:
+        """Return the number of related rows for ``qs`` or ``0`` without one."""
+        if qs is None:
+            return 0
+        return await self.adapter.count(qs)
+
     def can_export(self, user: Any) -> bool:
         return self._user_has_perm(user, self.perm_export)
 
@@ -8,8 +8,13 @@ Email: timurkady@yandex.com
 """
 
 from __future__ import annotations
+import inspect
+import sys
+from bisect import insort
 from dataclasses import dataclass, field
+from functools import wraps
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     Any,
     Awaitable,
@@ -18,6 +23,7 @@ from typing import (
     Iterable,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Tuple,
     TYPE_CHECKING,
@@ -35,6 +41,25 @@ if TYPE_CHECKING:  # pragma: no cover - typing helpers only
     from .site import AdminSite
 
 
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+
+def _as_async_handler(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """Return ``func`` as a coroutine function, wrapping sync callables once."""
+
+    if inspect.iscoroutinefunction(func):
+        return func
+
+    @wraps(func)
+    async def handler(**kwargs: Any) -> Any:
+        result = func(**kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    return handler
+
+
 class BaseTemplatePage:
     """Provide reusable registration helpers for admin and public pages.
 
@@ -75,6 +100,7 @@ class BaseTemplatePage:
         self._template_service = template_service or TemplateRenderer.get_service()
         self._admin_handler: Callable[..., Any] | None = None
         self._public_handler: Callable[..., Any] | None = None
+        self._async_context = inspect.iscoroutinefunction(self.get_context)
         self._register_template_directories()
         self._template_service.ensure_site_templates(self._site)
 
@@ -173,16 +199,21 @@ class BaseTemplatePage:
     ) -> Mapping[str, Any]:
         """Resolve context values returned by :meth:`get_context`."""
 
-        result = self.get_context(request=request, user=user)
-        if hasattr(result, "__await__"):
-            result = await result  # type: ignore[assignment]
+        if self._async_context:
+            result = await self.get_context(request=request, user=user)
+        else:
+            result = self.get_context(request=request, user=user)
+            if inspect.isawaitable(result):
+                result = await result  # type: ignore[assignment]
         if result is None:
-            return {}
+            return _EMPTY_CONTEXT
         if not isinstance(result, Mapping):
             raise TypeError(
                 "get_context must return a mapping-compatible object"
             )
-        return dict(result)
+        # Template context builders only read from the mapping, so a
+        # read-only view replaces the per-request copy.
+        return MappingProxyType(result)
 
     def _register_template_directories(self) -> None:
         """Add declared template directories to the shared service."""
@@ -195,11 +226,10 @@ class BaseTemplatePage:
             directories = (directory,)
         else:
             directories = directory
-        for item in directories:
-            self._template_service.add_template_directory(item)
+        self._template_service.add_template_directories(directories)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdminPage:
     """Common fields shared by all pages in the admin interface."""
 
@@ -214,11 +244,11 @@ class AdminPage:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FreeViewPage(AdminPage):
     """Arbitrary view rendered via a supplied handler."""
 
-    # async/sync callable(request, user) -> dict
+    # async callable(request, user) -> dict; sync handlers are wrapped on bind
     handler: Callable[..., Any] | None = None
     app_label: str | None = field(default=None, kw_only=True)
     app_slug: str | None = field(default=None, kw_only=True)
@@ -226,7 +256,7 @@ class FreeViewPage(AdminPage):
     dotted: str | None = field(default=None, kw_only=True)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelPage(AdminPage):
     """Page representing an ORM model."""
 
@@ -237,7 +267,7 @@ class ModelPage(AdminPage):
     # path for the model section will be of the form: /orm/{app}/{model}/
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingsPage(FreeViewPage):
     """Administrative page for application settings."""
 
@@ -248,7 +278,7 @@ class SettingsPage(FreeViewPage):
     )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PageResolution:
     """Describe how a URL path maps onto the admin navigation tree."""
 
@@ -260,7 +290,7 @@ class PageResolution:
     descriptor: "PageDescriptor | None"
 
 
-@dataclass
+@dataclass(slots=True)
 class PageDescriptor:
     """Store metadata for registered admin, settings, or public pages."""
 
@@ -290,14 +320,15 @@ class PageDescriptor:
     def bind_handler(self, func: Callable[..., Any]) -> Callable[..., Any]:
         """Attach ``func`` as the handler for the registered page."""
 
-        self.handler = func
+        handler = _as_async_handler(func)
+        self.handler = handler
         site = self.manager.admin_site
         if issubclass(self.page_class, FreeViewPage):
             page_kwargs = {
                 "title": self.title,
                 "path": self.normalized_path,
                 "icon": self.icon,
-                "handler": func,
+                "handler": handler,
                 "app_label": self.app_label,
                 "app_slug": self.app_slug,
                 "slug": self.slug,
@@ -340,61 +371,75 @@ class PageDescriptor:
         page = self.page
         if not isinstance(page, FreeViewPage):
             return
-        site = self.manager.admin_site
-        user_dependency = (
-            admin_auth_service.get_current_admin_user
-            if page.page_type == page_type_settings
-            else admin_auth_service.require_permissions((), admin_site=site)
-        )
+        manager = self.manager
+        site = manager.admin_site
+        if page.page_type == page_type_settings:
+            user_dependency = admin_auth_service.get_current_admin_user
+        else:
+            user_dependency = manager.cached_dependency(
+                ("user",),
+                lambda: admin_auth_service.require_permissions((), admin_site=site),
+            )
         registry_virtual = site.registry.get_view_virtual_by_path(page.path)
         dotted_key = page.dotted or (registry_virtual.dotted if registry_virtual else None)
-        perm_dep = site.permission_checker.require_view(
-            PermAction.view,
-            dotted=dotted_key,
-            view_key=page.path if dotted_key is None else None,
-            admin_site=site,
+        view_key = page.path if dotted_key is None else None
+        perm_dep = manager.cached_dependency(
+            ("view", dotted_key, view_key),
+            lambda: site.permission_checker.require_view(
+                PermAction.view,
+                dotted=dotted_key,
+                view_key=view_key,
+                admin_site=site,
+            ),
         )
 
+        # Pages are immutable, so everything derived from the path is fixed here.
+        is_settings = (
+            page.page_type == page_type_settings or page.path == settings_prefix
+        )
+        # Later keys win, matching the orm/settings/views precedence.
+        template_name = {
+            views_prefix: "pages/views.html",
+            settings_prefix: "pages/settings.html",
+            orm_prefix: "pages/orm.html",
+        }.get(page.path, "layout/section.html")
+        include_menu = page.path != views_prefix
+
+        handler = page.handler
+        page_title = page.title
+
         async def endpoint(
             request: Request,
-            page: FreeViewPage = Depends(lambda page=page: page),
             user=Depends(user_dependency),
-            _perm=Depends(perm_dep),
         ) -> HTMLResponse:
-            ctx: Dict[str, Any] = {}
-            if page.handler:
-                result = page.handler(request=request, user=user)
-                if hasattr(result, "__await__"):
-                    result = await result  # type: ignore[func-returns-value]
+            ctx: Mapping[str, Any] | None = None
+            if handler is not None:
+                result = await handler(request=request, user=user)
                 if isinstance(result, Mapping):
-                    ctx = dict(result)
-            is_settings = (
-                page.page_type == page_type_settings
-                or page.path == settings_prefix
-            )
-            if page.path == orm_prefix:
-                template_name = "pages/orm.html"
-            elif page.path == settings_prefix:
-                template_name = "pages/settings.html"
-            elif page.path == views_prefix:
-                template_name = "pages/views.html"
-            else:
-                template_name = "layout/section.html"
+                    ctx = result
+            menu = None
+            if include_menu:
+                menu = await site.menu_builder.build_main_menu_async(
+                    locale=site.get_locale(request)
+                )
             base_ctx = site.build_template_ctx(
                 request,
                 user,
-                page_title=page.title,
+                page_title=page_title,
                 is_settings=is_settings,
                 extra=ctx,
+                menu=menu,
             )
-            if page.path != views_prefix:
-                base_ctx["menu"] = site.menu_builder.build_main_menu(
-                    locale=site.get_locale(request)
-                )
             return templates.TemplateResponse(template_name, base_ctx)
 
+        # The permission check reads the user stored by ``user_dependency``,
+        # so it is listed first; FastAPI reuses its result for ``endpoint``.
         router.add_api_route(
-            page.path, endpoint, methods=["GET"], name=page.title
+            page.path,
+            endpoint,
+            methods=["GET"],
+            name=page_title,
+            dependencies=[Depends(user_dependency), Depends(perm_dep)],
         )
 
     def mount_public_route(self, router: APIRouter) -> None:
@@ -405,13 +450,11 @@ class PageDescriptor:
         responder = self.manager.page_responder
 
         async def endpoint(request: Request) -> HTMLResponse:
-            context: Dict[str, Any] = {}
+            context: Mapping[str, Any] | None = None
             if self.handler is not None:
-                result = self.handler(request=request, user=None)
-                if hasattr(result, "__await__"):
-                    result = await result  # type: ignore[func-returns-value]
+                result = await self.handler(request=request, user=None)
                 if isinstance(result, Mapping):
-                    context = dict(result)
+                    context = result
             return responder.render(
                 self.template_name,
                 request=request,
@@ -428,6 +471,19 @@ class PageDescriptor:
         )
 
 
+class _SectionPrefixes(NamedTuple):
+    """Normalised section prefixes derived from the cached configuration."""
+
+    views: str
+    orm: str
+    settings: str
+    raw_settings: str
+    admin: str
+    section_by_segment: Dict[str, str] | None
+    # ``(prefix, prefix + "/", mode)`` in settings/orm/views precedence.
+    sections: Tuple[Tuple[str, str, str], ...]
+
+
 class PageDescriptorManager:
     """Coordinate admin, settings, and public page registrations."""
 
@@ -437,8 +493,19 @@ class PageDescriptorManager:
         self._admin_site = admin_site
         self._descriptors: Dict[str, PageDescriptor] = {}
         self._public_descriptors: List[PageDescriptor] = []
-        self._public_router: APIRouter | None = None
-        self._public_router_dirty = False
+        self._public_router = APIRouter()
+        self._prefix_cache: Tuple[int, Any, _SectionPrefixes] | None = None
+        # Route dependencies shared across mounts so FastAPI sees the same callables.
+        self._dependency_cache: Dict[Tuple[Any, ...], Callable[..., Any]] = {}
+        # Sidebar entries pre-grouped by settings flag and label, kept sorted.
+        self._sidebar_groups: Dict[bool, Dict[str, List[Tuple[str, Dict[str, Any]]]]] = {
+            False: {},
+            True: {},
+        }
+        self._sidebar_labels: Dict[bool, List[Tuple[str, str]]] = {
+            False: [],
+            True: [],
+        }
 
     @property
     def admin_site(self) -> "AdminSite":
@@ -452,6 +519,17 @@ class PageDescriptorManager:
 
         return getattr(self._admin_site, "admin_auth_service")
 
+    def cached_dependency(
+        self, key: Tuple[Any, ...], factory: Callable[[], Callable[..., Any]]
+    ) -> Callable[..., Any]:
+        """Return the dependency stored under ``key``, building it on first use."""
+
+        dependency = self._dependency_cache.get(key)
+        if dependency is None:
+            dependency = factory()
+            self._dependency_cache[key] = dependency
+        return dependency
+
     @property
     def page_responder(self):  # pragma: no cover - attribute proxy
         """Return template responder used for public pages."""
@@ -478,42 +556,34 @@ class PageDescriptorManager:
         if owning_label is None:
             owning_label = self._admin_site._model_to_slug(name)
 
-        settings_prefix = system_config.get_cached(SettingsKey.SETTINGS_PREFIX, "/settings")
-        views_prefix = system_config.get_cached(SettingsKey.VIEWS_PREFIX, "/views")
-        orm_prefix = system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm")
+        prefixes = self._get_prefixes()
 
         derived_settings = settings
         if derived_settings is None:
-            derived_settings = normalized_path.startswith(settings_prefix)
+            derived_settings = normalized_path.startswith(prefixes.raw_settings)
 
         normalized_key = self._normalize_key(normalized_path)
-        section_prefixes = (
-            self._normalize_prefix(views_prefix),
-            self._normalize_prefix(orm_prefix),
-            self._normalize_prefix(settings_prefix),
-        )
+        # Registration checks views first, unlike request classification.
+        section_prefixes = prefixes.sections[::-1]
 
         has_required_tail = True
         tail_segments: List[str] = []
-        for section_prefix in section_prefixes:
+        for section_prefix, prefix_slash, _mode in section_prefixes:
             if normalized_key == section_prefix:
                 has_required_tail = False
                 break
-            if normalized_key.startswith(f"{section_prefix}/"):
-                tail = normalized_key[len(section_prefix) + 1 :]
-                tail_segments = [segment for segment in tail.split("/") if segment]
+            if normalized_key.startswith(prefix_slash):
+                tail = normalized_key[len(prefix_slash) :]
+                tail_segments = self._leading_segments(tail, 2)
                 has_required_tail = len(tail_segments) >= 2
                 break
 
         if not tail_segments and has_required_tail:
-            tail_segments = [segment for segment in slug_source.split("/") if segment]
+            tail_segments = self._leading_segments(slug_source, 2)
 
         app_segment: str | None = None
-        normalized_segments = [
-            self._admin_site._model_to_slug(segment) for segment in tail_segments
-        ]
-        if normalized_segments:
-            app_segment = normalized_segments[0]
+        if tail_segments:
+            app_segment = self._admin_site._model_to_slug(tail_segments[0])
         if has_required_tail and app_segment is None and owning_label is not None:
             app_segment = self._admin_site._model_to_slug(owning_label)
 
@@ -528,12 +598,7 @@ class PageDescriptorManager:
             app_segment = virtual.app_slug
         owning_label = owning_label or virtual.app_label
 
-        section = self._classify_section(
-            normalized_key,
-            views_prefix,
-            orm_prefix,
-            settings_prefix,
-        )
+        section = self._classify_section(normalized_key, prefixes)
         model_name = (
             slug_source.replace("/", "_")
             if slug_source
@@ -559,7 +624,7 @@ class PageDescriptorManager:
             dotted=virtual.dotted,
             page_class=FreeViewPage,
         )
-        self._descriptors[normalized_key] = descriptor
+        self._store_descriptor(descriptor)
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             return descriptor.bind_handler(func)
@@ -580,11 +645,7 @@ class PageDescriptorManager:
         page_type_settings = system_config.get_cached(
             SettingsKey.PAGE_TYPE_SETTINGS, "settings"
         )
-        settings_prefix = system_config.get_cached(SettingsKey.SETTINGS_PREFIX, "/settings")
-        has_required_tail = (
-            normalized_key
-            != self._normalize_prefix(settings_prefix)
-        )
+        has_required_tail = normalized_key != self._get_prefixes().settings
         virtual = self._admin_site.registry.register_view_virtual(
             path=normalized_path,
             app_label="settings",
@@ -611,7 +672,7 @@ class PageDescriptorManager:
             page_class=SettingsPage,
             menu_page_type=page_type_settings,
         )
-        self._descriptors[normalized_key] = descriptor
+        self._store_descriptor(descriptor)
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             return descriptor.bind_handler(func)
@@ -652,7 +713,7 @@ class PageDescriptorManager:
             public=True,
         )
         self._public_descriptors.append(descriptor)
-        self._public_router_dirty = True
+        descriptor.mount_public_route(self._public_router)
         self._admin_site.public_menu_builder.register_item(
             title=name,
             path=normalized_path,
@@ -660,7 +721,7 @@ class PageDescriptorManager:
         )
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            descriptor.handler = func
+            descriptor.handler = _as_async_handler(func)
             return func
 
         return decorator
@@ -668,72 +729,107 @@ class PageDescriptorManager:
     def iter_sidebar_views(
         self, *, settings: bool
     ) -> List[Tuple[str, List[Dict[str, Any]]]]:
-        """Return sidebar groupings for registered views."""
+        """Return sidebar groupings for registered views.
 
-        grouped: Dict[str, List[Dict[str, Any]]] = {}
-        for descriptor in self._descriptors.values():
-            if descriptor.public:
-                continue
-            if not descriptor.include_in_sidebar or not descriptor.has_required_tail:
-                continue
-            if descriptor.settings != settings:
-                continue
-            grouped.setdefault(descriptor.owning_label, []).append(
-                descriptor.build_sidebar_entry()
+        Groups are maintained sorted at registration time; callers receive
+        fresh entry dictionaries they are free to modify.
+        """
+
+        groups = self._sidebar_groups[settings]
+        return [
+            (label, [dict(entry) for _key, entry in groups[label]])
+            for _key, label in self._sidebar_labels[settings]
+        ]
+
+    def _store_descriptor(self, descriptor: PageDescriptor) -> None:
+        """Register ``descriptor`` and index its sidebar entry."""
+
+        previous = self._descriptors.get(descriptor.normalized_key)
+        if previous is not None:
+            self._unindex_sidebar(previous)
+        self._descriptors[descriptor.normalized_key] = descriptor
+        if descriptor.include_in_sidebar and descriptor.has_required_tail:
+            groups = self._sidebar_groups[descriptor.settings]
+            label = descriptor.owning_label
+            entries = groups.get(label)
+            if entries is None:
+                entries = groups[label] = []
+                insort(
+                    self._sidebar_labels[descriptor.settings],
+                    (label.lower(), label),
+                    key=lambda item: item[0],
+                )
+            entry = descriptor.build_sidebar_entry()
+            insort(
+                entries,
+                (descriptor.title.lower(), entry),
+                key=lambda item: item[0],
             )
 
-        items: List[Tuple[str, List[Dict[str, Any]]]] = []
-        for label, entries in grouped.items():
-            entries.sort(key=lambda item: item["display_name"].lower())
-            items.append((label, entries))
-        items.sort(key=lambda item: item[0].lower())
-        return items
+    def _unindex_sidebar(self, descriptor: PageDescriptor) -> None:
+        """Drop the sidebar entry previously indexed for ``descriptor``."""
 
-    def resolve_request(self, request: Request) -> PageResolution:
-        """Analyse ``request`` to determine the active navigation context."""
+        groups = self._sidebar_groups[descriptor.settings]
+        entries = groups.get(descriptor.owning_label)
+        if not entries:
+            return
+        path = descriptor.normalized_path
+        entries[:] = [item for item in entries if item[1]["path"] != path]
+        if not entries:
+            del groups[descriptor.owning_label]
+            labels = self._sidebar_labels[descriptor.settings]
+            labels.remove((descriptor.owning_label.lower(), descriptor.owning_label))
 
-        admin_prefix = system_config.get_cached(
-            SettingsKey.ADMIN_PREFIX, self._admin_site._settings.admin_path
-        ).rstrip("/")
-        trimmed_path = request.url.path
+    def resolve_request(self, request: Request) -> PageResolution:
+        """Analyse ``request`` to determine the active navigation context.
+
+        The immutable result is stored on ``request.state`` so the context
+        and sidebar builders share one resolution per request.
+        """
+
+        state = getattr(request, "state", None)
+        cached = getattr(state, "page_resolution", None)
+        if cached is not None:
+            return cached
+        resolution = self._resolve_path(request.url.path)
+        if state is not None:
+            state.page_resolution = resolution
+        return resolution
+
+    def _resolve_path(self, request_path: str) -> PageResolution:
+        """Return the navigation context for the raw ``request_path``."""
+
+        prefixes = self._get_prefixes()
+        admin_prefix = prefixes.admin
+        trimmed_path = request_path
         if admin_prefix and trimmed_path.startswith(admin_prefix):
             trimmed_path = trimmed_path[len(admin_prefix) :]
             if not trimmed_path.startswith("/"):
                 trimmed_path = f"/{trimmed_path}"
 
         normalized_path = trimmed_path.rstrip("/") or "/"
-        views_prefix = system_config.get_cached(SettingsKey.VIEWS_PREFIX, "/views")
-        orm_prefix = system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm")
-        settings_prefix = system_config.get_cached(SettingsKey.SETTINGS_PREFIX, "/settings")
-        normalized_views = self._normalize_prefix(views_prefix)
-        normalized_orm = self._normalize_prefix(orm_prefix)
-        normalized_settings = self._normalize_prefix(settings_prefix)
-
-        section_mode = "orm"
-        if normalized_path == normalized_settings or normalized_path.startswith(
-            f"{normalized_settings}/"
-        ):
-            section_mode = "settings"
-        elif normalized_path == normalized_orm or normalized_path.startswith(
-            f"{normalized_orm}/"
-        ):
-            section_mode = "orm"
-        elif normalized_path == normalized_views or normalized_path.startswith(
-            f"{normalized_views}/"
-        ):
-            section_mode = "views"
+        section_by_segment = prefixes.section_by_segment
+        if section_by_segment is not None:
+            segment_end = normalized_path.find("/", 1)
+            first_segment = (
+                normalized_path[1:segment_end]
+                if segment_end > 0
+                else normalized_path[1:]
+            )
+            section_mode = section_by_segment.get(first_segment, "orm")
+        else:
+            section_mode = self._match_section(normalized_path, prefixes)
 
         is_settings = section_mode == "settings"
         app_label: Optional[str] = None
         model_slug: Optional[str] = None
 
-        segments = [
-            segment for segment in normalized_path.strip("/").split("/") if segment
-        ]
-        if section_mode in {"orm", "settings"} and len(segments) >= 2:
-            app_label = segments[1]
-            if len(segments) >= 3:
-                model_slug = segments[2]
+        if section_mode != "views":
+            segments = self._leading_segments(normalized_path, 3)
+            if len(segments) >= 2:
+                app_label = segments[1]
+                if len(segments) >= 3:
+                    model_slug = segments[2]
 
         descriptor = self._descriptors.get(normalized_path)
         if descriptor is not None:
@@ -766,7 +862,10 @@ class PageDescriptorManager:
     ) -> None:
         """Mount registered admin pages onto ``router``."""
 
-        for descriptor in list(self._descriptors.values()):
+        # Warm the prefix snapshot so the first request does no config work.
+        self._get_prefixes()
+        # Mounting only reads descriptors, so no snapshot of the mapping is needed.
+        for descriptor in self._descriptors.values():
             if descriptor.public:
                 continue
             descriptor.mount_admin_route(
@@ -783,14 +882,18 @@ class PageDescriptorManager:
 
         if not self._public_descriptors:
             return ()
-        if self._public_router is None or self._public_router_dirty:
-            router = APIRouter()
-            for descriptor in self._public_descriptors:
-                descriptor.mount_public_route(router)
-            self._public_router = router
-            self._public_router_dirty = False
         return (self._public_router,)
 
+    @staticmethod
+    def _leading_segments(path: str, limit: int) -> List[str]:
+        """Return up to ``limit`` non-empty ``/``-separated segments of ``path``."""
+
+        segments = path.strip("/").split("/", limit)
+        if "" in segments:
+            # Doubled slashes are rare; filter the full split to skip them.
+            segments = [segment for segment in path.split("/") if segment]
+        return segments[:limit]
+
     @staticmethod
     def _normalize_path(path: str) -> str:
         return path if path.startswith("/") else f"/{path}"
@@ -804,24 +907,78 @@ class PageDescriptorManager:
         cleaned = prefix if prefix.startswith("/") else f"/{prefix}"
         return cleaned.rstrip("/") or "/"
 
+    def _get_prefixes(self) -> _SectionPrefixes:
+        """Return section prefixes cached per settings version."""
+
+        version = system_config.version
+        settings_obj = self._admin_site._settings
+        cached = self._prefix_cache
+        if cached is not None and cached[0] == version and cached[1] is settings_obj:
+            return cached[2]
+        settings_prefix = system_config.get_cached(SettingsKey.SETTINGS_PREFIX, "/settings")
+        views = self._normalize_prefix(
+            system_config.get_cached(SettingsKey.VIEWS_PREFIX, "/views")
+        )
+        orm = self._normalize_prefix(
+            system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm")
+        )
+        settings = self._normalize_prefix(settings_prefix)
+        prefixes = _SectionPrefixes(
+            views=views,
+            orm=orm,
+            settings=settings,
+            raw_settings=settings_prefix,
+            admin=system_config.get_cached(
+                SettingsKey.ADMIN_PREFIX, settings_obj.admin_path
+            ).rstrip("/"),
+            section_by_segment=self._build_section_map(views, orm, settings),
+            sections=tuple(
+                (prefix, sys.intern(prefix + "/"), mode)
+                for prefix, mode in (
+                    (settings, "settings"),
+                    (orm, "orm"),
+                    (views, "views"),
+                )
+            ),
+        )
+        self._prefix_cache = (version, settings_obj, prefixes)
+        return prefixes
+
+    @staticmethod
+    def _build_section_map(
+        views: str, orm: str, settings: str
+    ) -> Dict[str, str] | None:
+        """Map first path segments to section modes for single-segment prefixes.
+
+        ``None`` is returned when a prefix is the root or spans several
+        segments, in which case callers fall back to prefix matching.
+        Later entries win, preserving the settings/orm/views precedence.
+        """
+
+        sections: Dict[str, str] = {}
+        for prefix, mode in ((views, "views"), (orm, "orm"), (settings, "settings")):
+            segment = prefix[1:]
+            if not segment or "/" in segment:
+                return None
+            sections[segment] = mode
+        return sections
+
+    @staticmethod
+    def _match_section(
+        normalized_path: str, prefixes: _SectionPrefixes, default: str = "orm"
+    ) -> str:
+        """Return the section for ``normalized_path`` by prefix comparison."""
+
+        for prefix, prefix_slash, mode in prefixes.sections:
+            if normalized_path == prefix or normalized_path.startswith(prefix_slash):
+                return mode
+        return default
+
     def _classify_section(
         self,
         normalized_key: str,
-        views_prefix: str,
-        orm_prefix: str,
-        settings_prefix: str,
+        prefixes: _SectionPrefixes,
     ) -> str:
-        normalized_views = self._normalize_prefix(views_prefix)
-        normalized_orm = self._normalize_prefix(orm_prefix)
-        normalized_settings = self._normalize_prefix(settings_prefix)
-        if normalized_key == normalized_settings or normalized_key.startswith(
-            f"{normalized_settings}/"
-        ):
-            return "settings"
-        if normalized_key == normalized_orm or normalized_key.startswith(
-            f"{normalized_orm}/"
-        ):
-            return "orm"
-        return "views"
+        return self._match_section(normalized_key, prefixes, "views")
 
 # The End
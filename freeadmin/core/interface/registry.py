@@ -19,7 +19,7 @@ from .settings import SettingsKey, system_config
 from .virtual import VirtualContentKey, VirtualContentNamer, VirtualContentRegistry
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ViewEntry:
     """Registry entry describing a model admin."""
 
@@ -31,7 +31,7 @@ class ViewEntry:
     name: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MenuItem:
     """Navigation menu item."""
 
@@ -41,7 +41,7 @@ class MenuItem:
     page_type: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserMenuItem:
     """User menu item."""
 
@@ -50,7 +50,7 @@ class UserMenuItem:
     icon: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardEntry:
     """Card descriptor used by the admin site."""
 
@@ -76,6 +76,12 @@ class PageRegistry:
 
         self.page_list: List[AdminPage] = []
         self.view_entries: List[ViewEntry] = []
+        self._orm_entries: List[ViewEntry] = []
+        self._settings_entries: List[ViewEntry] = []
+        # lookup indexes kept alongside the public lists above
+        self._page_paths: set[str] = set()
+        self._view_entry_keys: set[tuple[str, str, bool]] = set()
+        self._view_entry_paths: set[tuple[bool, str, str]] = set()
         self.card_entries: Dict[str, CardEntry] = {}
         self._namer = VirtualContentNamer()
         self.virtual_registry = VirtualContentRegistry(self._namer)
@@ -83,6 +89,8 @@ class PageRegistry:
         self._view_virtual_by_path: Dict[str, VirtualContentKey] = {}
         self._view_virtual_by_slug: Dict[tuple[str, str], VirtualContentKey] = {}
         self._registry_version: int = 0
+        self._user_menu_version: int = 0
+        self._card_version: int = 0
 
     @property
     def registry_version(self) -> int:
@@ -90,15 +98,33 @@ class PageRegistry:
 
         return self._registry_version
 
+    @property
+    def user_menu_version(self) -> int:
+        """Return a counter advanced whenever a user menu entry is added."""
+
+        return self._user_menu_version
+
+    @property
+    def card_version(self) -> int:
+        """Return a counter advanced whenever a new card is registered."""
+
+        return self._card_version
+
     def bump_version(self) -> None:
         """Advance the registry version to invalidate dependent caches."""
 
         self._registry_version += 1
 
+    def bump_user_version(self) -> None:
+        """Advance the user menu version without touching the main menu."""
+
+        self._user_menu_version += 1
+
     def register_page(self, page: AdminPage) -> None:
         """Add ``page`` to the registry without mutating menu state."""
 
         self.page_list.append(page)
+        self._page_paths.add(page.path)
 
     # View entries -----------------------------------------------------
     def register_view_entry(
@@ -119,9 +145,8 @@ class PageRegistry:
         """
 
         key = (app.lower(), model.lower(), settings)
-        for e in self.view_entries:
-            if (e.app.lower(), e.model.lower(), e.settings) == key:
-                return  # Idempotent
+        if key in self._view_entry_keys:
+            return  # Idempotent
 
         settings_prefix = system_config.get_cached(SettingsKey.SETTINGS_PREFIX, "/settings")
         orm_prefix = system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm")
@@ -129,18 +154,17 @@ class PageRegistry:
             f"{settings_prefix}/{app}/{model}" if settings else f"{orm_prefix}/{app}/{model}"
         )
 
-        for e in self.view_entries:
-            other_prefix = (
-                f"{settings_prefix}/{e.app}/{e.model}"
-                if e.settings
-                else f"{orm_prefix}/{e.app}/{e.model}"
-            )
-            if other_prefix == prefix:
-                raise ValueError(f"Path conflict: {prefix}")
+        # Entries of the same kind sharing a path are caught by the
+        # idempotency check above, so only an entry of the other kind can
+        # collide, and only while both prefixes are equal.
+        if (
+            settings_prefix == orm_prefix
+            and (not settings, app, model) in self._view_entry_paths
+        ):
+            raise ValueError(f"Path conflict: {prefix}")
 
-        for page in self.page_list:
-            if page.path == prefix:
-                raise ValueError(f"Path conflict: {prefix}")
+        if prefix in self._page_paths:
+            raise ValueError(f"Path conflict: {prefix}")
 
         entry = ViewEntry(
             app=app,
@@ -151,17 +175,20 @@ class PageRegistry:
             name=name,
         )
         self.view_entries.append(entry)
+        (self._settings_entries if settings else self._orm_entries).append(entry)
+        self._view_entry_keys.add(key)
+        self._view_entry_paths.add((settings, app, model))
         self.bump_version()
 
     def iter_orm(self) -> Iterator[ViewEntry]:
         """Iterate over non-settings admin registrations."""
 
-        yield from (e for e in self.view_entries if not e.settings)
+        return iter(self._orm_entries)
 
     def iter_settings(self) -> Iterator[ViewEntry]:
         """Iterate over settings admin registrations."""
 
-        yield from (e for e in self.view_entries if e.settings)
+        return iter(self._settings_entries)
 
     # Cards ------------------------------------------------------------
     def register_card(
@@ -186,21 +213,18 @@ class PageRegistry:
 
         existing = self.card_entries.get(key)
         if existing is not None:
-            candidate = CardEntry(
-                key=key,
-                app=app,
-                app_slug=existing.app_slug,
-                title=title,
-                template=template,
-                icon=icon,
-                channel=channel,
-                col_class=col_class,
-                scripts=tuple(scripts or ()),
-                styles=tuple(styles or ()),
-                slug=existing.slug,
-                dotted=existing.dotted,
-            )
-            if existing != candidate:
+            # Compare field by field so an identical re-registration returns
+            # without building a candidate entry or asset tuples.
+            if (
+                existing.app != app
+                or existing.title != title
+                or existing.template != template
+                or existing.icon != icon
+                or existing.channel != channel
+                or existing.col_class != col_class
+                or existing.scripts != tuple(scripts or ())
+                or existing.styles != tuple(styles or ())
+            ):
                 raise ValueError(
                     f"Card '{key}' is already registered with different data"
                 )
@@ -229,6 +253,7 @@ class PageRegistry:
         )
         self.card_entries[key] = entry
         self._card_virtual[key] = virtual
+        self._card_version += 1
 
     def get_card_virtual(self, key: str) -> VirtualContentKey | None:
         """Return the virtual metadata registered for ``key``."""
@@ -284,9 +309,19 @@ class PageRegistry:
         return self._view_virtual_by_path.get(normalized_path)
 
     def get_view_virtual(self, app_slug: str, slug: str) -> VirtualContentKey | None:
-        """Return virtual metadata identified by ``app_slug`` and ``slug``."""
+        """Return virtual metadata identified by ``app_slug`` and ``slug``.
 
-        return self._view_virtual_by_slug.get((app_slug.lower(), slug))
+        Both parts are normalised like they were at registration; callers
+        passing the stored slugs are answered without slugifying.
+        """
+
+        virtual = self._view_virtual_by_slug.get((app_slug, slug))
+        if virtual is None:
+            slugify = self._namer.slugify
+            virtual = self._view_virtual_by_slug.get(
+                (slugify(app_slug), slugify(slug))
+            )
+        return virtual
 
     def iter_virtual_views(self) -> Iterator[VirtualContentKey]:
         """Iterate over all registered virtual views."""
@@ -296,10 +331,10 @@ class PageRegistry:
     def get_card(self, key: str) -> CardEntry:
         """Return registered card by key or raise ``ValueError``."""
 
-        entry = self.card_entries.get(key)
-        if entry is None:
-            raise ValueError(f"Unknown card: {key}")
-        return entry
+        try:
+            return self.card_entries[key]
+        except KeyError:
+            raise ValueError(f"Unknown card: {key}") from None
 
     def iter_cards(self) -> Iterator[CardEntry]:
         """Iterate over registered cards."""
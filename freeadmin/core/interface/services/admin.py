@@ -26,6 +26,7 @@ from ..exceptions import (
 )
 from ..filters import FilterSpec
 from ..permissions import permission_checker
+from .auth import AuthService
 from .permissions import permissions_service
 from ..settings import SettingsKey, system_config
 from ..base import BaseModelAdmin
@@ -73,6 +74,10 @@ class AdminService:
         """Return ``True`` when the service operates on group permissions."""
         return self.admin.model is self.adapter.group_permission_model
 
+    def _is_user_model(self) -> bool:
+        """Return ``True`` when the service operates on admin users."""
+        return self.admin.model is self.adapter.user_model
+
     async def _invalidate_permission_cache_for_users(
         self, *user_ids: Any
     ) -> None:
@@ -95,7 +100,7 @@ class AdminService:
         previous: Any | None = None,
         current: Any | None = None,
     ) -> None:
-        """Invalidate caches affected by permission record changes."""
+        """Invalidate caches affected by permission or user record changes."""
         if self._is_user_permission_model():
             await self._invalidate_permission_cache_for_users(
                 getattr(previous, "user_id", None),
@@ -106,6 +111,8 @@ class AdminService:
                 getattr(previous, "group_id", None),
                 getattr(current, "group_id", None),
             )
+        elif self._is_user_model():
+            AuthService.invalidate_superuser_cache()
 
     async def get_object(self, request, user: AdminUserDTO, pk: str):
         qs = self.admin.get_objects(request, user)
@@ -128,9 +135,11 @@ class AdminService:
         qs = self.admin.get_list_queryset(request, user, self.md, params)
         order = params.get("order", order)
 
+        default_per_page, max_per_page = await system_config.get_many(
+            (SettingsKey.DEFAULT_PER_PAGE, SettingsKey.MAX_PER_PAGE)
+        )
         if per_page is None:
-            per_page = await system_config.get(SettingsKey.DEFAULT_PER_PAGE)
-        max_per_page = await system_config.get(SettingsKey.MAX_PER_PAGE)
+            per_page = default_per_page
         per_page = max(1, min(int(per_page), max_per_page))
         page_num = max(1, int(page_num))
         total = await self.adapter.count(qs)
@@ -11,15 +11,21 @@ Email: timurkady@yandex.com
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Iterable, TYPE_CHECKING
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
 import secrets
-from itsdangerous import BadSignature, URLSafeTimedSerializer
 
 from ....contrib.adapters import BaseAdapter
 from ....utils.passwords import password_hasher
@@ -48,64 +54,162 @@ class AdminUserDTO:
     permissions: set[str] = field(default_factory=set)
 
 
+_CSRF_PLACEHOLDER = "__FREEADMIN_CSRF_TOKEN__"
+_CSRF_PLACEHOLDER_BYTES = _CSRF_PLACEHOLDER.encode("ascii")
+
+
 class CSRFTokenManager:
-    """Simple CSRF token generator and validator."""
+    """Simple CSRF token generator and validator.
+
+    Tokens have the form ``<hex timestamp>.<random token>.<mac>`` where the
+    MAC is a 16-byte keyed BLAKE2b digest of the first two parts.
+    """
+
+    max_age = 3600
 
     def __init__(self, secret: str) -> None:
         """Initialize the token manager with a secret."""
-        self._serializer = URLSafeTimedSerializer(secret, salt="admin-csrf")
+        self.secret = secret
+        # BLAKE2b keys are limited to 64 bytes, so derive one from the secret.
+        self._key = hashlib.blake2b(
+            secret.encode("utf-8"), digest_size=64, person=b"admin-csrf"
+        ).digest()
+
+    def _sign(self, payload: str) -> str:
+        digest = hashlib.blake2b(
+            payload.encode("utf-8"), key=self._key, digest_size=16
+        ).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
 
     def generate(self, request: Request) -> str:
-        """Generate and store a CSRF token."""
-        token = secrets.token_urlsafe()
-        signed = self._serializer.dumps(token)
+        """Return the session's CSRF token, minting a new one when stale.
+
+        A stored token is reused while it is younger than half of
+        ``max_age`` so a form rendered from it stays valid long enough to
+        be submitted.
+        """
+        now = time.time()
+        existing = request.session.get("_csrf_token")
+        if existing:
+            issued_at = self._issued_at(str(existing))
+            if issued_at is not None and now - issued_at <= self.max_age // 2:
+                return existing
+        payload = f"{int(now):x}.{secrets.token_urlsafe()}"
+        signed = f"{payload}.{self._sign(payload)}"
         request.session["_csrf_token"] = signed
         return signed
 
     def validate(self, request: Request, token: str) -> bool:
         """Validate a CSRF token retrieved from the session."""
         expected = request.session.get("_csrf_token")
-        if not expected:
+        if not expected or not token:
             return False
-        try:
-            token_val = self._serializer.loads(token, max_age=3600)
-            expected_val = self._serializer.loads(expected, max_age=3600)
-        except BadSignature:
+        # The session keeps the signed token itself, so equal signed strings
+        # carry the same payload and only one signature/age check is needed.
+        if not secrets.compare_digest(
+            str(token).encode("utf-8"), str(expected).encode("utf-8")
+        ):
+            return False
+        issued_at = self._issued_at(str(expected))
+        if issued_at is None:
             return False
-        return secrets.compare_digest(token_val, expected_val)
+        return time.time() - issued_at <= self.max_age
+
+    def _issued_at(self, token: str) -> int | None:
+        """Return the issue timestamp of ``token`` or ``None`` if forged."""
+        payload, _, mac = token.rpartition(".")
+        timestamp, _, _ = payload.partition(".")
+        if not secrets.compare_digest(
+            mac.encode("utf-8"), self._sign(payload).encode("utf-8")
+        ):
+            return None
+        try:
+            return int(timestamp, 16)
+        except ValueError:
+            return None
 
 
 class AuthService:
     """Authentication service using a provided adapter."""
 
+    _superuser_generation = 0
+
     def __init__(self, adapter: BaseAdapter) -> None:
         self.adapter = adapter
         self.user_model = adapter.user_model
+        self._superuser_seen_generation = -1
+        self._dummy_hash: tuple[tuple[Any, Any], str] | None = None
 
     async def authenticate_user(self, username: str, password: str) -> Any | None:
-        """Return user if credentials are valid."""
+        """Return user if credentials are valid.
+
+        A password hash is verified on every attempt, against a dummy hash
+        when the account is missing or not allowed in, so response timing
+        does not reveal which usernames exist.
+        """
         user = await self.adapter.get_or_none(self.user_model, username=username)
-        if (
-            not user
-            or not getattr(user, "is_active", False)
-            or not getattr(user, "is_staff", False)
-            or not await password_hasher.check_password(password, user.password)
-        ):
+        eligible = (
+            user is not None
+            and getattr(user, "is_active", False)
+            and getattr(user, "is_staff", False)
+        )
+        stored = user.password if eligible else await self._get_dummy_hash()
+        password_ok = await password_hasher.check_password(password, stored)
+        if not (eligible and password_ok):
             return None
         return user
 
+    async def _get_dummy_hash(self) -> str:
+        """Return a throwaway hash using the configured algorithm and cost."""
+        algo = await system_config.get_or_default(SettingsKey.PASSWORD_ALGO)
+        iterations = await system_config.get_or_default(
+            SettingsKey.PASSWORD_ITERATIONS
+        )
+        cached = self._dummy_hash
+        if cached is None or cached[0] != (algo, iterations):
+            dummy = await password_hasher.make_password(
+                secrets.token_urlsafe(), iterations=iterations
+            )
+            cached = ((algo, iterations), dummy)
+            self._dummy_hash = cached
+        return cached[1]
+
+    @classmethod
+    def invalidate_superuser_cache(cls) -> None:
+        """Forget every remembered superuser answer after user changes."""
+
+        cls._superuser_generation += 1
+
+    @classmethod
+    def superuser_generation(cls) -> int:
+        """Return the counter bumped by :meth:`invalidate_superuser_cache`."""
+
+        return cls._superuser_generation
+
     async def superuser_exists(self) -> bool:
-        """Check if a superuser already exists."""
+        """Check if a superuser already exists.
+
+        The adapter's ``exists`` already issues a ``SELECT 1 ... LIMIT 1``
+        probe; once it succeeds the answer is remembered until
+        :meth:`invalidate_superuser_cache` is called, so the setup routes
+        stop querying after the initial installation.
+        """
+        generation = AuthService._superuser_generation
+        if self._superuser_seen_generation == generation:
+            return True
         queryset = self.adapter.filter(
             self.user_model,
             is_staff=True,
             is_superuser=True,
         )
-        return await self.adapter.exists(queryset)
+        if not await self.adapter.exists(queryset):
+            return False
+        self._superuser_seen_generation = generation
+        return True
 
     async def create_superuser(self, username: str, email: str, password: str) -> Any:
         """Create a new superuser."""
-        return await self.adapter.create(
+        user = await self.adapter.create(
             self.user_model,
             username=username,
             email=email,
@@ -114,6 +218,9 @@ class AuthService:
             is_superuser=True,
             is_active=True,
         )
+        self.invalidate_superuser_cache()
+        self._superuser_seen_generation = AuthService._superuser_generation
+        return user
 
 
 class AdminAuthService(IconPathMixin):
@@ -125,6 +232,8 @@ class AdminAuthService(IconPathMixin):
         adapter: BaseAdapter,
         *,
         settings: FreeAdminSettings | None = None,
+        permission_ttl: float = 30.0,
+        permission_cache_size: int = 1024,
     ) -> None:
         """Initialize with authentication backend and data adapter."""
         self.auth_service = auth_service
@@ -134,33 +243,96 @@ class AdminAuthService(IconPathMixin):
         self.PermAction = adapter.perm_action
         self._settings = settings or current_settings()
         self._csrf = CSRFTokenManager(self._settings.csrf_secret)
+        self._branding_cache: (
+            tuple[int, FreeAdminSettings, tuple[str, str]] | None
+        ) = None
+        self._auth_ctx_cache: (
+            tuple[int, FreeAdminSettings, str, Mapping[str, Any]] | None
+        ) = None
+        self._permission_ttl = permission_ttl
+        self._permission_cache_size = permission_cache_size
+        # user id -> (monotonic deadline, resolved permission codenames)
+        self._permission_sets: OrderedDict[str, tuple[float, frozenset[str]]] = (
+            OrderedDict()
+        )
         register_settings_observer(self._apply_settings)
 
     @property
     def site_title(self) -> str:
         """Return the admin site title."""
-        return system_config.get_cached(
-            SettingsKey.DEFAULT_ADMIN_TITLE, self._settings.admin_site_title
-        )
+        return self._resolve_branding()[0]
 
     @property
     def brand_icon(self) -> str:
         """Return URL to the brand icon."""
-        icon_path = system_config.get_cached(
-            SettingsKey.BRAND_ICON, self._settings.brand_icon
-        )
-        prefix = system_config.get_cached(
-            SettingsKey.ADMIN_PREFIX, self._settings.admin_path
-        )
-        static_segment = system_config.get_cached(
-            SettingsKey.STATIC_URL_SEGMENT, self._settings.static_url_segment
+        return self._resolve_branding()[1]
+
+    def _resolve_branding(self) -> tuple[str, str]:
+        """Return ``(site_title, brand_icon)`` cached per settings version."""
+        version = system_config.version
+        cached = self._branding_cache
+        if cached is not None and cached[0] == version and cached[1] is self._settings:
+            return cached[2]
+        settings = self._settings
+        title, icon_path, prefix, static_segment = system_config.get_cached_many(
+            (
+                (SettingsKey.DEFAULT_ADMIN_TITLE, settings.admin_site_title),
+                (SettingsKey.BRAND_ICON, settings.brand_icon),
+                (SettingsKey.ADMIN_PREFIX, settings.admin_path),
+                (SettingsKey.STATIC_URL_SEGMENT, settings.static_url_segment),
+            )
         )
-        return self._resolve_icon_path(icon_path, prefix, static_segment)
+        branding = (title, self._resolve_icon_path(icon_path, prefix, static_segment))
+        self._branding_cache = (version, settings, branding)
+        return branding
 
     def _apply_settings(self, settings: FreeAdminSettings) -> None:
         """Update cached configuration and refresh CSRF secret."""
         self._settings = settings
-        self._csrf = CSRFTokenManager(self._settings.csrf_secret)
+        if settings.csrf_secret != self._csrf.secret:
+            self._csrf = CSRFTokenManager(settings.csrf_secret)
+        self._permission_sets.clear()
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Forget the cached permission set resolved for ``user_id``."""
+
+        self._permission_sets.pop(str(user_id), None)
+
+    async def _load_permissions(self, user: Any) -> frozenset[str]:
+        """Return permission codenames granted to ``user`` directly or via groups."""
+
+        key = str(user.id)
+        cached = self._permission_sets.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            self._permission_sets.move_to_end(key)
+            return cached[1]
+        # Group permissions are reached through the membership join, so
+        # both lookups run concurrently without fetching group ids first.
+        user_perm_qs = self.adapter.filter(
+            self.AdminUserPermission, user_id=user.id
+        )
+        group_perm_qs = self.adapter.filter(
+            self.AdminGroupPermission, group__users__id=user.id
+        )
+        user_perms, group_perms = await asyncio.gather(
+            self.adapter.fetch_values(
+                user_perm_qs, "content_type__dotted", "action"
+            ),
+            self.adapter.fetch_values(
+                group_perm_qs, "content_type__dotted", "action"
+            ),
+        )
+        perms = frozenset(
+            f"{str(dotted).lower()}.{str(action)}" if dotted else str(action)
+            for dotted, action in chain(user_perms, group_perms)
+        )
+        if self._permission_ttl > 0:
+            self._permission_sets[key] = (now + self._permission_ttl, perms)
+            self._permission_sets.move_to_end(key)
+            while len(self._permission_sets) > self._permission_cache_size:
+                self._permission_sets.popitem(last=False)
+        return perms
 
     async def get_current_admin_user(self, request: Request) -> AdminUserDTO:
         """Retrieve the current admin user from the request state."""
@@ -169,38 +341,7 @@ class AdminAuthService(IconPathMixin):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
         perms: set[str] = set()
         if user.is_staff and not user.is_superuser:
-            user_perm_qs = self.adapter.filter(
-                self.AdminUserPermission, user_id=user.id
-            )
-            user_perm_qs = self.adapter.prefetch_related(
-                user_perm_qs, "content_type"
-            )
-            user_perms = await self.adapter.fetch_values(
-                user_perm_qs, "content_type__dotted", "action"
-            )
-            for dotted, action in user_perms:
-                if dotted:
-                    perms.add(f"{str(dotted).lower()}.{str(action)}")
-                else:
-                    perms.add(str(action))
-            group_ids = await self.adapter.fetch_values(
-                self.adapter.filter(user.groups), "id", flat=True
-            )
-            if group_ids:
-                group_perm_qs = self.adapter.filter(
-                    self.AdminGroupPermission, group_id__in=group_ids
-                )
-                group_perm_qs = self.adapter.prefetch_related(
-                    group_perm_qs, "content_type"
-                )
-                group_perms = await self.adapter.fetch_values(
-                    group_perm_qs, "content_type__dotted", "action"
-                )
-                for dotted, action in group_perms:
-                    if dotted:
-                        perms.add(f"{str(dotted).lower()}.{str(action)}")
-                    else:
-                        perms.add(str(action))
+            perms = set(await self._load_permissions(user))
         return AdminUserDTO(
             id=str(user.id),
             username=user.username,
@@ -216,75 +357,137 @@ class AdminAuthService(IconPathMixin):
     ):
         """Dependency generator enforcing permission codenames."""
 
-        parsed: list[tuple[str, str, "PermAction"]] = []
+        # Content type ids are only known once the site is finalized, so the
+        # codenames are reduced here to dotted keys and action values and
+        # resolved on the first request for each ``ct_map`` version.
+        parsed: list[tuple[str, str]] = []
         for codename in codenames:
             try:
                 app, model, action = codename.split(".")
-                parsed.append((app, model, self.PermAction(action)))
+                parsed.append((f"{app}.{model}", self.PermAction(action).value))
             except ValueError:
                 raise ValueError(f"Invalid codename: {codename}") from None
+        if not parsed:
+            # Nothing to check beyond authentication: hand FastAPI the user
+            # dependency itself instead of wrapping it in another closure.
+            return self.get_current_admin_user
+        resolved: list[Any] = [None, None, frozenset()]
 
         async def _dep(
             request: Request, user: AdminUserDTO = Depends(self.get_current_admin_user)
         ) -> AdminUserDTO:
-            if not parsed:
-                return user
-
             site = admin_site or getattr(request.app.state, "admin_site", None)
             if site is None:
                 raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
             orm_user = request.state.user
-            for app, model, action in parsed:
-                ct_id = site.get_ct_id(app, model)
-                if ct_id is None:
-                    raise HTTPException(status_code=404)
-                allowed = False
-                if orm_user.is_active and orm_user.is_staff:
-                    if orm_user.is_superuser:
-                        allowed = True
-                    else:
-                        allowed = await self.adapter.exists(
-                            self.adapter.filter(
-                                self.AdminUserPermission,
-                                user_id=orm_user.id,
-                                content_type_id=ct_id,
-                                action=action,
-                            )
-                        )
-                        if not allowed:
-                            group_ids = await self.adapter.fetch_values(
-                                self.adapter.filter(orm_user.groups),
-                                "id",
-                                flat=True,
-                            )
-                            allowed = await self.adapter.exists(
-                                self.adapter.filter(
-                                    self.AdminGroupPermission,
-                                    group_id__in=group_ids,
-                                    content_type_id=ct_id,
-                                    action=action,
-                                )
-                            )
-                if not allowed:
+            version = getattr(site, "ct_map_version", None)
+            if version is not None and resolved[0] is site and resolved[1] == version:
+                required = resolved[2]
+            else:
+                required = self._resolve_required_pairs(site, parsed)
+                resolved[:] = (site, version, required)
+            if not (orm_user.is_active and orm_user.is_staff):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+            if not orm_user.is_superuser:
+                owned = await self._fetch_granted_pairs(orm_user, required)
+                if not required <= owned:
                     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
             return user
 
         return _dep
 
+    @staticmethod
+    def _resolve_required_pairs(
+        site: "AdminSite", parsed: Iterable[tuple[str, str]]
+    ) -> frozenset[tuple[Any, str]]:
+        """Map ``(dotted, action)`` pairs to ``(content_type_id, action)`` pairs."""
+
+        required: set[tuple[Any, str]] = set()
+        get_ct_id = site.get_ct_id_by_dotted
+        for dotted, action in parsed:
+            ct_id = get_ct_id(dotted)
+            if ct_id is None:
+                raise HTTPException(status_code=404)
+            required.add((ct_id, action))
+        return frozenset(required)
+
+    async def _fetch_granted_pairs(
+        self, user: Any, required: frozenset[tuple[Any, str]]
+    ) -> set[tuple[Any, str]]:
+        """Return ``(content_type_id, action)`` pairs of ``required`` granted to ``user``."""
+
+        filters = {
+            "content_type_id__in": {ct_id for ct_id, _ in required},
+            "action__in": {action for _, action in required},
+        }
+        user_pairs, group_pairs = await asyncio.gather(
+            self.adapter.fetch_values(
+                self.adapter.filter(
+                    self.AdminUserPermission, user_id=user.id, **filters
+                ),
+                "content_type_id",
+                "action",
+            ),
+            self.adapter.fetch_values(
+                self.adapter.filter(
+                    self.AdminGroupPermission, group__users__id=user.id, **filters
+                ),
+                "content_type_id",
+                "action",
+            ),
+        )
+        return {
+            (ct_id, str(getattr(action, "value", action)))
+            for ct_id, action in chain(user_pairs, group_pairs)
+        }
+
     async def logout(self, request: Request) -> RedirectResponse:
         """Log out the current user and clear session."""
 
         request.session.clear()
-        admin_prefix = await system_config.get(SettingsKey.ADMIN_PREFIX)
-        login_path = await system_config.get(SettingsKey.LOGIN_PATH)
+        admin_prefix, login_path, cookie_name = await system_config.get_many(
+            (
+                SettingsKey.ADMIN_PREFIX,
+                SettingsKey.LOGIN_PATH,
+                SettingsKey.SESSION_COOKIE,
+            )
+        )
         response = RedirectResponse(
             f"{admin_prefix}{login_path}", status_code=303
         )
-        cookie_name = await system_config.get(SettingsKey.SESSION_COOKIE)
         response.delete_cookie(cookie_name)
         return response
 
+    def _auth_page_context(self, admin_prefix: str) -> Mapping[str, Any]:
+        """Return settings-derived context shared by login and setup pages."""
+
+        version = system_config.version
+        cached = self._auth_ctx_cache
+        if (
+            cached is not None
+            and cached[0] == version
+            and cached[1] is self._settings
+            and cached[2] == admin_prefix
+        ):
+            return cached[3]
+        ctx = MappingProxyType(
+            {
+                "prefix": admin_prefix,
+                "ORM_PREFIX": system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm"),
+                "SETTINGS_PREFIX": system_config.get_cached(
+                    SettingsKey.SETTINGS_PREFIX, "/settings"
+                ),
+                "VIEWS_PREFIX": system_config.get_cached(
+                    SettingsKey.VIEWS_PREFIX, "/views"
+                ),
+                "site_title": self.site_title,
+                "brand_icon": self.brand_icon,
+            }
+        )
+        self._auth_ctx_cache = (version, self._settings, admin_prefix, ctx)
+        return ctx
+
     def build_auth_router(self, templates: Jinja2Templates) -> APIRouter:
         """Construct authentication routes for the admin site."""
         router = APIRouter()
@@ -295,27 +498,55 @@ class AdminAuthService(IconPathMixin):
             SettingsKey.ADMIN_PREFIX, self._settings.admin_path
         )
 
-        @router.get(login_path, response_class=HTMLResponse)
-        async def login_form(request: Request):
-            orm_prefix = await system_config.get(SettingsKey.ORM_PREFIX)
-            settings_prefix = await system_config.get(SettingsKey.SETTINGS_PREFIX)
-            views_prefix = await system_config.get(SettingsKey.VIEWS_PREFIX)
-            token = self._csrf.generate(request)
+        def render(
+            template_name: str,
+            request: Request,
+            error: str | None = None,
+            status_code: int = 200,
+        ) -> HTMLResponse:
+            ctx = dict(self._auth_page_context(admin_prefix))
+            ctx["request"] = request
+            ctx["error"] = error
+            ctx["csrf_token"] = self._csrf.generate(request)
             return templates.TemplateResponse(
-                "pages/login.html",
-                {
-                    "request": request,
-                    "error": None,
-                    "prefix": admin_prefix,
-                    "ORM_PREFIX": orm_prefix,
-                    "SETTINGS_PREFIX": settings_prefix,
-                    "VIEWS_PREFIX": views_prefix,
-                    "site_title": self.site_title,
-                    "brand_icon": self.brand_icon,
-                    "csrf_token": token,
-                },
+                template_name, ctx, status_code=status_code
             )
 
+        # Error-free form pages only vary by the CSRF token, so their body is
+        # rendered once per settings version and request path and the token
+        # is spliced in afterwards.
+        form_bodies: dict[tuple[Any, ...], bytes] = {}
+        form_settings: list[FreeAdminSettings] = [self._settings]
+
+        def render_form(template_name: str, request: Request) -> HTMLResponse:
+            if form_settings[0] is not self._settings:
+                form_bodies.clear()
+                form_settings[0] = self._settings
+            key = (
+                system_config.version,
+                template_name,
+                request.scope.get("root_path", ""),
+                request.url.path,
+            )
+            body = form_bodies.get(key)
+            if body is None:
+                ctx = dict(self._auth_page_context(admin_prefix))
+                ctx["request"] = request
+                ctx["error"] = None
+                ctx["csrf_token"] = _CSRF_PLACEHOLDER
+                body = templates.TemplateResponse(template_name, ctx).body
+                if len(form_bodies) >= 32:
+                    form_bodies.clear()
+                form_bodies[key] = body
+            token = self._csrf.generate(request)
+            return HTMLResponse(
+                body.replace(_CSRF_PLACEHOLDER_BYTES, token.encode("utf-8"))
+            )
+
+        @router.get(login_path, response_class=HTMLResponse)
+        async def login_form(request: Request):
+            return render_form("pages/login.html", request)
+
         @router.post(login_path, response_class=HTMLResponse)
         async def login_post(
             request: Request,
@@ -324,45 +555,13 @@ class AdminAuthService(IconPathMixin):
             csrf_token: str = Form(...),
         ):
             if not self._csrf.validate(request, csrf_token):
-                orm_prefix = await system_config.get(SettingsKey.ORM_PREFIX)
-                settings_prefix = await system_config.get(SettingsKey.SETTINGS_PREFIX)
-                views_prefix = await system_config.get(SettingsKey.VIEWS_PREFIX)
-                token = self._csrf.generate(request)
-                return templates.TemplateResponse(
-                    "pages/login.html",
-                    {
-                        "request": request,
-                        "error": "Invalid CSRF token",
-                        "prefix": admin_prefix,
-                        "ORM_PREFIX": orm_prefix,
-                        "SETTINGS_PREFIX": settings_prefix,
-                        "VIEWS_PREFIX": views_prefix,
-                        "site_title": self.site_title,
-                        "brand_icon": self.brand_icon,
-                        "csrf_token": token,
-                    },
-                    status_code=400,
+                return render(
+                    "pages/login.html", request, "Invalid CSRF token", 400
                 )
             user = await self.auth_service.authenticate_user(username, password)
             if not user:
-                orm_prefix = await system_config.get(SettingsKey.ORM_PREFIX)
-                settings_prefix = await system_config.get(SettingsKey.SETTINGS_PREFIX)
-                views_prefix = await system_config.get(SettingsKey.VIEWS_PREFIX)
-                token = self._csrf.generate(request)
-                return templates.TemplateResponse(
-                    "pages/login.html",
-                    {
-                        "request": request,
-                        "error": "Invalid credentials",
-                        "prefix": admin_prefix,
-                        "ORM_PREFIX": orm_prefix,
-                        "SETTINGS_PREFIX": settings_prefix,
-                        "VIEWS_PREFIX": views_prefix,
-                        "site_title": self.site_title,
-                        "brand_icon": self.brand_icon,
-                        "csrf_token": token,
-                    },
-                    status_code=400,
+                return render(
+                    "pages/login.html", request, "Invalid credentials", 400
                 )
             session_key = await system_config.get(SettingsKey.SESSION_KEY)
             request.session[session_key] = str(user.id)
@@ -377,24 +576,7 @@ class AdminAuthService(IconPathMixin):
                 return RedirectResponse(
                     f"{admin_prefix}{login_path}", status_code=303
                 )
-            orm_prefix = await system_config.get(SettingsKey.ORM_PREFIX)
-            settings_prefix = await system_config.get(SettingsKey.SETTINGS_PREFIX)
-            views_prefix = await system_config.get(SettingsKey.VIEWS_PREFIX)
-            token = self._csrf.generate(request)
-            return templates.TemplateResponse(
-                "pages/setup.html",
-                {
-                    "request": request,
-                    "error": None,
-                    "prefix": admin_prefix,
-                    "ORM_PREFIX": orm_prefix,
-                    "SETTINGS_PREFIX": settings_prefix,
-                    "VIEWS_PREFIX": views_prefix,
-                    "site_title": self.site_title,
-                    "brand_icon": self.brand_icon,
-                    "csrf_token": token,
-                },
-            )
+            return render_form("pages/setup.html", request)
 
         @router.post(setup_path)
         async def setup_post(
@@ -405,24 +587,8 @@ class AdminAuthService(IconPathMixin):
             csrf_token: str = Form(...),
         ):
             if not self._csrf.validate(request, csrf_token):
-                orm_prefix = await system_config.get(SettingsKey.ORM_PREFIX)
-                settings_prefix = await system_config.get(SettingsKey.SETTINGS_PREFIX)
-                views_prefix = await system_config.get(SettingsKey.VIEWS_PREFIX)
-                token = self._csrf.generate(request)
-                return templates.TemplateResponse(
-                    "pages/setup.html",
-                    {
-                        "request": request,
-                        "error": "Invalid CSRF token",
-                        "prefix": admin_prefix,
-                        "ORM_PREFIX": orm_prefix,
-                        "SETTINGS_PREFIX": settings_prefix,
-                        "VIEWS_PREFIX": views_prefix,
-                        "site_title": self.site_title,
-                        "brand_icon": self.brand_icon,
-                        "csrf_token": token,
-                    },
-                    status_code=400,
+                return render(
+                    "pages/setup.html", request, "Invalid CSRF token", 400
                 )
             if await self.auth_service.superuser_exists():
                 login_path = await system_config.get(SettingsKey.LOGIN_PATH)
@@ -300,6 +300,7 @@ class PermissionsService:
 from freeadmin.core.boot import admin as boot_admin
 
 permissions_service = PermissionsService(boot_admin.adapter)
+permissions_service.register_user_invalidation_hook(admin_auth_service.invalidate_user)
 PermAction = permissions_service.PermAction
 
 __all__ = ["PermAction", "PermissionsService", "permissions_service"]
@@ -14,7 +14,7 @@ from __future__ import annotations
 import importlib.util
 import logging
 import sqlite3
-from typing import Any, Tuple
+from typing import Any, Iterable, Tuple
 
 from tortoise import exceptions as tortoise_exceptions
 
@@ -60,6 +60,13 @@ class SystemConfig:
 
         self._cache: dict[str, Any] = {}
         self._migrations_required: bool = False
+        self._version: int = 0
+
+    @property
+    def version(self) -> int:
+        """Return a counter advanced whenever the cached settings change."""
+
+        return self._version
 
     @property
     def adapter(self) -> Any:
@@ -153,6 +160,7 @@ class SystemConfig:
 
         self._cache.clear()
         self._cache.update(new_cache)
+        self._version += 1
         self.clear_migrations_flag()
 
     @property
@@ -182,6 +190,21 @@ class SystemConfig:
         key_str = key.value if isinstance(key, SettingsKey) else key
         return self._cache.get(key_str, default)
 
+    def get_cached_many(
+        self, keys: Iterable[Tuple[SettingsKey | str, Any]]
+    ) -> list[Any]:
+        """Return cached values for ``(key, default)`` pairs in input order.
+
+        This is the batched form of :meth:`get_cached` for callers reading
+        a fixed group of settings together.
+        """
+
+        cache = self._cache
+        return [
+            cache.get(key.value if isinstance(key, SettingsKey) else key, default)
+            for key, default in keys
+        ]
+
     async def get_or_default(
         self, key: SettingsKey | str, *, default: Any | object = _MISSING
     ) -> Any:
@@ -202,6 +225,7 @@ class SystemConfig:
             fallback = self._default_for(key_str)
 
         self._cache[key_str] = fallback
+        self._version += 1
         return fallback
 
     async def get(self, key: SettingsKey | str, default: Any | None = None) -> Any:
@@ -219,6 +243,23 @@ class SystemConfig:
             return default
         raise KeyError(key_str)
 
+    async def get_many(self, keys: Iterable[SettingsKey | str]) -> list[Any]:
+        """Return values for ``keys`` in input order using one cache pass.
+
+        Behaves like awaiting :meth:`get` for each key without a default,
+        raising :class:`KeyError` for the first missing key.
+        """
+
+        cache = self._cache
+        values: list[Any] = []
+        for key in keys:
+            key_str = key.value if isinstance(key, SettingsKey) else key
+            try:
+                values.append(cache[key_str])
+            except KeyError:
+                raise KeyError(key_str) from None
+        return values
+
     async def set(self, key: SettingsKey | str, value: Any) -> None:
         """Persist ``value`` for ``key`` and update the cache.
 
@@ -249,6 +290,7 @@ class SystemConfig:
             await self.adapter.save(existing)
 
         self._cache[key_str] = casted
+        self._version += 1
 
     def exists(self, key: SettingsKey | str) -> bool:
         """Return ``True`` if ``key`` is present in the cache."""
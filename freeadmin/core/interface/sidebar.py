@@ -116,11 +116,9 @@ class SidebarBuilder:
         orm_prefix = system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm")
         settings_prefix = system_config.get_cached(SettingsKey.SETTINGS_PREFIX, "/settings")
         apps: Dict[str, List[Dict[str, Any]]] = {}
-        for entry in admin_site.registry.view_entries:
-            if settings and not entry.settings:
-                continue
-            if not settings and entry.settings:
-                continue
+        registry = admin_site.registry
+        entries = registry.iter_settings() if settings else registry.iter_orm()
+        for entry in entries:
             arr = apps.setdefault(entry.app, [])
             admin = admin_site.model_reg.get((entry.app.lower(), entry.model.lower()))
             display = (
@@ -14,7 +14,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, List, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Mapping, Sequence, TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, Request, UploadFile, File, HTTPException, Form, status
 from fastapi.responses import HTMLResponse, StreamingResponse
@@ -90,8 +90,11 @@ class AdminSite(IconPathMixin):
         self.templates = templates
         # in-process map: dotted content type -> ct_id
         self.ct_map: Dict[str, int] = {}
+        # bumped whenever ``ct_map`` is rebuilt so resolved ids can be reused
+        self.ct_map_version = 0
         self._import_service = ImportService()
         self.pages = PageDescriptorManager(self)
+        self._context_builder = TemplateContextBuilder(self)
         cache_factory = card_cache_class or SQLiteCardCache
         cache_path = getattr(self._settings, "event_cache_path", ":memory:")
         self.card_cache = card_cache or cache_factory(path=cache_path)
@@ -113,6 +116,7 @@ class AdminSite(IconPathMixin):
             slug_source="dashboard",
         )
         self._anonymous_card_cache_key = "anonymous"
+        self._brand_icon_cache: tuple[int, str] | None = None
         self._register_permission_invalidation_hook()
 
     @property
@@ -127,16 +131,20 @@ class AdminSite(IconPathMixin):
     @property
     def brand_icon(self) -> str:
         """Return URL to the brand icon."""
-        icon_path = system_config.get_cached(
-            SettingsKey.BRAND_ICON, self._settings.brand_icon
-        )
-        prefix = system_config.get_cached(
-            SettingsKey.ADMIN_PREFIX, self._settings.admin_path
-        )
-        static_segment = system_config.get_cached(
-            SettingsKey.STATIC_URL_SEGMENT, self._settings.static_url_segment
+        version = system_config.version
+        cached = self._brand_icon_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        icon_path, prefix, static_segment = system_config.get_cached_many(
+            (
+                (SettingsKey.BRAND_ICON, self._settings.brand_icon),
+                (SettingsKey.ADMIN_PREFIX, self._settings.admin_path),
+                (SettingsKey.STATIC_URL_SEGMENT, self._settings.static_url_segment),
+            )
         )
-        return self._resolve_icon_path(icon_path, prefix, static_segment)
+        url = self._resolve_icon_path(icon_path, prefix, static_segment)
+        self._brand_icon_cache = (version, url)
+        return url
 
     def get_locale(self, request: Request | None = None) -> str:
         """Return locale token derived from ``request`` headers or defaults."""
@@ -347,6 +355,7 @@ class AdminSite(IconPathMixin):
             self.ct_map[dotted] = ct.id
 
         self.ct_map.clear()
+        self.ct_map_version += 1
         seen: set[str] = set()
 
         try:
@@ -388,6 +397,7 @@ class AdminSite(IconPathMixin):
             if self._migration_error_classifier.is_missing_schema(exc):
                 system_config.flag_migrations_required()
                 self.ct_map.clear()
+                self.ct_map_version += 1
                 logger.error(
                     "Skipping admin content type synchronisation due to database error: %s. "
                     "Run your migrations before starting FreeAdmin.",
@@ -445,10 +455,11 @@ class AdminSite(IconPathMixin):
         app_label: str | None = None,
         model_name: str | None = None,
         is_settings: bool | None = None,
-        extra: Dict[str, Any] | None = None,
+        extra: Mapping[str, Any] | None = None,
+        menu: Sequence[Any] | None = None,
     ) -> Dict[str, Any]:
         """Build base template context for admin pages."""
-        return TemplateContextBuilder(self).build(
+        return self._context_builder.build(
             request,
             user,
             page_title=page_title,
@@ -456,6 +467,7 @@ class AdminSite(IconPathMixin):
             model_name=model_name,
             is_settings=is_settings,
             extra=extra,
+            menu=menu,
         )
 
     def get_sidebar_views(self, *, settings: bool) -> List[tuple[str, List[Dict[str, Any]]]]:
@@ -801,8 +813,8 @@ class AdminSite(IconPathMixin):
                 extra={
                     "migration_message": "Run your migrations before starting FreeAdmin.",
                 },
+                menu=[],
             )
-            ctx["menu"] = []
             return templates.TemplateResponse(
                 "pages/migrations_required.html", ctx, status_code=503
             )
@@ -857,6 +869,9 @@ class AdminSite(IconPathMixin):
             dash_title = await system_config.get(SettingsKey.DASHBOARD_PAGE_TITLE)
             orm_user = getattr(request.state, "user", None)
             card_entries = await self.get_registered_cards(user=orm_user)
+            menu = await self.menu_builder.build_main_menu_async(
+                locale=self.get_locale(request)
+            )
             ctx = self.build_template_ctx(
                 request,
                 user,
@@ -865,9 +880,7 @@ class AdminSite(IconPathMixin):
                     "card_entries": card_entries,
                     "cards": card_entries,
                 },
-            )
-            ctx["menu"] = self.menu_builder.build_main_menu(
-                locale=self.get_locale(request)
+                menu=menu,
             )
             return templates.TemplateResponse("pages/dashboard.html", ctx)
 
@@ -986,10 +999,6 @@ class AdminSite(IconPathMixin):
                 ),
                 _=Depends(perm_export),
                 admin=admin,
-                export_service: ExportService = Depends(lambda: export_service),
-                scope_query_service: ScopeQueryService = Depends(
-                    lambda: scope_query_service
-                ),
             ) -> Dict[str, Any]:
                 request.state.user_dto = user
                 if not (user.is_superuser or admin.has_export_perm(request)):
@@ -1024,10 +1033,6 @@ class AdminSite(IconPathMixin):
                 ),
                 _=Depends(perm_export),
                 admin=admin,
-                export_service: ExportService = Depends(lambda: export_service),
-                scope_query_service: ScopeQueryService = Depends(
-                    lambda: scope_query_service
-                ),
             ) -> Dict[str, Any]:
                 request.state.user_dto = user
                 if not (user.is_superuser or admin.has_export_perm(request)):
@@ -1066,7 +1071,6 @@ class AdminSite(IconPathMixin):
                 ),
                 _=Depends(perm_export),
                 admin=admin,
-                export_service: ExportService = Depends(lambda: export_service),
             ) -> StreamingResponse:
                 request.state.user_dto = user
                 if not (user.is_superuser or admin.has_export_perm(request)):
@@ -1139,10 +1143,8 @@ class AdminSite(IconPathMixin):
                 ),
                 _=Depends(perm_import),
                 admin=admin,
-                import_service: ImportService = Depends(
-                    lambda: self._import_service
-                ),
             ) -> Dict[str, Any]:
+                import_service = self._import_service
                 request.state.user_dto = user
                 if not admin.has_import_perm(request):
                     raise HTTPException(
@@ -1161,10 +1163,8 @@ class AdminSite(IconPathMixin):
                 ),
                 _=Depends(perm_import),
                 admin=admin,
-                import_service: ImportService = Depends(
-                    lambda: self._import_service
-                ),
             ) -> Dict[str, Any]:
+                import_service = self._import_service
                 request.state.user_dto = user
                 if not admin.has_import_perm(request):
                     raise HTTPException(
@@ -1254,10 +1254,6 @@ class AdminSite(IconPathMixin):
                 ),
                 _=Depends(perm_export),
                 admin=admin,
-                export_service: ExportService = Depends(lambda: export_service),
-                scope_query_service: ScopeQueryService = Depends(
-                    lambda: scope_query_service
-                ),
             ) -> Dict[str, Any]:
                 request.state.user_dto = user
                 if not (user.is_superuser or admin.has_export_perm(request)):
@@ -1292,10 +1288,6 @@ class AdminSite(IconPathMixin):
                 ),
                 _=Depends(perm_export),
                 admin=admin,
-                export_service: ExportService = Depends(lambda: export_service),
-                scope_query_service: ScopeQueryService = Depends(
-                    lambda: scope_query_service
-                ),
             ) -> Dict[str, Any]:
                 request.state.user_dto = user
                 if not (user.is_superuser or admin.has_export_perm(request)):
@@ -1334,7 +1326,6 @@ class AdminSite(IconPathMixin):
                 ),
                 _=Depends(perm_export),
                 admin=admin,
-                export_service: ExportService = Depends(lambda: export_service),
             ) -> StreamingResponse:
                 request.state.user_dto = user
                 if not (user.is_superuser or admin.has_export_perm(request)):
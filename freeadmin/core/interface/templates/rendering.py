@@ -11,7 +11,8 @@ Email: timurkady@yandex.com
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from threading import Lock
+from typing import Any, Mapping, NamedTuple
 
 from fastapi import Request
 from fastapi.responses import HTMLResponse
@@ -26,6 +27,7 @@ class TemplateRenderer:
     """Provide cached access to FreeAdmin templates for public pages."""
 
     _service: TemplateService | None = template_service_module.DEFAULT_TEMPLATE_SERVICE
+    _service_lock = Lock()
 
     @classmethod
     def configure(cls, service: TemplateService) -> None:
@@ -37,13 +39,17 @@ class TemplateRenderer:
     def get_service(cls) -> TemplateService:
         """Return the template service backing the renderer."""
 
-        if cls._service is None:
-            default_service = template_service_module.DEFAULT_TEMPLATE_SERVICE
-            if default_service is not None:
-                cls._service = default_service
-            else:
-                cls._service = TemplateService()
-        return cls._service
+        service = cls._service
+        if service is not None:
+            return service
+        with cls._service_lock:
+            service = cls._service
+            if service is None:
+                service = template_service_module.DEFAULT_TEMPLATE_SERVICE
+                if service is None:
+                    service = TemplateService()
+                cls._service = service
+        return service
 
     @classmethod
     def render(
@@ -55,18 +61,43 @@ class TemplateRenderer:
     ) -> HTMLResponse:
         """Render ``template_name`` with ``context`` using FreeAdmin templates."""
 
-        final_context = dict(context)
+        return cls._render_owned(template_name, dict(context), request=request)
+
+    @classmethod
+    def _render_owned(
+        cls,
+        template_name: str,
+        payload: dict[str, Any],
+        *,
+        request: Request | None = None,
+    ) -> HTMLResponse:
+        """Render ``payload`` in place; the caller must own the dictionary."""
+
         if request is not None:
-            final_context.setdefault("request", request)
-        if "request" not in final_context:
+            payload.setdefault("request", request)
+        if "request" not in payload:
             raise ValueError("Template context must include a 'request' key.")
         templates = cls.get_service().get_templates()
-        return templates.TemplateResponse(template_name, final_context)
+        return templates.TemplateResponse(template_name, payload)
+
+
+class _PageDefaults(NamedTuple):
+    """Settings-derived values shared by every page rendered by the responder."""
+
+    admin_prefix: str
+    public_prefix: str
+    orm_prefix: str
+    settings_prefix: str
+    views_prefix: str
+    site_title: Any
+    brand_icon: Any
 
 
 class PageTemplateResponder:
     """Render FreeAdmin page templates with standardised context defaults."""
 
+    _defaults_cache: tuple[int, Any, Any, _PageDefaults] | None = None
+
     @classmethod
     def render(
         cls,
@@ -89,28 +120,14 @@ class PageTemplateResponder:
         for key, value in defaults.items():
             payload.setdefault(key, value)
 
-        return TemplateRenderer.render(template_name, payload, request=request)
+        return TemplateRenderer._render_owned(template_name, payload, request=request)
 
     @classmethod
     def _build_default_context(cls, request: Request) -> dict[str, Any]:
         admin_site = getattr(getattr(request.app, "state", object()), "admin_site", None)
-        settings_obj = getattr(admin_site, "_settings", None)
-        if settings_obj is None:
-            settings_obj = current_settings()
-
-        admin_prefix = cls._normalize_prefix(
-            system_config.get_cached(
-                SettingsKey.ADMIN_PREFIX,
-                getattr(settings_obj, "admin_path", "/admin"),
-            )
-        )
-        public_prefix = cls._normalize_prefix(
-            system_config.get_cached(SettingsKey.PUBLIC_PREFIX, "/"),
-            allow_root=True,
-        )
-        orm_prefix = system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm")
-        settings_prefix = system_config.get_cached(SettingsKey.SETTINGS_PREFIX, "/settings")
-        views_prefix = system_config.get_cached(SettingsKey.VIEWS_PREFIX, "/views")
+        defaults = cls._resolve_page_defaults(admin_site)
+        admin_prefix = defaults.admin_prefix
+        public_prefix = defaults.public_prefix
 
         request_path = request.url.path or "/"
         is_admin_request = cls._is_admin_request(request_path, admin_prefix)
@@ -118,21 +135,11 @@ class PageTemplateResponder:
         if not active_prefix:
             active_prefix = "/"
 
-        if admin_site is not None:
-            site_title = admin_site.title
-            brand_icon = admin_site.brand_icon
-            menu_builder = getattr(admin_site, "public_menu_builder", None)
-        else:
-            site_title = system_config.get_cached(
-                SettingsKey.DEFAULT_ADMIN_TITLE,
-                getattr(settings_obj, "admin_site_title", "FreeAdmin"),
-            )
-            brand_icon = system_config.get_cached(
-                SettingsKey.BRAND_ICON,
-                getattr(settings_obj, "brand_icon", None),
-            )
-            menu_builder = None
-
+        menu_builder = (
+            getattr(admin_site, "public_menu_builder", None)
+            if admin_site is not None
+            else None
+        )
         public_menu = []
         if menu_builder is not None:
             public_menu = menu_builder.build_menu(prefix=public_prefix)
@@ -142,16 +149,67 @@ class PageTemplateResponder:
             "admin_prefix": admin_prefix or "/",
             "public_prefix": public_prefix or "/",
             "is_admin_request": is_admin_request,
-            "ORM_PREFIX": orm_prefix,
-            "SETTINGS_PREFIX": settings_prefix,
-            "VIEWS_PREFIX": views_prefix,
-            "site_title": site_title,
-            "brand_icon": brand_icon,
+            "ORM_PREFIX": defaults.orm_prefix,
+            "SETTINGS_PREFIX": defaults.settings_prefix,
+            "VIEWS_PREFIX": defaults.views_prefix,
+            "site_title": defaults.site_title,
+            "brand_icon": defaults.brand_icon,
             "assets": {"css": [], "js": []},
             "system_config": system_config,
             "public_menu": public_menu,
         }
 
+    @classmethod
+    def _resolve_page_defaults(cls, admin_site: Any) -> _PageDefaults:
+        """Return settings-derived defaults cached per configuration version."""
+
+        settings_obj = getattr(admin_site, "_settings", None)
+        if settings_obj is None:
+            settings_obj = current_settings()
+        version = system_config.version
+        cached = cls._defaults_cache
+        if (
+            cached is not None
+            and cached[0] == version
+            and cached[1] is settings_obj
+            and cached[2] is admin_site
+        ):
+            return cached[3]
+
+        if admin_site is not None:
+            site_title = admin_site.title
+            brand_icon = admin_site.brand_icon
+        else:
+            site_title = system_config.get_cached(
+                SettingsKey.DEFAULT_ADMIN_TITLE,
+                getattr(settings_obj, "admin_site_title", "FreeAdmin"),
+            )
+            brand_icon = system_config.get_cached(
+                SettingsKey.BRAND_ICON,
+                getattr(settings_obj, "brand_icon", None),
+            )
+        defaults = _PageDefaults(
+            admin_prefix=cls._normalize_prefix(
+                system_config.get_cached(
+                    SettingsKey.ADMIN_PREFIX,
+                    getattr(settings_obj, "admin_path", "/admin"),
+                )
+            ),
+            public_prefix=cls._normalize_prefix(
+                system_config.get_cached(SettingsKey.PUBLIC_PREFIX, "/"),
+                allow_root=True,
+            ),
+            orm_prefix=system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm"),
+            settings_prefix=system_config.get_cached(
+                SettingsKey.SETTINGS_PREFIX, "/settings"
+            ),
+            views_prefix=system_config.get_cached(SettingsKey.VIEWS_PREFIX, "/views"),
+            site_title=site_title,
+            brand_icon=brand_icon,
+        )
+        cls._defaults_cache = (version, settings_obj, admin_site, defaults)
+        return defaults
+
     @staticmethod
     def _normalize_prefix(value: str | None, *, allow_root: bool = False) -> str:
         """Return a normalised prefix ensuring a leading slash."""
@@ -110,19 +110,39 @@ class TemplateService:
     def add_template_directory(self, directory: str | Path) -> None:
         """Ensure ``directory`` is part of the template search path."""
 
-        normalized = str(directory)
-        if normalized in self._template_dirs:
+        self.add_template_directories((directory,))
+
+    def add_template_directories(
+        self, directories: Iterable[str | Path]
+    ) -> None:
+        """Append every missing entry of ``directories`` to the search path.
+
+        Duplicates are filtered in a single pass and the Jinja loader is
+        reconfigured at most once, regardless of how many paths are added.
+        """
+
+        known = set(self._template_dirs)
+        added: list[str] = []
+        for directory in directories:
+            normalized = str(directory)
+            if normalized in known:
+                continue
+            known.add(normalized)
+            added.append(normalized)
+        if not added:
             return
-        self._template_dirs.append(normalized)
+        self._template_dirs.extend(added)
         if self._provider is not None:
-            self._provider.add_template_directory(normalized)
+            self._provider.add_template_directories(added)
         if self._templates is not None:
             loader = self._templates.env.loader
             if hasattr(loader, "searchpath"):
                 search_paths = list(getattr(loader, "searchpath", []))
-                if normalized not in search_paths:
-                    search_paths.append(normalized)
-                    loader.searchpath = search_paths  # type: ignore[attr-defined]
+                present = set(search_paths)
+                search_paths.extend(
+                    path for path in added if path not in present
+                )
+                loader.searchpath = search_paths  # type: ignore[attr-defined]
 
     @staticmethod
     def _coerce_template_dirs(
@@ -130,9 +150,13 @@ class TemplateService:
     ) -> list[str]:
         """Normalise ``templates_dir`` into a mutable list of search paths."""
 
+        if type(templates_dir) is str:
+            return [templates_dir]
+        # Concrete paths are ``PosixPath``/``WindowsPath`` instances, so they
+        # still need the ``isinstance`` check rather than an exact type test.
         if isinstance(templates_dir, (str, Path)):
             return [str(templates_dir)]
-        return [str(path) for path in templates_dir]
+        return list(map(str, templates_dir))
 
 
 DEFAULT_TEMPLATE_SERVICE: TemplateService | None = None
@@ -10,6 +10,10 @@ Email: timurkady@yandex.com
 """
 
 from __future__ import annotations
+
+from time import monotonic
+from typing import Any, NamedTuple
+
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
@@ -19,16 +23,59 @@ from ..configuration.conf import (
     current_settings,
     register_settings_observer,
 )
+from ..interface.services.auth import AuthService
 from ..interface.settings import SettingsKey, system_config
 
 
+_UNSET = object()
+
+_GUARD_SETTINGS = (
+    SettingsKey.LOGIN_PATH,
+    SettingsKey.LOGOUT_PATH,
+    SettingsKey.SETUP_PATH,
+    SettingsKey.STATIC_PATH,
+    SettingsKey.MIGRATIONS_PATH,
+    SettingsKey.SESSION_KEY,
+)
+_GUARD_LOOKUPS = tuple((key, _UNSET) for key in _GUARD_SETTINGS)
+
+
+class _GuardPaths(NamedTuple):
+    """Settings consulted by the guard on every admin request."""
+
+    login_path: str
+    logout_path: str
+    setup_path: str
+    static_path: str
+    migrations_path: str
+    session_key: str
+
+    @property
+    def public_prefixes(self) -> tuple[str, ...]:
+        """Return path prefixes reachable without a session."""
+
+        return (
+            self.login_path,
+            self.logout_path,
+            self.setup_path,
+            self.static_path,
+            self.migrations_path,
+        )
+
+
 class AdminGuardMiddleware(BaseHTTPMiddleware):
     """Global guard for the admin interface.
 
     Performs 307 redirects to /<prefix>/setup if no superuser exists
     and to /<prefix>/login if there is no valid session.
+
+    A found superuser is remembered until :meth:`invalidate_superuser_cache`
+    is called; a negative answer is re-checked at most once per
+    ``superuser_recheck_interval`` seconds.
     """
 
+    superuser_recheck_interval = 5.0
+
     def __init__(
         self,
         app,
@@ -47,61 +94,44 @@ class AdminGuardMiddleware(BaseHTTPMiddleware):
         self._migrations_path: str | None = None
         self._session_key: str | None = None
         self._has_superuser: bool | None = None
+        self._superuser_checked_at = 0.0
+        self._superuser_checked_generation = -1
+        self._paths: _GuardPaths | None = None
+        self._public_prefixes: tuple[str, ...] = ()
+        self._migration_prefixes: tuple[str, ...] = ()
         register_settings_observer(self._apply_settings)
 
     async def dispatch(
         self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
-        from freeadmin.core.boot import admin as boot_admin
-
-        path = request.url.path
+        # ``scope["path"]`` is what ``request.url.path`` would parse out of a
+        # freshly assembled URL, so read it directly on this hot path.
+        path = request.scope["path"]
         if not path.startswith(self.prefix):
             return await call_next(request)
 
-        rel = path[len(self.prefix) :] or "/"
+        rel = path.removeprefix(self.prefix) or "/"
 
-        login_path = await system_config.get_or_default(SettingsKey.LOGIN_PATH)
-        logout_path = await system_config.get_or_default(SettingsKey.LOGOUT_PATH)
-        setup_path = await system_config.get_or_default(SettingsKey.SETUP_PATH)
-        static_path = await system_config.get_or_default(SettingsKey.STATIC_PATH)
-        migrations_path = await system_config.get_or_default(
-            SettingsKey.MIGRATIONS_PATH
-        )
-        session_key = await system_config.get_or_default(SettingsKey.SESSION_KEY)
+        paths = await self._resolve_paths()
+        login_path = paths.login_path
+        setup_path = paths.setup_path
 
-        # Persist the most recently observed values for debugging and tests.
-        self._login_path = login_path
-        self._logout_path = logout_path
-        self._setup_path = setup_path
-        self._static_path = static_path
-        self._migrations_path = migrations_path
-        self._session_key = session_key
-
-        if system_config.migrations_required and not (
-            rel.startswith(migrations_path) or rel.startswith(static_path)
+        if system_config.migrations_required and not rel.startswith(
+            self._migration_prefixes
         ):
             return RedirectResponse(
-                f"{self.prefix}{migrations_path}", status_code=307
+                f"{self.prefix}{paths.migrations_path}", status_code=307
             )
 
-        if (
-            rel.startswith(login_path)
-            or rel.startswith(logout_path)
-            or rel.startswith(setup_path)
-            or rel.startswith(static_path)
-            or rel.startswith(migrations_path)
-        ):
+        if rel.startswith(self._public_prefixes):
             return await call_next(request)
 
-        if self._has_superuser is not True:
-            qs = boot_admin.adapter.filter(
-                boot_admin.adapter.user_model, is_staff=True, is_superuser=True
-            )
-            self._has_superuser = await boot_admin.adapter.exists(qs)
-        if not self._has_superuser:
+        from freeadmin.core.boot import admin as boot_admin
+
+        if not await self._superuser_exists(boot_admin.adapter):
             return RedirectResponse(f"{self.prefix}{setup_path}", status_code=307)
 
-        user_id = request.session.get(session_key)
+        user_id = request.session.get(paths.session_key)
         if not user_id:
             return RedirectResponse(f"{self.prefix}{login_path}", status_code=307)
 
@@ -114,6 +144,56 @@ class AdminGuardMiddleware(BaseHTTPMiddleware):
         request.state.user = user
         return await call_next(request)
 
+    @classmethod
+    def invalidate_superuser_cache(cls) -> None:
+        """Make every guard and the setup routes re-query superuser existence."""
+
+        AuthService.invalidate_superuser_cache()
+
+    async def _superuser_exists(self, adapter: Any) -> bool:
+        """Return whether a staff superuser exists, using the cached answer."""
+
+        generation = AuthService.superuser_generation()
+        if self._superuser_checked_generation == generation:
+            if self._has_superuser:
+                return True
+            elapsed = monotonic() - self._superuser_checked_at
+            if elapsed < self.superuser_recheck_interval:
+                return False
+        qs = adapter.filter(adapter.user_model, is_staff=True, is_superuser=True)
+        self._has_superuser = await adapter.exists(qs)
+        self._superuser_checked_at = monotonic()
+        self._superuser_checked_generation = generation
+        return self._has_superuser
+
+    async def _resolve_paths(self) -> _GuardPaths:
+        """Return guard paths, rebuilding prefix tuples only when they change.
+
+        Values are read synchronously from the settings cache; missing keys
+        fall back to :meth:`system_config.get_or_default`, which seeds them.
+        """
+
+        values = system_config.get_cached_many(_GUARD_LOOKUPS)
+        if _UNSET in values:
+            values = [
+                await system_config.get_or_default(key) for key in _GUARD_SETTINGS
+            ]
+        paths = self._paths
+        if paths is not None and list(paths) == values:
+            return paths
+        paths = _GuardPaths(*values)
+        self._paths = paths
+        self._public_prefixes = paths.public_prefixes
+        self._migration_prefixes = (paths.migrations_path, paths.static_path)
+        # Persist the most recently observed values for debugging and tests.
+        self._login_path = paths.login_path
+        self._logout_path = paths.logout_path
+        self._setup_path = paths.setup_path
+        self._static_path = paths.static_path
+        self._migrations_path = paths.migrations_path
+        self._session_key = paths.session_key
+        return paths
+
     def _apply_settings(self, settings: FreeAdminSettings) -> None:
         """Refresh cached prefix and settings after reconfiguration."""
         self._settings = settings
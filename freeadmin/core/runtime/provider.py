@@ -11,13 +11,22 @@ Email: timurkady@yandex.com
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import mimetypes
 from pathlib import Path
 from typing import Iterable
 
-from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, Response
 from fastapi.templating import Jinja2Templates
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+)
+from jinja2.bccache import Bucket
 from starlette.staticfiles import StaticFiles
 
 from ..configuration.conf import FreeAdminSettings, current_settings
@@ -26,9 +35,47 @@ from ..interface.settings import SettingsKey, system_config
 
 logger = logging.getLogger(__name__)
 
+
+class SharedBytecodeCache(BytecodeCache):
+    """Keep compiled template code in memory for every environment.
+
+    Buckets are keyed by template name and file path and carry a checksum
+    of the source, so edited templates are still recompiled.
+    """
+
+    def __init__(self) -> None:
+        """Start with an empty in-process store."""
+
+        self._store: dict[str, bytes] = {}
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Fill ``bucket`` from the store when an entry exists."""
+
+        data = self._store.get(bucket.key)
+        if data is not None:
+            bucket.bytecode_from_string(data)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Remember the compiled code held by ``bucket``."""
+
+        self._store[bucket.key] = bucket.bytecode_to_string()
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+
+        self._store.clear()
+
+
+TEMPLATE_BYTECODE_CACHE = SharedBytecodeCache()
+
+
 class TemplateProvider:
     """Encapsulates template and static file handling."""
 
+    # Favicons up to this size are read once and served from memory.
+    FAVICON_INLINE_LIMIT = 64 * 1024
+    FAVICON_CACHE_CONTROL = "public, max-age=86400"
+
     def __init__(
         self,
         *,
@@ -41,13 +88,32 @@ class TemplateProvider:
         self._template_dirs = self._coerce_template_dirs(templates_dir)
         self.static_dir = str(static_dir)
         self._settings = settings or current_settings()
+        self._templates: Jinja2Templates | None = None
 
     def get_templates(self) -> Jinja2Templates:
-        """Return a configured ``Jinja2Templates`` instance."""
-        templates = Jinja2Templates(directory=list(self._template_dirs))
+        """Return the provider's ``Jinja2Templates``, building it on first use."""
+        if self._templates is not None:
+            return self._templates
+        env = Environment(
+            loader=FileSystemLoader(list(self._template_dirs)),
+            autoescape=True,
+            cache_size=-1,
+            bytecode_cache=self._bytecode_cache(),
+        )
+        templates = Jinja2Templates(env=env)
         templates.env.globals["settings"] = self._settings
+        self._templates = templates
         return templates
 
+    def _bytecode_cache(self) -> BytecodeCache:
+        """Return the on-disk cache when configured, else the shared one."""
+
+        directory = getattr(self._settings, "template_bytecode_cache_dir", None)
+        if not directory:
+            return TEMPLATE_BYTECODE_CACHE
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(directory=str(directory), pattern="%s.cache")
+
     @property
     def template_directories(self) -> tuple[str, ...]:
         """Return template directories available to the provider."""
@@ -57,9 +123,32 @@ class TemplateProvider:
     def add_template_directory(self, directory: str | Path) -> None:
         """Include ``directory`` in the template search path if missing."""
 
-        normalized = str(directory)
-        if normalized not in self._template_dirs:
-            self._template_dirs.append(normalized)
+        self.add_template_directories((directory,))
+
+    def add_template_directories(
+        self, directories: Iterable[str | Path]
+    ) -> None:
+        """Include every missing entry of ``directories`` in one pass."""
+
+        known = set(self._template_dirs)
+        added: list[str] = []
+        for directory in directories:
+            normalized = str(directory)
+            if normalized not in known:
+                known.add(normalized)
+                added.append(normalized)
+        if not added:
+            return
+        self._template_dirs.extend(added)
+        # Extend the live loader instead of rebuilding so holders of the
+        # cached environment keep its compiled templates.
+        if self._templates is not None:
+            loader = self._templates.env.loader
+            if isinstance(loader, FileSystemLoader):
+                loader.searchpath = [
+                    *loader.searchpath,
+                    *(path for path in added if path not in loader.searchpath),
+                ]
 
     @staticmethod
     def _coerce_template_dirs(
@@ -69,18 +158,18 @@ class TemplateProvider:
 
         if isinstance(templates_dir, (str, Path)):
             return [str(templates_dir)]
-        return [str(path) for path in templates_dir]
+        return list(map(str, templates_dir))
 
     def mount_static(self, app: FastAPI, prefix: str) -> None:
         """Mount static files onto the provided application."""
 
-        static_segment = system_config.get_cached(
-            SettingsKey.STATIC_URL_SEGMENT, self._settings.static_url_segment
+        static_segment, route_name = system_config.get_cached_many(
+            (
+                (SettingsKey.STATIC_URL_SEGMENT, self._settings.static_url_segment),
+                (SettingsKey.STATIC_ROUTE_NAME, self._settings.static_route_name),
+            )
         )
         sanitized_segment = self._normalize_static_segment(static_segment)
-        route_name = system_config.get_cached(
-            SettingsKey.STATIC_ROUTE_NAME, self._settings.static_route_name
-        )
         app.mount(
             sanitized_segment,
             StaticFiles(
@@ -126,11 +215,29 @@ class TemplateProvider:
                 )
             return
 
-        favicon = str(favicon_path)
+        media_type = mimetypes.guess_type(favicon_path.name)[0] or "image/x-icon"
+        if favicon_path.stat().st_size > self.FAVICON_INLINE_LIMIT:
+            favicon = str(favicon_path)
+
+            @app.get("/favicon.ico", include_in_schema=False)
+            async def favicon_file_route() -> FileResponse:
+                return FileResponse(
+                    favicon,
+                    media_type=media_type,
+                    headers={"Cache-Control": self.FAVICON_CACHE_CONTROL},
+                )
+
+            return
+
+        data = favicon_path.read_bytes()
+        etag = f'"{hashlib.md5(data, usedforsecurity=False).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": self.FAVICON_CACHE_CONTROL}
 
         @app.get("/favicon.ico", include_in_schema=False)
-        async def favicon_route() -> FileResponse:  # pragma: no cover - simple file response
-            return FileResponse(favicon)
+        async def favicon_route(request: Request) -> Response:
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            return Response(data, media_type=media_type, headers=headers)
 
     def _resolve_favicon_path(self, configured: str | Path | None) -> Path | None:
         """Return the filesystem path for the configured favicon if present."""
@@ -165,16 +272,15 @@ class TemplateProvider:
 
     def mount_media(self, app: FastAPI) -> None:
         """Mount uploaded media files onto the application."""
-        media_root = Path(
-            system_config.get_cached(
-                SettingsKey.MEDIA_ROOT, str(self._settings.media_root)
+        configured_root, media_url = system_config.get_cached_many(
+            (
+                (SettingsKey.MEDIA_ROOT, str(self._settings.media_root)),
+                (SettingsKey.MEDIA_URL, self._settings.media_url),
             )
-        ).resolve()
+        )
+        media_root = Path(configured_root).resolve()
         media_root.mkdir(parents=True, exist_ok=True)
 
-        media_url = system_config.get_cached(
-            SettingsKey.MEDIA_URL, self._settings.media_url
-        )
         media_prefix = "/" + str(media_url).strip("/")
 
         app.mount(
@@ -113,4 +113,69 @@ def test_mount_favicon_resolves_packaged_static(monkeypatch, tmp_path) -> None:
     assert len(response.content) > 0
 
 
+def test_mount_favicon_serves_cached_bytes_with_etag(monkeypatch, tmp_path) -> None:
+    """Small favicons are read once and revalidated through their ETag."""
+
+    favicon_file = tmp_path / "cached.ico"
+    favicon_file.write_bytes(b"cached icon bytes")
+
+    def fake_get_cached(key, default):
+        if key == SettingsKey.FAVICON_PATH:
+            return str(favicon_file)
+        return default
+
+    monkeypatch.setattr(system_config, "get_cached", fake_get_cached)
+
+    provider = TemplateProvider(
+        templates_dir=[tmp_path],
+        static_dir=tmp_path,
+        settings=FreeAdminSettings(),
+    )
+    app = FastAPI()
+
+    provider.mount_favicon(app)
+    favicon_file.unlink()
+
+    client = TestClient(app)
+    response = client.get("/favicon.ico")
+    assert response.status_code == 200
+    assert response.content == b"cached icon bytes"
+    assert response.headers["cache-control"] == provider.FAVICON_CACHE_CONTROL
+    etag = response.headers["etag"]
+
+    revalidated = client.get("/favicon.ico", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_mount_favicon_streams_large_files(monkeypatch, tmp_path) -> None:
+    """Favicons above the inline limit keep being served from disk."""
+
+    favicon_file = tmp_path / "large.ico"
+    favicon_file.write_bytes(b"large icon bytes")
+
+    def fake_get_cached(key, default):
+        if key == SettingsKey.FAVICON_PATH:
+            return str(favicon_file)
+        return default
+
+    monkeypatch.setattr(system_config, "get_cached", fake_get_cached)
+    monkeypatch.setattr(TemplateProvider, "FAVICON_INLINE_LIMIT", 4)
+
+    provider = TemplateProvider(
+        templates_dir=[tmp_path],
+        static_dir=tmp_path,
+        settings=FreeAdminSettings(),
+    )
+    app = FastAPI()
+
+    provider.mount_favicon(app)
+    favicon_file.write_bytes(b"updated icon bytes")
+
+    client = TestClient(app)
+    response = client.get("/favicon.ico")
+    assert response.status_code == 200
+    assert response.content == b"updated icon bytes"
+
+
 # The End
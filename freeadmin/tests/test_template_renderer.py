@@ -99,6 +99,29 @@ def test_template_renderer_uses_shared_service_cache() -> None:
         TemplateRenderer.configure(original_service)
 
 
+def test_template_renderer_copies_only_caller_owned_contexts() -> None:
+    """Public ``render`` protects caller mappings; owned payloads pass through."""
+
+    service = TemplateService(provider_cls=TrackingProvider)
+    original_service = TemplateRenderer.get_service()
+    TemplateRenderer.configure(service)
+
+    try:
+        request = object()
+        context = {"message": "hello"}
+        TemplateRenderer.render("welcome.html", context, request=request)
+        assert context == {"message": "hello"}
+
+        payload = {"message": "owned"}
+        TemplateRenderer._render_owned("welcome.html", payload, request=request)
+        calls = service.get_provider().templates.calls
+        assert calls[0][1] is not context
+        assert calls[1][1] is payload
+        assert payload["request"] is request
+    finally:
+        TemplateRenderer.configure(original_service)
+
+
 class TestRouterAggregatorTemplateIntegration:
     """Validate TemplateRenderer configuration within router aggregators."""
 
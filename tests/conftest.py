@@ -12,11 +12,13 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from typing import Any
+from dataclasses import replace
+from typing import Any, Iterator
 
 import pytest
 
 from freeadmin.core.boot import admin as boot_admin
+from freeadmin.core.configuration.conf import configure, current_settings
 from freeadmin.core.interface.settings import system_config
 
 
@@ -34,6 +36,7 @@ class AdminState:
 
         self._boot.reset()
         self._system_config._cache.clear()  # type: ignore[attr-defined]
+        self._system_config._version += 1  # type: ignore[attr-defined]
 
 
 class AsyncioTestPlugin:
@@ -96,6 +99,19 @@ def pytest_configure(config: pytest.Config) -> None:
     _plugin_registrar.configure(config)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_export_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[None]:
+    """Keep the export cache database out of the working directory."""
+
+    original = current_settings()
+    cache_path = tmp_path_factory.mktemp("export-cache") / "export-cache.sqlite3"
+    configure(replace(original, export_cache_path=str(cache_path)))
+    yield
+    configure(original)
+
+
 __all__ = ["admin_state"]
 
 
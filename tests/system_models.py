@@ -10,7 +10,7 @@ Email: timurkady@yandex.com
 
 from __future__ import annotations
 
-from types import SimpleNamespace
+from types import ModuleType, SimpleNamespace
 from typing import Iterable
 
 from freeadmin.contrib.apps.system import (
@@ -52,6 +52,17 @@ class SystemModels:
             for model in self._iterate_models()
         }
 
+    def models_module(self) -> ModuleType:
+        """Return a module object listing the system models for ``Tortoise.init``.
+
+        Passing the module object instead of dotted names keeps Tortoise bound
+        to these classes even when another test module swaps ``sys.modules``.
+        """
+
+        module = ModuleType("tests.system_models.registry")
+        module.__models__ = list(self._iterate_models())  # type: ignore[attr-defined]
+        return module
+
     def _iterate_models(self) -> Iterable[type]:
         """Yield each model class held by the namespace."""
 
@@ -272,6 +272,124 @@ class TestAdminGuardMiddlewareFallback:
 
         system_config.clear_migrations_flag()
 
+    @pytest.mark.asyncio
+    async def test_paths_read_from_cache_without_awaiting_lookups(
+        self, monkeypatch
+    ) -> None:
+        """Seeded settings are read synchronously and prefix tuples are reused."""
+
+        async def _app(scope, receive, send) -> None:  # pragma: no cover - stub
+            """Provide a placeholder ASGI application for the middleware stack."""
+
+            return None
+
+        middleware = AdminGuardMiddleware(_app)
+        system_config._cache.clear()  # type: ignore[attr-defined]
+
+        async def _receive() -> dict[str, Any]:
+            """Provide an empty HTTP request body for the ASGI scope."""
+
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def _call_next(_: Request) -> Response:
+            """Return a no-op response when middleware allows continuation."""
+
+            return Response("ok")
+
+        def _request(path: str) -> Request:
+            scope = {
+                "type": "http",
+                "http_version": "1.1",
+                "method": "GET",
+                "path": path,
+                "root_path": "",
+                "scheme": "http",
+                "server": ("testserver", 80),
+                "headers": [],
+                "query_string": b"",
+                "session": {},
+            }
+            return Request(scope, receive=_receive)
+
+        first = await middleware.dispatch(_request("/admin/login"), _call_next)
+        assert first.status_code == 200
+        prefixes = middleware._public_prefixes
+
+        async def _unexpected(*args: Any, **kwargs: Any) -> Any:
+            raise AssertionError("settings should come from the cache")
+
+        monkeypatch.setattr(system_config, "get_or_default", _unexpected)
+        second = await middleware.dispatch(_request("/admin/"), _call_next)
+        assert second.headers.get("location") == "/admin/setup"
+        assert middleware._public_prefixes is prefixes
+
+        system_config._cache.clear()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_superuser_probe_is_throttled_and_invalidated(monkeypatch) -> None:
+    """Negative probes are throttled; a positive one sticks until invalidated."""
+
+    answers: list[bool] = []
+
+    class ProbeAdapter(AdapterStub):
+        async def exists(self, query: tuple[str, Any, dict[str, Any]]) -> bool:
+            answers.append(True)
+            return len(answers) > 1
+
+    async def _app(scope, receive, send) -> None:  # pragma: no cover - stub
+        return None
+
+    adapter = ProbeAdapter()
+    middleware = AdminGuardMiddleware(_app)
+    clock = [100.0]
+    monkeypatch.setattr(
+        "freeadmin.core.runtime.middleware.monotonic", lambda: clock[0]
+    )
+
+    assert not await middleware._superuser_exists(adapter)
+    assert not await middleware._superuser_exists(adapter)
+    assert len(answers) == 1
+
+    AdminGuardMiddleware.invalidate_superuser_cache()
+    assert await middleware._superuser_exists(adapter)
+    clock[0] += 60
+    assert await middleware._superuser_exists(adapter)
+    assert len(answers) == 2
+
+    AdminGuardMiddleware.invalidate_superuser_cache()
+    assert await middleware._superuser_exists(adapter)
+    assert len(answers) == 3
+
+
+
+@pytest.mark.asyncio
+async def test_non_admin_requests_skip_url_assembly() -> None:
+    """Paths outside the admin prefix pass through using the raw scope path."""
+
+    class NoUrlRequest(Request):
+        @property
+        def url(self):  # type: ignore[override]
+            raise AssertionError("request.url should not be built")
+
+    async def _app(scope, receive, send) -> None:  # pragma: no cover - stub
+        return None
+
+    async def _call_next(_: Request) -> Response:
+        return Response("ok")
+
+    middleware = AdminGuardMiddleware(_app)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/items",
+        "headers": [],
+        "query_string": b"",
+    }
+
+    response = await middleware.dispatch(NoUrlRequest(scope), _call_next)
+    assert response.status_code == 200
+
 
 # The End
 
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""Tests covering the login and setup routes of ``AdminAuthService``."""
+
+from __future__ import annotations
+
+import re
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+from freeadmin.core.interface.auth import admin_auth_service
+from freeadmin.core.interface.services.auth import AuthService, CSRFTokenManager
+from freeadmin.core.interface.settings import SettingsKey, system_config
+from freeadmin.core.interface.templates import TemplateRenderer
+from freeadmin.core.runtime.middleware import AdminGuardMiddleware
+from freeadmin.utils.security.passwords import password_hasher
+
+
+def test_auth_page_context_is_reused_until_settings_change() -> None:
+    """Static login context is rebuilt only when the configuration version moves."""
+
+    first = admin_auth_service._auth_page_context("/admin")
+    assert admin_auth_service._auth_page_context("/admin") is first
+    assert first["prefix"] == "/admin"
+
+    key = SettingsKey.ORM_PREFIX.value
+    original = system_config._cache.get(key)  # type: ignore[attr-defined]
+    system_config._cache[key] = "/orm-changed"  # type: ignore[attr-defined]
+    system_config._version += 1  # type: ignore[attr-defined]
+    try:
+        refreshed = admin_auth_service._auth_page_context("/admin")
+        assert refreshed is not first
+        assert refreshed["ORM_PREFIX"] == "/orm-changed"
+    finally:
+        if original is None:
+            system_config._cache.pop(key, None)  # type: ignore[attr-defined]
+        else:
+            system_config._cache[key] = original  # type: ignore[attr-defined]
+        system_config._version += 1  # type: ignore[attr-defined]
+
+
+def test_login_form_renders_with_fresh_csrf_token() -> None:
+    """The login page combines cached settings with per-request values."""
+
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test")
+    service = TemplateRenderer.get_service()
+    service.mount_static_resources(app, "/admin")
+    templates = service.get_templates()
+    app.include_router(admin_auth_service.build_auth_router(templates))
+    login_path = system_config.get_cached(SettingsKey.LOGIN_PATH, "/login")
+
+    with TestClient(app) as client:
+        first = client.get(login_path)
+        second = client.get(login_path)
+
+    assert first.status_code == second.status_code == 200
+    assert 'name="csrf_token"' in first.text
+    assert admin_auth_service.site_title in first.text
+
+
+def test_login_form_body_is_reused_with_new_token() -> None:
+    """Repeated GETs splice a fresh token into one pre-rendered body."""
+
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test")
+    service = TemplateRenderer.get_service()
+    service.mount_static_resources(app, "/admin")
+    app.include_router(admin_auth_service.build_auth_router(service.get_templates()))
+    login_path = system_config.get_cached(SettingsKey.LOGIN_PATH, "/login")
+
+    with TestClient(app) as client:
+        first = client.get(login_path)
+        client.cookies.clear()
+        second = client.get(login_path)
+
+    pattern = re.compile(r'name="csrf_token" value="([^"]+)"')
+    first_token = pattern.search(first.text).group(1)
+    second_token = pattern.search(second.text).group(1)
+    assert first_token != second_token
+    assert "__FREEADMIN_CSRF_TOKEN__" not in first.text
+    assert first.text.replace(first_token, "") == second.text.replace(
+        second_token, ""
+    )
+
+
+def test_csrf_tokens_round_trip_and_reject_tampering() -> None:
+    """Only the exact token stored in the session validates."""
+
+    manager = CSRFTokenManager("secret")
+    request = SimpleNamespace(session={})
+    token = manager.generate(request)
+
+    assert manager.validate(request, token)
+    tampered = token[:-1] + ("x" if token[-1] != "x" else "y")
+    assert not manager.validate(request, tampered)
+    assert not manager.validate(request, "ünicode")
+    assert not manager.validate(SimpleNamespace(session={}), token)
+
+    forged = CSRFTokenManager("other").generate(request)
+    assert not manager.validate(request, forged)
+
+
+def test_csrf_tokens_expire_after_max_age(monkeypatch) -> None:
+    """Tokens older than ``max_age`` seconds are rejected."""
+
+    manager = CSRFTokenManager("secret")
+    request = SimpleNamespace(session={})
+    token = manager.generate(request)
+    issued = time.time()
+
+    monkeypatch.setattr(time, "time", lambda: issued + manager.max_age - 5)
+    assert manager.validate(request, token)
+    monkeypatch.setattr(time, "time", lambda: issued + manager.max_age + 5)
+    assert not manager.validate(request, token)
+
+
+def test_csrf_generate_reuses_fresh_session_token(monkeypatch) -> None:
+    """A stored token is reused until half of ``max_age`` has passed."""
+
+    manager = CSRFTokenManager("secret")
+    request = SimpleNamespace(session={})
+    token = manager.generate(request)
+    issued = time.time()
+
+    monkeypatch.setattr(time, "time", lambda: issued + manager.max_age // 2 - 5)
+    assert manager.generate(request) == token
+    monkeypatch.setattr(time, "time", lambda: issued + manager.max_age // 2 + 5)
+    refreshed = manager.generate(request)
+    assert refreshed != token
+    assert request.session["_csrf_token"] == refreshed
+
+    forged = CSRFTokenManager("other").generate(SimpleNamespace(session={}))
+    request.session["_csrf_token"] = forged
+    replacement = manager.generate(request)
+    assert replacement != forged
+    assert manager.validate(request, replacement)
+
+
+def test_csrf_manager_survives_settings_with_same_secret() -> None:
+    """Settings updates rebuild the CSRF manager only when the secret changes."""
+
+    manager = admin_auth_service._csrf
+    settings = admin_auth_service._settings
+    admin_auth_service._apply_settings(settings)
+    assert admin_auth_service._csrf is manager
+
+
+@pytest.mark.asyncio
+async def test_superuser_probe_stops_after_first_hit() -> None:
+    """Once a superuser is found the setup probe no longer queries."""
+
+    answers = [False, True]
+    calls: list[object] = []
+
+    class AdapterStub:
+        user_model = object()
+
+        def filter(self, model, **filters):
+            return filters
+
+        async def exists(self, qs):
+            calls.append(qs)
+            return answers[len(calls) - 1]
+
+    service = AuthService(AdapterStub())
+
+    assert not await service.superuser_exists()
+    assert await service.superuser_exists()
+    assert await service.superuser_exists()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_superuser_probe_is_reset_by_guard_invalidation() -> None:
+    """Invalidating the guard cache also re-opens the setup routes."""
+
+    answers = [True, False]
+    calls: list[object] = []
+
+    class AdapterStub:
+        user_model = object()
+
+        def filter(self, model, **filters):
+            return filters
+
+        async def exists(self, qs):
+            calls.append(qs)
+            return answers[len(calls) - 1]
+
+    service = AuthService(AdapterStub())
+
+    assert await service.superuser_exists()
+    assert await service.superuser_exists()
+    AdminGuardMiddleware.invalidate_superuser_cache()
+    assert not await service.superuser_exists()
+    assert len(calls) == 2
+
+
+def test_branding_is_cached_until_settings_change() -> None:
+    """Site title and brand icon are resolved once per configuration version."""
+
+    first = admin_auth_service._resolve_branding()
+    assert admin_auth_service._resolve_branding() is first
+    assert (admin_auth_service.site_title, admin_auth_service.brand_icon) == first
+
+    key = SettingsKey.DEFAULT_ADMIN_TITLE.value
+    original = system_config._cache.get(key)  # type: ignore[attr-defined]
+    system_config._cache[key] = "Renamed Admin"  # type: ignore[attr-defined]
+    system_config._version += 1  # type: ignore[attr-defined]
+    try:
+        assert admin_auth_service.site_title == "Renamed Admin"
+    finally:
+        if original is None:
+            system_config._cache.pop(key, None)  # type: ignore[attr-defined]
+        else:
+            system_config._cache[key] = original  # type: ignore[attr-defined]
+        system_config._version += 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_hashes_for_unknown_accounts(monkeypatch) -> None:
+    """Missing and ineligible accounts still pay for one password check."""
+
+    users = {
+        "inactive": SimpleNamespace(is_active=False, is_staff=True, password="x"),
+    }
+    checked: list[str] = []
+
+    class AdapterStub:
+        user_model = object()
+
+        async def get_or_none(self, model, username):
+            return users.get(username)
+
+    async def fake_check_password(password, stored):
+        checked.append(stored)
+        return False
+
+    async def fake_make_password(password, *, iterations=None):
+        return f"dummy${iterations}"
+
+    monkeypatch.setattr(password_hasher, "check_password", fake_check_password)
+    monkeypatch.setattr(password_hasher, "make_password", fake_make_password)
+    service = AuthService(AdapterStub())
+
+    assert await service.authenticate_user("ghost", "secret") is None
+    assert await service.authenticate_user("inactive", "secret") is None
+    assert len(checked) == 2
+    assert checked[0] == checked[1]
+    assert checked[0].startswith("dummy$")
+
+
+# The End
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Tests covering persisted card state retrieval across manager instances."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from freeadmin.core.configuration.conf import FreeAdminSettings
@@ -40,4 +42,139 @@ async def test_card_manager_recovers_persisted_state(tmp_path) -> None:
     assert second_manager.get_last_state("alpha") == {"value": 1}
 
 
+@pytest.fixture
+def streaming_manager(tmp_path) -> CardManager:
+    """Return a manager with a streaming ``alpha`` card and a static ``beta`` card."""
+
+    settings = FreeAdminSettings(event_cache_path=str(tmp_path / "cards.db"))
+    registry = PageRegistry()
+    registry.register_card(
+        key="alpha",
+        app="demo",
+        title="Demo",
+        template="cards/demo.html",
+        channel="channel-alpha",
+    )
+    registry.register_card(
+        key="beta",
+        app="demo",
+        title="Demo",
+        template="cards/demo.html",
+    )
+    manager = CardManager(registry, settings=settings)
+    manager._serialize_payload = MagicMock(wraps=manager._serialize_payload)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_receive_from_publisher_persists_state_once(
+    streaming_manager: CardManager,
+) -> None:
+    """Publisher payloads are serialized once and only streamed with a channel."""
+
+    manager = streaming_manager
+    task = manager.receive_from_publisher(MagicMock(card_key="alpha"), {"value": 2})
+    await task
+
+    manager._serialize_payload.assert_called_once_with({"value": 2})
+    assert not manager._pending_events
+    assert manager.receive_from_publisher(MagicMock(card_key="beta"), {"v": 1}) is None
+    assert manager.get_last_state("beta") == {"v": 1}
+
+
+def test_persist_last_state_skips_write_for_identical_message(
+    streaming_manager: CardManager,
+) -> None:
+    """Identical encoded states skip the SQLite write but still return a message."""
+
+    manager = streaming_manager
+    entry = manager.get_card("alpha")
+    manager._event_cache.store_last_payload = MagicMock()
+
+    first = manager._persist_last_state(entry, {"beat": 1})
+    second = manager._persist_last_state(entry, {"beat": 1})
+
+    assert first == second == '{"beat": 1}'
+    manager._event_cache.store_last_payload.assert_called_once()
+
+
+def test_persist_last_state_encodes_mutated_previous_payload(
+    streaming_manager: CardManager,
+) -> None:
+    """Mutating the previously published object must not leak stale data."""
+
+    manager = streaming_manager
+    entry = manager.get_card("alpha")
+    state = {"v": 1}
+    manager._persist_last_state(entry, state)
+    state["v"] = 2
+
+    assert manager._persist_last_state(entry, dict(state)) == '{"v": 2}'
+    assert manager.event_cache.get_last_payload("channel-alpha")[0] == '{"v": 2}'
+
+
+def test_persist_last_state_distinguishes_bool_from_int(
+    streaming_manager: CardManager,
+) -> None:
+    """Equal but differently typed values are stored with their own encoding."""
+
+    manager = streaming_manager
+    entry = manager.get_card("alpha")
+    manager._persist_last_state(entry, {"ok": 1})
+
+    assert manager._persist_last_state(entry, {"ok": True}) == '{"ok": true}'
+    assert manager.event_cache.get_last_payload("channel-alpha")[0] == '{"ok": true}'
+
+
+def test_iter_cards_reflects_new_registrations(
+    streaming_manager: CardManager,
+) -> None:
+    """Cards added via the manager or the registry appear in the next snapshot."""
+
+    manager = streaming_manager
+    assert [entry.key for entry in manager.iter_cards()] == ["alpha", "beta"]
+
+    manager.register_card(
+        key="gamma",
+        app="demo",
+        title="Demo",
+        template="cards/demo.html",
+    )
+    manager.registry.register_card(
+        key="delta",
+        app="demo",
+        title="Demo",
+        template="cards/demo.html",
+    )
+
+    assert [entry.key for entry in manager.iter_cards()] == [
+        "alpha",
+        "beta",
+        "gamma",
+        "delta",
+    ]
+    snapshot = manager._cards_snapshot
+    list(manager.iter_cards())
+    assert manager._cards_snapshot is snapshot
+
+
+
+def test_register_cards_invalidates_cache_once(tmp_path) -> None:
+    """Bulk registration clears the card cache a single time."""
+
+    settings = FreeAdminSettings(event_cache_path=str(tmp_path / "cards.db"))
+    manager = CardManager(PageRegistry(), settings=settings)
+    manager._invalidate_card_cache = MagicMock()
+
+    manager.register_cards(
+        [
+            {"key": "one", "app": "demo", "title": "One", "template": "c.html"},
+            {"key": "two", "app": "demo", "title": "Two", "template": "c.html"},
+        ]
+    )
+
+    assert [entry.key for entry in manager.registry.iter_cards()] == ["one", "two"]
+    manager._invalidate_card_cache.assert_called_once_with()
+
+
 # The End
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Tests covering import memoization in ``DiscoveryService``."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from freeadmin.core.interface.discovery import DiscoveryService
+
+
+@pytest.fixture
+def sample_package(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[str]:
+    """Create a throwaway package with nested admin and views modules."""
+
+    root = tmp_path / "discovery_pkg"
+    (root / "blog").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "blog" / "__init__.py").write_text("")
+    (root / "blog" / "admin.py").write_text("")
+    (root / "views.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "discovery_pkg"
+    for name in [key for key in sys.modules if key.startswith("discovery_pkg")]:
+        sys.modules.pop(name, None)
+
+
+def test_discover_all_imports_each_module_once(
+    sample_package: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated lookups within one run should not re-enter importlib."""
+
+    service = DiscoveryService()
+    calls: list[str] = []
+    original = service._import_module
+
+    def tracking_import(module_name: str):
+        calls.append(module_name)
+        return original(module_name)
+
+    monkeypatch.setattr(service, "_import_module", tracking_import)
+
+    service.discover_all([sample_package])
+
+    assert "discovery_pkg.blog.admin" in sys.modules
+    assert len(calls) == len(set(calls))
+
+
+def test_import_cache_is_reset_between_runs(sample_package: str) -> None:
+    """Each discovery run should start from an empty import memo."""
+
+    service = DiscoveryService()
+    service.discover_all([sample_package])
+    service._import_cache["discovery_pkg.stale"] = None
+    service.discover_views([sample_package])
+
+    assert "discovery_pkg.stale" not in service._import_cache
+    assert service._import_cache["discovery_pkg.views"] is sys.modules[
+        "discovery_pkg.views"
+    ]
+
+
+def test_collect_package_names_propagates_non_import_errors(
+    sample_package: str, tmp_path: Path
+) -> None:
+    """Errors other than ``ImportError`` in a subpackage must not be swallowed."""
+
+    broken = tmp_path / "discovery_pkg" / "broken"
+    broken.mkdir()
+    (broken / "__init__.py").write_text("raise RuntimeError('boom')\n")
+    service = DiscoveryService()
+    root = service._safe_import(sample_package)
+
+    with pytest.raises(RuntimeError):
+        service._collect_package_names(root, set())
+
+
+def test_collect_package_names_skips_failed_imports(
+    sample_package: str, tmp_path: Path
+) -> None:
+    """Subpackages failing with ``ImportError`` are skipped and memoized."""
+
+    broken = tmp_path / "discovery_pkg" / "broken"
+    broken.mkdir()
+    (broken / "__init__.py").write_text("import discovery_missing_dependency\n")
+    service = DiscoveryService()
+    root = service._safe_import(sample_package)
+
+    names = service._collect_package_names(root, set())
+
+    assert "discovery_pkg.broken" not in names
+    assert service._import_cache["discovery_pkg.broken"] is None
+    assert service._import_cache["discovery_pkg.blog"] is sys.modules[
+        "discovery_pkg.blog"
+    ]
+
+
+def test_collect_package_names_walks_nested_packages(sample_package: str) -> None:
+    """Nested packages should be listed depth-first without manual recursion."""
+
+    service = DiscoveryService()
+    root = service._safe_import(sample_package)
+
+    names = service._collect_package_names(root, set())
+
+    assert names == ["discovery_pkg", "discovery_pkg.blog"]
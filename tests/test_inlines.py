@@ -16,6 +16,8 @@ from types import SimpleNamespace
 
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
+from pypika import Table, functions
+from pypika.dialects import MySQLQuery
 from tortoise import Tortoise, fields, models
 
 from freeadmin.core.interface.models import ModelAdmin
@@ -154,6 +156,50 @@ class TestInlineAdmin:
         resp = self.client.get(f"/admin/orm/models/parent/{parent.id}/_inlines")
         assert resp.json()[0]["count"] == 0
 
+    def test_resolved_attrs_are_memoized_per_class(self) -> None:
+        md = boot_admin.adapter.get_model_descriptor(Child)
+        attrs = ChildInline._resolved_attrs(md)
+        assert attrs.parent_fk_name == "parent"
+        assert attrs.model_slug == "child"
+        assert attrs.collapsed is True
+        assert ChildInline._resolved_attrs(
+            boot_admin.adapter.get_model_descriptor(Child)
+        ) is attrs
+
+    def test_batch_count_combines_querysets(self) -> None:
+        parent = asyncio.run(Parent.create(name="p4"))
+        asyncio.run(Child.create(parent=parent, name="c1"))
+        asyncio.run(Child.create(parent=parent, name="c2"))
+        adapter = boot_admin.adapter
+        counts = asyncio.run(
+            adapter.batch_count(
+                {
+                    "children": adapter.filter(Child, parent=parent.id),
+                    "named": adapter.filter(Child, parent=parent.id, name="c'2"),
+                    "parents": adapter.filter(Parent, id=parent.id),
+                }
+            )
+        )
+        assert counts == {"children": 2, "named": 0, "parents": 1}
+
+    def test_batch_count_sql_uses_connection_dialect(self) -> None:
+        table = Table("app_child")
+
+        def subquery() -> MySQLQuery:
+            return (
+                MySQLQuery.from_(table)
+                .select(functions.Count("*"))
+                .where(table.parent_id == 1)
+            )
+
+        sql = boot_admin.adapter._combined_count_sql(
+            MySQLQuery, [subquery(), subquery()]
+        )
+        assert sql == (
+            "SELECT (SELECT COUNT(*) FROM `app_child` WHERE `parent_id`=1) `c0`,"
+            "(SELECT COUNT(*) FROM `app_child` WHERE `parent_id`=1) `c1`"
+        )
+
 
 # The End
 
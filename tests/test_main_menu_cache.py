@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 """Tests covering SQLite-backed main menu caching behaviour."""
 
+import asyncio
 import types
 from pathlib import Path
 
 import pytest
 
-from freeadmin.core.interface.registry import PageRegistry
+from freeadmin.core.interface.registry import MenuItem, PageRegistry
 from freeadmin.core.interface.menu import MenuBuilder
 from freeadmin.core.interface.cache.menu import MainMenuCache
 from freeadmin.core.interface.settings import SettingsKey, system_config
@@ -46,6 +47,39 @@ def test_main_menu_cache_hit(tmp_path: Path) -> None:
     assert second_menu == first_menu
 
 
+def test_main_menu_is_memoized_in_process(tmp_path: Path) -> None:
+    """Repeated builds skip the SQLite cache; other builders still share it."""
+
+    harness = MenuCacheHarness(tmp_path)
+    harness.registry.register_view_entry(app="demo", model="alpha", admin_cls=_DummyAdmin)
+    first_menu = harness.builder.build_main_menu(locale="en")
+
+    def _raise_load(*args, **kwargs):
+        raise AssertionError("memo miss")
+
+    original_load = harness.cache.load
+    harness.cache.load = _raise_load  # type: ignore[method-assign]
+    assert harness.builder.build_main_menu(locale="en") is first_menu
+
+    harness.cache.load = original_load  # type: ignore[method-assign]
+    sibling = MenuBuilder(harness.registry, cache=harness.cache)
+    assert sibling.build_main_menu(locale="en") == first_menu
+
+
+def test_main_menu_async_shares_cache_with_sync_builds(tmp_path: Path) -> None:
+    """The async builder persists to SQLite and shares the in-process memo."""
+
+    harness = MenuCacheHarness(tmp_path)
+    harness.registry.register_view_entry(app="demo", model="alpha", admin_cls=_DummyAdmin)
+
+    menu = asyncio.run(harness.builder.build_main_menu_async(locale="en"))
+
+    assert harness.cache.items(), "expected payload stored from a worker thread"
+    assert harness.builder.build_main_menu(locale="en") is menu
+    sibling = MenuBuilder(harness.registry, cache=harness.cache)
+    assert asyncio.run(sibling.build_main_menu_async(locale="en")) == menu
+
+
 def test_main_menu_cache_locale_separation(tmp_path: Path) -> None:
     """Ensure different locales maintain distinct cache entries."""
 
@@ -119,6 +153,7 @@ def test_main_menu_cache_reflects_settings_changes(tmp_path: Path) -> None:
 
     try:
         system_config._cache[key] = "/orm-updated"  # type: ignore[attr-defined]
+        system_config._version += 1  # type: ignore[attr-defined]
 
         def _raise_iter(self):
             raise AssertionError("expected cache miss after settings change")
@@ -143,9 +178,89 @@ def test_main_menu_cache_reflects_settings_changes(tmp_path: Path) -> None:
             system_config._cache[key] = original_prefix  # type: ignore[attr-defined]
         else:
             system_config._cache.pop(key, None)  # type: ignore[attr-defined]
+        system_config._version += 1  # type: ignore[attr-defined]
         harness.registry.iter_orm = original_iter_orm
         harness.registry.iter_settings = original_iter_settings
 
 
+def test_user_menu_deduplicates_paths_in_insertion_order(tmp_path: Path) -> None:
+    """Registering a path twice keeps the first entry and its position."""
+
+    harness = MenuCacheHarness(tmp_path)
+    harness.builder.register_user_item(title="Profile", path="/profile")
+    harness.builder.register_user_item(title="Logout", path="/logout")
+    harness.builder.register_user_item(title="Profile again", path="/profile")
+
+    items = harness.builder.build_user_menu(harness.registry)
+
+    assert [item.path for item in items] == ["/profile", "/logout"]
+    assert items[0].title == "Profile"
+
+
+def test_user_menu_registration_keeps_main_menu_cached(tmp_path: Path) -> None:
+    """User menu entries advance their own version, not the main menu's."""
+
+    harness = MenuCacheHarness(tmp_path)
+    harness.registry.register_view_entry(app="demo", model="alpha", admin_cls=_DummyAdmin)
+    harness.builder.build_main_menu(locale="en")
+    main_version = harness.registry.registry_version
+    user_version = harness.registry.user_menu_version
+
+    harness.builder.register_user_item(title="Profile", path="/profile")
+    _bundle, config_token = harness.builder._resolve_settings_snapshot()
+
+    assert harness.registry.registry_version == main_version
+    assert harness.registry.user_menu_version == user_version + 1
+    assert harness.cache.load(main_version, "en", config_token=config_token) is not None
+
+
+def test_main_menu_cache_is_bounded(tmp_path: Path) -> None:
+    """Storing beyond ``maxsize`` evicts the oldest payloads."""
+
+    cache = MainMenuCache(path=str(tmp_path / "bounded.sqlite"), maxsize=2)
+    for locale in ("en", "fr", "de"):
+        cache.store(1, locale, [])
+
+    assert cache.load(1, "en") is None
+    assert cache.load(1, "fr") is not None
+    assert cache.load(1, "de") is not None
+
+
+def test_main_menu_reuses_expanded_registered_items(tmp_path: Path) -> None:
+    """Cache misses reuse registered items expanded for the default type."""
+
+    harness = MenuCacheHarness(tmp_path)
+    harness.builder.register_item(title="Dashboard", path="/dashboard")
+    harness.builder.register_item(title="Reports", path="/reports", page_type="orm")
+
+    first = harness.builder.build_main_menu(locale="en")
+    harness.builder.invalidate_main_menu()
+    second = harness.builder.build_main_menu(locale="fr")
+
+    assert first[0].page_type == "view"
+    assert first[1].page_type == "orm"
+    assert second[0] is first[0]
+
+    harness.builder.register_item(title="Audit", path="/audit")
+    third = harness.builder.build_main_menu(locale="en")
+
+    assert [item.path for item in third] == ["/dashboard", "/reports", "/audit"]
+    assert third[2].page_type == "view"
+
+
+def test_main_menu_cache_round_trips_slotted_items(tmp_path: Path) -> None:
+    """Slotted menu items serialize and restore without an instance dict."""
+
+    cache = MainMenuCache(path=str(tmp_path / "slots.sqlite"))
+    item = MenuItem(title="Users", path="/users", icon="bi-person", page_type="orm")
+    cache.store(1, "en", [item])
+
+    loaded = cache.load(1, "en")
+
+    assert not hasattr(item, "__dict__")
+    assert loaded is not None
+    assert loaded[0] == [item]
+
+
 # The End
 
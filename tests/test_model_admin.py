@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Tests covering cached reflection helpers on ``ModelAdmin``."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from freeadmin.core.interface.models import ModelAdmin
+
+
+class _Model:
+    """Placeholder model class used by the fake adapter."""
+
+
+def _descriptor() -> SimpleNamespace:
+    return SimpleNamespace(
+        fields=[
+            SimpleNamespace(name="id", unique=True),
+            SimpleNamespace(name="email", unique=True),
+            SimpleNamespace(name="title", unique=False),
+        ],
+    )
+
+
+def test_import_lookup_fields_resolved_once() -> None:
+    """Unique lookup fields are reflected once per admin instance."""
+
+    adapter = SimpleNamespace(
+        get_model_descriptor=MagicMock(return_value=_descriptor()),
+    )
+    admin = ModelAdmin(_Model, adapter)
+
+    assert admin.get_import_lookup_fields() == ("id", "email")
+    assert admin.get_import_lookup_fields() == ("id", "email")
+    adapter.get_model_descriptor.assert_called_once_with(_Model)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Tests covering view entry registration in ``PageRegistry``."""
+
+from __future__ import annotations
+
+import pytest
+
+from freeadmin.core.interface.pages import AdminPage
+from freeadmin.core.interface.registry import PageRegistry
+from freeadmin.core.interface.settings import SettingsKey, system_config
+
+
+class _DummyAdmin:
+    """Placeholder admin class used for registrations."""
+
+
+def test_register_view_entry_is_idempotent_per_kind() -> None:
+    """Case variants of one registration are ignored; kinds stay separate."""
+
+    registry = PageRegistry()
+    registry.register_view_entry(app="Blog", model="Post", admin_cls=_DummyAdmin)
+    version = registry.registry_version
+    registry.register_view_entry(app="blog", model="post", admin_cls=_DummyAdmin)
+    assert registry.registry_version == version
+
+    registry.register_view_entry(
+        app="blog", model="post", admin_cls=_DummyAdmin, settings=True
+    )
+    assert [entry.settings for entry in registry.view_entries] == [False, True]
+
+
+def test_register_view_entry_rejects_occupied_paths() -> None:
+    """Pages and entries of the other kind on the same path are conflicts."""
+
+    registry = PageRegistry()
+    orm_prefix = system_config.get_cached(SettingsKey.ORM_PREFIX, "/orm")
+    registry.register_page(AdminPage(title="Taken", path=f"{orm_prefix}/shop/item"))
+
+    with pytest.raises(ValueError, match="Path conflict"):
+        registry.register_view_entry(app="shop", model="item", admin_cls=_DummyAdmin)
+
+    key = SettingsKey.SETTINGS_PREFIX.value
+    original = system_config._cache.get(key)  # type: ignore[attr-defined]
+    system_config._cache[key] = orm_prefix  # type: ignore[attr-defined]
+    system_config._version += 1  # type: ignore[attr-defined]
+    try:
+        registry.register_view_entry(app="shop", model="order", admin_cls=_DummyAdmin)
+        with pytest.raises(ValueError, match="Path conflict"):
+            registry.register_view_entry(
+                app="shop", model="order", admin_cls=_DummyAdmin, settings=True
+            )
+    finally:
+        if original is None:
+            system_config._cache.pop(key, None)  # type: ignore[attr-defined]
+        else:
+            system_config._cache[key] = original  # type: ignore[attr-defined]
+        system_config._version += 1  # type: ignore[attr-defined]
+
+
+
+def test_entries_are_split_by_kind_in_registration_order() -> None:
+    """``view_entries`` keeps global order while kinds iterate separately."""
+
+    registry = PageRegistry()
+    registry.register_view_entry(app="a", model="one", admin_cls=_DummyAdmin)
+    registry.register_view_entry(
+        app="a", model="two", admin_cls=_DummyAdmin, settings=True
+    )
+    registry.register_view_entry(app="a", model="three", admin_cls=_DummyAdmin)
+
+    assert [e.model for e in registry.view_entries] == ["one", "two", "three"]
+    assert [e.model for e in registry.iter_orm()] == ["one", "three"]
+    assert [e.model for e in registry.iter_settings()] == ["two"]
+
+
+def test_registry_entries_are_slotted() -> None:
+    """Registry records carry no per-instance ``__dict__``."""
+
+    registry = PageRegistry()
+    registry.register_view_entry(app="blog", model="tag", admin_cls=_DummyAdmin)
+    registry.register_card(
+        key="visits", app="blog", title="Visits", template="cards/visits.html"
+    )
+
+    assert not hasattr(registry.view_entries[0], "__dict__")
+    assert not hasattr(registry.card_entries["visits"], "__dict__")
+
+
+
+def test_get_view_virtual_normalizes_like_registration() -> None:
+    """Lookups accept the raw label and slug source used to register."""
+
+    registry = PageRegistry()
+    virtual = registry.register_view_virtual(
+        path="/reports/sales", app_label="Reports", slug_source="Sales Summary"
+    )
+
+    assert registry.get_view_virtual(virtual.app_slug, virtual.slug) is virtual
+    assert registry.get_view_virtual("Reports", "Sales Summary") is virtual
+    assert registry.get_view_virtual("reports", "missing") is None
+
+
+
+def test_get_card_returns_entry_or_raises() -> None:
+    """Card lookups return the stored entry and reject unknown keys."""
+
+    registry = PageRegistry()
+    registry.register_card(
+        key="sales", app="shop", title="Sales", template="cards/sales.html"
+    )
+
+    assert registry.get_card("sales") is registry.card_entries["sales"]
+    with pytest.raises(ValueError, match="Unknown card: missing"):
+        registry.get_card("missing")
+
+
+
+def test_register_card_is_idempotent_and_rejects_changes() -> None:
+    """Identical re-registration is a no-op; changed data is an error."""
+
+    registry = PageRegistry()
+    registry.register_card(
+        key="sales",
+        app="shop",
+        title="Sales",
+        template="cards/sales.html",
+        scripts=["sales.js"],
+    )
+    entry = registry.card_entries["sales"]
+    version = registry.card_version
+
+    registry.register_card(
+        key="sales",
+        app="shop",
+        title="Sales",
+        template="cards/sales.html",
+        scripts=("sales.js",),
+    )
+    assert registry.card_entries["sales"] is entry
+    assert registry.card_version == version
+
+    with pytest.raises(ValueError, match="different data"):
+        registry.register_card(
+            key="sales",
+            app="shop",
+            title="Sales",
+            template="cards/sales.html",
+            styles=["sales.css"],
+        )
+
+
+# The End
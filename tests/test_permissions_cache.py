@@ -12,6 +12,7 @@ import pytest
 
 from freeadmin.contrib.adapters.tortoise.users import PermAction
 from freeadmin.core.interface.services.admin import AdminService
+from freeadmin.core.interface.services.auth import AuthService
 from freeadmin.core.interface.services.permissions import PermissionsService
 
 
@@ -244,4 +245,23 @@ async def test_admin_service_triggers_permission_cache_invalidation(monkeypatch)
     assert delete_group_calls == [7]
 
 
+@pytest.mark.asyncio
+async def test_admin_service_invalidates_superuser_cache_on_user_changes() -> None:
+    """Deleting or editing users must make superuser probes query again."""
+
+    adapter = DummyPermissionAdapter()
+    adapter.user_model = type("User", (SimpleNamespace,), {})
+    user_service = AdminService(DummyPermissionAdmin(adapter.user_model, adapter))
+    request = SimpleNamespace()
+    acting_user = SimpleNamespace()
+
+    before = AuthService.superuser_generation()
+    created = await user_service.create(request, acting_user, {"is_superuser": True})
+    await user_service.update(
+        request, acting_user, created["id"], {"is_superuser": False}
+    )
+    await user_service.delete(request, acting_user, created["id"])
+    assert AuthService.superuser_generation() == before + 3
+
+
 # The End
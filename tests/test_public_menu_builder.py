@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Tests covering path handling in ``PublicMenuBuilder``."""
+
+from __future__ import annotations
+
+import pytest
+
+from freeadmin.core.interface.menu import PublicMenuBuilder, PublicMenuCache
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("", "/"),
+        ("   ", "/"),
+        ("/", "/"),
+        ("///", "/"),
+        ("docs", "/docs"),
+        (" docs/ ", "/docs"),
+        ("/docs//", "/docs"),
+        ("/a/b/", "/a/b"),
+    ],
+)
+def test_normalize_path(raw: str, expected: str) -> None:
+    """Paths are made absolute without trailing slashes."""
+
+    assert PublicMenuBuilder._normalize_path(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (None, ""),
+        ("", ""),
+        (" / ", ""),
+        ("//", ""),
+        ("site", "/site"),
+        ("/site/", "/site"),
+    ],
+)
+def test_normalize_prefix(raw: str | None, expected: str) -> None:
+    """Prefixes collapse to an empty string or an absolute path."""
+
+    assert PublicMenuBuilder._normalize_prefix(raw) == expected
+
+
+def test_build_menu_reuses_prefixed_items_across_registrations() -> None:
+    """Only the re-registered entry is recomposed for an existing prefix."""
+
+    builder = PublicMenuBuilder()
+    builder.register_item(title="Docs", path="/docs")
+    builder.register_item(title="Blog", path="/blog")
+    first = builder.build_menu(prefix="/site")
+
+    builder.register_item(title="Blog posts", path="/blog")
+    second = builder.build_menu(prefix="/site")
+
+    assert [item.path for item in second] == ["/site/docs", "/site/blog"]
+    assert second[0] is first[0]
+    assert second[1].title == "Blog posts"
+
+
+def test_build_menu_without_prefix_returns_registered_items() -> None:
+    """An empty prefix reuses registered items instead of rebuilding them."""
+
+    builder = PublicMenuBuilder()
+    builder.register_item(title="Docs", path="docs/")
+    registered = builder._items["/docs"]
+
+    menu = builder.build_menu(prefix=" / ")
+
+    assert menu == (registered,)
+    assert menu[0] is registered
+    assert builder._resolved == {}
+
+
+def test_public_menu_cache_evicts_least_recently_used() -> None:
+    """The public menu cache keeps at most ``maxsize`` snapshots."""
+
+    cache = PublicMenuCache(maxsize=2)
+    cache.store(1, "", [])
+    cache.store(1, "/a", [])
+    assert cache.load(1, "") == ()
+    cache.store(1, "/b", [])
+
+    assert cache.load(1, "/a") is None
+    assert cache.load(1, "") == ()
+    assert cache.load(1, "/b") == ()
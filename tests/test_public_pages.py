@@ -5,10 +5,16 @@ Test coverage for registering and exposing public FreeAdmin pages."""
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+
+import pytest
 from fastapi import FastAPI
 from starlette.requests import Request
 
 from freeadmin.core.boot import admin as boot_admin
+from freeadmin.core.interface.pages import BaseTemplatePage
+from freeadmin.core.interface.settings import system_config
 from freeadmin.core.interface.site import AdminSite
 from freeadmin.core.interface.templates.rendering import PageTemplateResponder
 from freeadmin.core.network.router.aggregator import ExtendedRouterAggregator
@@ -75,6 +81,23 @@ class TestPublicPageRegistration:
         paths = sorted(getattr(route, "path", "") for route in router.routes)
         assert "/welcome" in paths
 
+    def test_public_router_grows_incrementally(self) -> None:
+        """New public pages are appended to the existing router."""
+
+        (router,) = self.site.pages.iter_public_routers()
+        route_count = len(router.routes)
+
+        self.site.register_public_view(
+            path="/about",
+            name="About",
+            template="pages/welcome.html",
+        )(lambda request, user=None: {})
+
+        (same_router,) = self.site.pages.iter_public_routers()
+        assert same_router is router
+        assert len(router.routes) == route_count + 1
+        assert router.routes[-1].path == "/about"
+
     def test_extended_aggregator_includes_public_routes(self) -> None:
         """Verify aggregated routers include registered public pages."""
 
@@ -121,6 +144,76 @@ class TestPublicPageRegistration:
         assert context["is_admin_request"]
         assert context["prefix"].startswith("/admin")
 
+    def test_sync_public_handler_is_awaitable_after_registration(self) -> None:
+        """Sync handlers are wrapped once so endpoints can always await them."""
+
+        @self.site.register_public_view(
+            path="/sync-welcome",
+            name="Sync Welcome",
+            template="pages/welcome.html",
+        )
+        def sync_welcome(request, user=None) -> dict[str, object]:
+            """Return context synchronously."""
+
+            return {"subtitle": "sync"}
+
+        descriptor = self.site.pages._public_descriptors[-1]
+        assert descriptor.handler.__wrapped__ is sync_welcome
+        assert inspect.iscoroutinefunction(descriptor.handler)
+        result = asyncio.run(descriptor.handler(request=None, user=None))
+        assert result == {"subtitle": "sync"}
+
+    def test_template_page_context_is_a_read_only_view(self) -> None:
+        """Contexts returned by ``get_context`` are exposed without copying."""
+
+        payload = {"subtitle": "class-based"}
+
+        class WelcomePage(BaseTemplatePage):
+            path = "/class-welcome"
+            name = "Class Welcome"
+            template = "pages/welcome.html"
+
+            def get_context(self, *, request, user=None):
+                return payload
+
+        page = WelcomePage(site=self.site)
+        context = asyncio.run(
+            page._build_public_context_handler()(request=None, user=None)
+        )
+
+        assert context == payload
+        payload["extra"] = True
+        assert context["extra"] is True
+        with pytest.raises(TypeError):
+            context["subtitle"] = "changed"  # type: ignore[index]
+
+    def test_page_descriptors_are_slotted(self) -> None:
+        """Descriptors store fields in slots rather than a per-instance dict."""
+
+        descriptor = self.site.pages._public_descriptors[0]
+        assert not hasattr(descriptor, "__dict__")
+        with pytest.raises(AttributeError):
+            descriptor.unexpected = True  # type: ignore[attr-defined]
+
+    def test_default_context_reuses_settings_defaults(self) -> None:
+        """Settings-derived defaults are resolved once per configuration version."""
+
+        first = PageTemplateResponder._resolve_page_defaults(self.site)
+        assert PageTemplateResponder._resolve_page_defaults(self.site) is first
+
+        context = PageTemplateResponder._build_default_context(
+            _build_request("/welcome", self.site)
+        )
+        assert context["site_title"] == first.site_title
+        context["assets"]["css"].append("mutated.css")
+        again = PageTemplateResponder._build_default_context(
+            _build_request("/welcome", self.site)
+        )
+        assert again["assets"] == {"css": [], "js": []}
+
+        system_config._version += 1  # type: ignore[attr-defined]
+        assert PageTemplateResponder._resolve_page_defaults(self.site) is not first
+
 
 # The End
 
@@ -43,7 +43,7 @@ class TestSettingsExport:
                 db_url="sqlite://:memory:",
                 modules={
                     "models": ["freeadmin.contrib.apps.system.models"],
-                    "admin": list(system_models.module_names()),
+                    "admin": [system_models.models_module()],
                 },
             )
         )
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Tests covering observer bookkeeping in ``SettingsManager``."""
+
+from __future__ import annotations
+
+import gc
+
+from freeadmin.core.configuration.conf import FreeAdminSettings, SettingsManager
+
+
+class _Listener:
+    """Record settings instances delivered to a bound-method observer."""
+
+    def __init__(self) -> None:
+        self.seen: list[FreeAdminSettings] = []
+
+    def apply(self, settings: FreeAdminSettings) -> None:
+        self.seen.append(settings)
+
+
+def test_bound_method_observers_do_not_keep_owners_alive() -> None:
+    """Collected owners drop out of the observer list."""
+
+    manager = SettingsManager()
+    kept = _Listener()
+    dropped = _Listener()
+    manager.register(kept.apply)
+    manager.register(dropped.apply)
+    del dropped
+    gc.collect()
+
+    settings = FreeAdminSettings()
+    manager.configure(settings)
+
+    assert kept.seen == [settings]
+    assert len(manager._callbacks) == 1
+
+
+def test_plain_functions_are_held_and_can_be_unregistered() -> None:
+    """Function observers stay registered until explicitly removed."""
+
+    manager = SettingsManager()
+    calls: list[FreeAdminSettings] = []
+    listener = _Listener()
+    manager.register(calls.append)
+    manager.register(listener.apply)
+
+    manager.unregister(listener.apply)
+    manager.configure(FreeAdminSettings())
+
+    assert len(calls) == 1
+    assert listener.seen == []
+
+
+# The End
@@ -11,6 +11,11 @@ Email: timurkady@yandex.com
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
+from fastapi import APIRouter
+from starlette.requests import Request
+
 from freeadmin.core.boot import admin as boot_admin
 from freeadmin.core.interface.settings import SettingsKey, system_config
 from freeadmin.core.interface.site import AdminSite
@@ -99,6 +104,119 @@ class TestSidebarViewRegistration:
         )
         assert all(entry["settings"] is True for entry in config_entries)
 
+    def test_resolve_request_reuses_prefixes_until_settings_change(self) -> None:
+        """Section prefixes are resolved once per configuration version."""
+
+        pages = self.site.pages
+        request = SimpleNamespace(
+            url=SimpleNamespace(path=f"{self.settings_prefix}/demo/config")
+        )
+        first = pages._get_prefixes()
+
+        resolution = pages.resolve_request(request)
+
+        assert pages._get_prefixes() is first
+        assert resolution.section_mode == "settings"
+        assert resolution.is_settings is True
+
+        system_config._version += 1
+        assert pages._get_prefixes() is not first
+        assert pages._get_prefixes() == first
+
+    def test_section_map_matches_prefix_comparison(self) -> None:
+        """The first-segment lookup agrees with plain prefix matching."""
+
+        pages = self.site.pages
+        prefixes = pages._get_prefixes()
+        assert prefixes.section_by_segment is not None
+
+        for path in (
+            "/",
+            self.views_prefix,
+            f"{self.views_prefix}/demo/list",
+            f"{self.orm_prefix}/app/model",
+            f"{self.settings_prefix}/demo/config",
+            f"{self.settings_prefix}extra/page",
+            "/unknown/path",
+        ):
+            request = SimpleNamespace(url=SimpleNamespace(path=path))
+            expected = pages._match_section(path.rstrip("/") or "/", prefixes)
+            assert pages.resolve_request(request).section_mode == expected
+
+    def test_resolve_request_is_shared_within_a_request(self) -> None:
+        """Repeated resolution of one request returns the stored result."""
+
+        path = f"{self.orm_prefix}/app/model"
+        request = Request({"type": "http", "path": path, "headers": []})
+
+        first = self.site.pages.resolve_request(request)
+
+        assert self.site.pages.resolve_request(request) is first
+        assert request.state.page_resolution is first
+        assert (first.app_label, first.model_slug) == ("app", "model")
+
+    def test_sidebar_groups_stay_sorted_across_registrations(self) -> None:
+        """Pre-bucketed groups stay sorted and re-registration adds no duplicates."""
+
+        site = AdminSite(boot_admin.adapter, title="Sidebar Ordering")
+        for path, name, label in (
+            ("zeta/beta", "Beta", "Zeta"),
+            ("alpha/zulu", "zulu", "alpha"),
+            ("alpha/echo", "Echo", "alpha"),
+            ("zeta/old", "Old", "Zeta"),
+        ):
+            site.register_view(
+                path=f"{self.views_prefix}/{path}", name=name, label=label
+            )(lambda request, user: {})
+        site.register_view(
+            path=f"{self.views_prefix}/zeta/old", name="Old", label="Zeta"
+        )(lambda request, user: {})
+
+        sidebar = site.get_sidebar_views(settings=False)
+        grouped = {
+            label: [entry["display_name"] for entry in entries]
+            for label, entries in sidebar
+        }
+
+        assert [label for label, _ in sidebar] == ["alpha", "Zeta"]
+        assert grouped == {"alpha": ["Echo", "zulu"], "Zeta": ["Beta", "Old"]}
+
+        sidebar[0][1][0]["model_name"] = "mutated"
+        fresh = site.get_sidebar_views(settings=False)
+        assert fresh[0][1][0]["model_name"] != "mutated"
+
+    def test_route_dependencies_are_reused_across_mounts(self) -> None:
+        """Remounting admin pages hands FastAPI the same dependency callables."""
+
+        routers = [APIRouter(), APIRouter()]
+        for router in routers:
+            self.site.pages.attach_admin_routes(
+                router,
+                templates=None,
+                page_type_settings="settings",
+                views_prefix=self.views_prefix,
+                settings_prefix=self.settings_prefix,
+                orm_prefix=self.orm_prefix,
+            )
+
+        def dependencies(router: APIRouter) -> dict[str, list]:
+            return {
+                route.path: [dep.dependency for dep in route.dependencies]
+                for route in router.routes
+            }
+
+        first, second = (dependencies(router) for router in routers)
+        assert first
+        assert first == second
+
+    def test_leading_segments_match_filtered_split(self) -> None:
+        """Bounded splitting agrees with filtering every path segment."""
+
+        leading = self.site.pages._leading_segments
+        for path in ("/", "/orm", "/orm/app/model/1/edit", "/orm//app/model", "a/b/"):
+            expected = [segment for segment in path.split("/") if segment][:3]
+            assert leading(path, 3) == expected
+
 
 # The End
 
@@ -95,4 +95,31 @@ async def test_reload_handles_operational_error(monkeypatch, caplog) -> None:
     assert "Run your migrations before starting FreeAdmin." in caplog.text
 
 
+def test_get_cached_many_matches_individual_lookups() -> None:
+    config = config_module.SystemConfig()
+    config._cache.update({"ORM_PREFIX": "/models", "raw_key": 3})
+    keys = (
+        (config_module.SettingsKey.ORM_PREFIX, "/orm"),
+        ("raw_key", 0),
+        (config_module.SettingsKey.SETTINGS_PREFIX, "/settings"),
+    )
+
+    values = config.get_cached_many(keys)
+
+    assert values == [config.get_cached(key, default) for key, default in keys]
+    assert values == ["/models", 3, "/settings"]
+
+
+@pytest.mark.asyncio
+async def test_get_many_matches_individual_gets() -> None:
+    config = config_module.SystemConfig()
+    config._cache.update({"ORM_PREFIX": "/models", "raw_key": 3})
+
+    values = await config.get_many((config_module.SettingsKey.ORM_PREFIX, "raw_key"))
+
+    assert values == ["/models", 3]
+    with pytest.raises(KeyError):
+        await config.get_many(("raw_key", "missing_key"))
+
+
 # The End
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Tests covering settings-prefix caching in ``TemplateContextBuilder``."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from starlette.requests import Request
+
+from freeadmin.core.boot import admin as boot_admin
+from freeadmin.core.interface.context import TemplateContextBuilder
+from freeadmin.core.interface.settings import SettingsKey, system_config
+from freeadmin.core.interface.site import AdminSite
+from tests.conftest import admin_state
+
+
+def _settings() -> SimpleNamespace:
+    return SimpleNamespace(admin_path="/admin/", static_url_segment="/static")
+
+
+async def test_system_config_version_tracks_cache_writes() -> None:
+    """Filling a missing key must advance the configuration version."""
+
+    before = system_config.version
+    try:
+        await system_config.get_or_default("custom-key", default="value")
+        assert system_config.version > before
+        unchanged = system_config.version
+        await system_config.get_or_default("custom-key", default="other")
+        assert system_config.version == unchanged
+    finally:
+        system_config._cache.pop("custom-key", None)  # type: ignore[attr-defined]
+
+
+def test_prefixes_cached_until_settings_change() -> None:
+    """Prefix lookups are reused until the system configuration changes."""
+
+    builder = TemplateContextBuilder(admin_site=SimpleNamespace())
+    settings = _settings()
+    key = SettingsKey.ORM_PREFIX.value
+    original = system_config._cache.get(key)  # type: ignore[attr-defined]
+
+    first = builder._resolve_prefixes(settings)
+    assert builder._resolve_prefixes(settings) is first
+    assert first.admin_prefix == "/admin"
+
+    system_config._cache[key] = "/orm-changed"  # type: ignore[attr-defined]
+    system_config._version += 1  # type: ignore[attr-defined]
+    try:
+        refreshed = builder._resolve_prefixes(settings)
+        assert refreshed is not first
+        assert refreshed.orm_prefix == "/orm-changed"
+    finally:
+        if original is None:
+            system_config._cache.pop(key, None)  # type: ignore[attr-defined]
+        else:
+            system_config._cache[key] = original  # type: ignore[attr-defined]
+        system_config._version += 1  # type: ignore[attr-defined]
+
+
+def test_prefixes_rebuilt_for_other_settings_object() -> None:
+    """A different settings instance must not reuse cached prefixes."""
+
+    builder = TemplateContextBuilder(admin_site=SimpleNamespace())
+    first = builder._resolve_prefixes(_settings())
+    other = SimpleNamespace(admin_path="/panel/", static_url_segment="/static")
+
+    assert builder._resolve_prefixes(other) is not first
+
+
+def test_build_places_menu_after_extra() -> None:
+    """A supplied menu lands in the context and wins over ``extra`` keys."""
+
+    admin_state.reset()
+    try:
+        site = AdminSite(boot_admin.adapter, title="Context Admin")
+        request = Request({"type": "http", "path": "/admin/", "headers": []})
+        menu = [SimpleNamespace(title="Home")]
+
+        ctx = site.build_template_ctx(
+            request, None, extra={"menu": "stale", "note": 1}, menu=menu
+        )
+        assert ctx["menu"] is menu
+        assert ctx["note"] == 1
+
+        plain = site.build_template_ctx(request, None, extra={"note": 1})
+        assert "menu" not in plain
+    finally:
+        admin_state.reset()
+
+
+def test_site_brand_icon_cached_until_settings_change() -> None:
+    """The brand icon URL is resolved once per configuration version."""
+
+    admin_state.reset()
+    key = SettingsKey.BRAND_ICON.value
+    original = system_config._cache.get(key)  # type: ignore[attr-defined]
+    try:
+        site = AdminSite(boot_admin.adapter, title="Icon Admin")
+        first = site.brand_icon
+        assert site._brand_icon_cache == (system_config.version, first)
+
+        system_config._cache[key] = "https://cdn.example.com/icon.png"  # type: ignore[attr-defined]
+        system_config._version += 1  # type: ignore[attr-defined]
+        assert site.brand_icon == "https://cdn.example.com/icon.png"
+    finally:
+        if original is None:
+            system_config._cache.pop(key, None)  # type: ignore[attr-defined]
+        else:
+            system_config._cache[key] = original  # type: ignore[attr-defined]
+        system_config._version += 1  # type: ignore[attr-defined]
+        admin_state.reset()
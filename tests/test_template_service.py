@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""template service
+
+Tests covering template directory registration in ``TemplateService``."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from freeadmin.core.configuration.conf import FreeAdminSettings, current_settings
+from freeadmin.core.interface.templates import rendering
+from freeadmin.core.interface.templates import service as template_service_module
+from freeadmin.core.interface.templates.service import TemplateService
+from freeadmin.core.runtime.provider import TEMPLATE_BYTECODE_CACHE, TemplateProvider
+
+
+def test_add_template_directories_dedupes_in_one_pass(tmp_path: Path) -> None:
+    """Bulk registration should skip duplicates and extend every search path."""
+
+    base = tmp_path / "base"
+    extra = tmp_path / "extra"
+    other = tmp_path / "other"
+    for folder in (base, extra, other):
+        folder.mkdir()
+    service = TemplateService(templates_dir=base, settings=current_settings())
+    templates = service.get_templates()
+
+    service.add_template_directories([extra, str(extra), base, other])
+
+    expected = [str(base), str(extra), str(other)]
+    assert service.get_provider().template_directories == tuple(expected)
+    assert list(templates.env.loader.searchpath) == expected
+
+
+def test_add_template_directories_skips_loader_when_nothing_new(
+    tmp_path: Path,
+) -> None:
+    """Re-registering known directories must leave the loader untouched."""
+
+    service = TemplateService(templates_dir=tmp_path, settings=current_settings())
+    loader = service.get_templates().env.loader
+    search_paths = loader.searchpath
+
+    service.add_template_directories([tmp_path, str(tmp_path)])
+
+    assert loader.searchpath is search_paths
+
+
+
+def test_renderer_builds_default_service_once_under_contention(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent first calls to ``get_service`` share one service instance."""
+
+    built: list[object] = []
+
+    class SlowService:
+        def __init__(self) -> None:
+            time.sleep(0.01)
+            built.append(self)
+
+    monkeypatch.setattr(rendering, "TemplateService", SlowService)
+    monkeypatch.setattr(template_service_module, "DEFAULT_TEMPLATE_SERVICE", None)
+    monkeypatch.setattr(rendering.TemplateRenderer, "_service", None)
+    barrier = threading.Barrier(8)
+    results: list[object] = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(rendering.TemplateRenderer.get_service())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert all(result is built[0] for result in results)
+
+
+
+def test_template_services_share_compiled_bytecode(tmp_path: Path) -> None:
+    """A second service renders a known template without recompiling it."""
+
+    (tmp_path / "hello.html").write_text("Hello {{ name }}")
+    settings = current_settings()
+    TEMPLATE_BYTECODE_CACHE.clear()
+    first = TemplateService(templates_dir=tmp_path, settings=settings)
+    second = TemplateService(templates_dir=tmp_path, settings=settings)
+
+    assert first.get_templates().get_template("hello.html").render(name="A") == "Hello A"
+
+    env = second.get_templates().env
+
+    def fail_compile(*args, **kwargs):
+        raise AssertionError("template was compiled again")
+
+    env.compile = fail_compile  # type: ignore[method-assign]
+    assert env.get_template("hello.html").render(name="B") == "Hello B"
+
+
+
+def test_bytecode_cache_directory_is_opt_in(tmp_path: Path) -> None:
+    """Configuring a cache directory persists compiled templates to disk."""
+
+    templates_dir = tmp_path / "templates"
+    cache_dir = tmp_path / "bytecode"
+    templates_dir.mkdir()
+    (templates_dir / "hello.html").write_text("Hello")
+    settings = FreeAdminSettings.from_env(
+        {"FA_TEMPLATE_BYTECODE_CACHE_DIR": str(cache_dir)}
+    )
+    assert FreeAdminSettings.from_env({}).template_bytecode_cache_dir is None
+
+    service = TemplateService(templates_dir=templates_dir, settings=settings)
+    service.get_templates().get_template("hello.html")
+
+    assert [path.suffix for path in cache_dir.iterdir()] == [".cache"]
+
+
+
+def test_coerce_template_dirs_accepts_strings_paths_and_iterables(
+    tmp_path: Path,
+) -> None:
+    """Single locations become one-element lists; iterables are stringified."""
+
+    class Label(str):
+        pass
+
+    coerce = TemplateService._coerce_template_dirs
+    assert coerce(str(tmp_path)) == [str(tmp_path)]
+    assert coerce(tmp_path) == [str(tmp_path)]
+    assert coerce(Label("templates")) == ["templates"]
+    assert coerce((tmp_path, "other")) == [str(tmp_path), "other"]
+
+
+
+def test_provider_reuses_one_environment(tmp_path: Path) -> None:
+    """The provider builds its templates once and extends them in place."""
+
+    extra = tmp_path / "extra"
+    extra.mkdir()
+    provider = TemplateProvider(
+        templates_dir=tmp_path, static_dir=tmp_path, settings=current_settings()
+    )
+    templates = provider.get_templates()
+
+    provider.add_template_directories([extra, tmp_path])
+
+    assert provider.get_templates() is templates
+    assert list(templates.env.loader.searchpath) == [str(tmp_path), str(extra)]
+
+
+# The End
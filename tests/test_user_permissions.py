@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Tests covering permission loading in ``AdminAuthService``."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from tortoise import Tortoise
+
+from freeadmin.core.interface.auth import admin_auth_service
+from freeadmin.core.interface.services.permissions import permissions_service
+from tests.system_models import system_models
+
+
+async def _seed_permissions() -> SimpleNamespace:
+    """Create a staff user with direct and group grants plus an outsider."""
+
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": [], "admin": [system_models.models_module()]},
+    )
+    await Tortoise.generate_schemas()
+    models = system_models.models
+    user = await models.user.create(username="staff", is_staff=True)
+    other = await models.user.create(username="other", is_staff=True)
+    content_type = await models.content_type.create(
+        app_label="blog", model="post", dotted="Blog.Post"
+    )
+    await models.user_permission.create(
+        user=user, content_type=content_type, action="view"
+    )
+    group = await models.group.create(name="editors")
+    await group.users.add(user)
+    await models.group_permission.create(
+        group=group, content_type=content_type, action="change"
+    )
+    await models.group_permission.create(group=group, action="export")
+    outsiders = await models.group.create(name="outsiders")
+    await outsiders.users.add(other)
+    await models.group_permission.create(
+        group=outsiders, content_type=content_type, action="delete"
+    )
+    admin_auth_service.invalidate_user(user.id)
+    return SimpleNamespace(models=models, user=user, content_type=content_type)
+
+
+async def _release_orm() -> None:
+    """Close the in-memory database and unregister the apps seeded above."""
+
+    await Tortoise.close_connections()
+    await Tortoise._reset_apps()
+
+
+def _track_fetch_values(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, ...]]:
+    """Record the fields of every ``fetch_values`` call on the auth adapter."""
+
+    adapter = admin_auth_service.adapter
+    calls: list[tuple[str, ...]] = []
+    original = adapter.fetch_values
+
+    async def tracking_fetch_values(qs, *fields, flat=False):
+        calls.append(fields)
+        return await original(qs, *fields, flat=flat)
+
+    monkeypatch.setattr(adapter, "fetch_values", tracking_fetch_values)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_current_admin_user_caches_user_and_group_permissions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Grants load in two queries and stay cached until the user is invalidated."""
+
+    try:
+        seeded = await _seed_permissions()
+        user = seeded.user
+        calls = _track_fetch_values(monkeypatch)
+        request = SimpleNamespace(state=SimpleNamespace(user=user))
+
+        dto = await admin_auth_service.get_current_admin_user(request)
+
+        assert dto.permissions == {"blog.post.view", "blog.post.change", "export"}
+        assert calls == [("content_type__dotted", "action")] * 2
+
+        calls.clear()
+        await seeded.models.user_permission.create(
+            user=user, content_type=seeded.content_type, action="add"
+        )
+        cached = await admin_auth_service.get_current_admin_user(request)
+        assert cached.permissions == dto.permissions
+        assert calls == []
+
+        await permissions_service.invalidate_user_permissions(user.id)
+        refreshed = await admin_auth_service.get_current_admin_user(request)
+        assert "blog.post.add" in refreshed.permissions
+        assert len(calls) == 2
+    finally:
+        await _release_orm()
+
+
+@pytest.mark.asyncio
+async def test_require_permissions_checks_all_codenames_at_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Several codenames are verified with one user and one group lookup."""
+
+    try:
+        seeded = await _seed_permissions()
+        site = SimpleNamespace(
+            get_ct_id_by_dotted={"blog.post": seeded.content_type.id}.get
+        )
+        request = SimpleNamespace(state=SimpleNamespace(user=seeded.user))
+        dto = SimpleNamespace(id=str(seeded.user.id))
+        calls = _track_fetch_values(monkeypatch)
+
+        allowed = admin_auth_service.require_permissions(
+            ["blog.post.view", "blog.post.change"], admin_site=site
+        )
+        assert await allowed(request, user=dto) is dto
+        assert calls == [("content_type_id", "action")] * 2
+
+        denied = admin_auth_service.require_permissions(
+            ["blog.post.view", "blog.post.delete"], admin_site=site
+        )
+        with pytest.raises(HTTPException) as excinfo:
+            await denied(request, user=dto)
+        assert excinfo.value.status_code == 403
+
+        unknown = admin_auth_service.require_permissions(
+            ["blog.comment.view"], admin_site=site
+        )
+        with pytest.raises(HTTPException) as excinfo:
+            await unknown(request, user=dto)
+        assert excinfo.value.status_code == 404
+    finally:
+        await _release_orm()
+
+
+def test_require_permissions_without_codenames_reuses_user_dependency() -> None:
+    """An empty requirement resolves to the authentication dependency itself."""
+
+    dependency = admin_auth_service.require_permissions(())
+
+    assert dependency == admin_auth_service.get_current_admin_user
+
+
+@pytest.mark.asyncio
+async def test_require_permissions_resolves_content_types_once_per_map() -> None:
+    """Required pairs are reused until the site rebuilds its content type map."""
+
+    lookups: list[str] = []
+    ct_map = {"blog.post": 7}
+
+    def get_ct_id_by_dotted(dotted: str) -> int | None:
+        lookups.append(dotted)
+        return ct_map.get(dotted)
+
+    site = SimpleNamespace(ct_map_version=1, get_ct_id_by_dotted=get_ct_id_by_dotted)
+    orm_user = SimpleNamespace(is_active=True, is_staff=True, is_superuser=True)
+    request = SimpleNamespace(state=SimpleNamespace(user=orm_user))
+    dto = SimpleNamespace(id="1")
+    dependency = admin_auth_service.require_permissions(
+        ["blog.post.view", "blog.post.change"], admin_site=site
+    )
+
+    assert await dependency(request, user=dto) is dto
+    assert await dependency(request, user=dto) is dto
+    assert lookups == ["blog.post", "blog.post"]
+
+    site.ct_map_version = 2
+    ct_map.clear()
+    with pytest.raises(HTTPException) as excinfo:
+        await dependency(request, user=dto)
+    assert excinfo.value.status_code == 404
+
+
+# The End